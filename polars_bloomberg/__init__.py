@@ -1,7 +1,7 @@
 """polars_bloomberg package."""
 
-from .plbbg import BqlResult, BQuery
+from .plbbg import AsyncBQuery, BqlResult, BQuery, BQueryPool
 
-__all__ = ["BQuery", "BqlResult"]
+__all__ = ["AsyncBQuery", "BQuery", "BQueryPool", "BqlResult"]
 
 __version__ = "0.5.4"
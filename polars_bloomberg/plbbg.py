@@ -30,13 +30,23 @@ with BQuery() as bq:
 :date: 2024-12
 """
 
+import asyncio
+import hashlib
+import itertools
 import json
 import logging
 import os
-from collections.abc import Sequence
+import queue
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import closing, contextmanager
 from dataclasses import dataclass
-from datetime import UTC, date, datetime
-from typing import Any
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any, ClassVar, NoReturn
 
 import blpapi
 import polars as pl
@@ -46,12 +56,79 @@ import polars as pl
 logger = logging.getLogger(__name__)
 
 
+def _json_decoder() -> Callable[[str | bytes], Any]:
+    """Return orjson.loads when orjson is installed, else the stdlib json.loads.
+
+    Both raise a json.JSONDecodeError subclass on invalid input.
+    """
+    try:
+        import orjson  # noqa: PLC0415
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+_json_loads = _json_decoder()
+
+
+def _enable_string_cache() -> None:
+    """Let Categorical columns of different frames share their categories.
+
+    Since polars 1.32 all categoricals use one global pool (pl.Categories); older
+    versions need the global string cache for cheap joins and concatenation.
+    """
+    if not hasattr(pl, "Categories"):
+        pl.enable_string_cache()
+
+
+# Bloomberg's maximum number of fields per request, by request type
+_MAX_FIELDS_PER_REQUEST = {"ReferenceDataRequest": 400, "HistoricalDataRequest": 25}
+
+# Words in a RequestFailure reason that mark a request failed by a lost connection
+_CONNECTION_FAILURE_WORDS = ("connection", "disconnect")
+
+# Number of bars one IntradayBarRequest may span before bdib() splits the range
+_BDIB_BARS_PER_REQUEST = 10_000
+
+# Fields of a single bar in IntradayBarResponse, in output column order
+_BAR_FIELDS = ("time", "open", "high", "low", "close", "volume", "numEvents", "value")
+# Time span of one IntradayTickRequest before bdit() splits the range
+_BDIT_WINDOW = timedelta(hours=1)
+# Fields of a single tick in IntradayTickResponse, in output column order
+_TICK_FIELDS = ("time", "type", "value", "size", "conditionCodes")
+# IntradayTickRequest flags and the extra tick fields they return
+_TICK_OPTION_FIELDS = {
+    "includeExchangeCodes": ("exchangeCode",),
+    "includeBrokerCodes": ("brokerBuyCode", "brokerSellCode"),
+    "includeRpsCodes": ("rpsCode",),
+}
+_SERVICES = ("//blp/refdata", "//blp/bqlsvc", "//blp/exrsvc")
+# GridResponse DataField value keys in priority order, with the column dtype they imply
+_BSRCH_VALUE_KEYS: dict[str, pl.DataType | None] = {
+    "Ticker": pl.Utf8,
+    "StringValue": pl.Utf8,
+    "StringData": pl.Utf8,
+    "value": None,
+    "Value": None,
+    "DoubleData": pl.Float64,
+    "DoubleValue": pl.Float64,
+    "FloatValue": pl.Float64,
+    "Int32Data": pl.Int64,
+    "Int32Value": pl.Int64,
+    "IntValue": pl.Int64,
+    "LongValue": pl.Int64,
+    "DateValue": None,
+    "TimeValue": None,
+    "DateTimeValue": None,
+}
+
+
 @dataclass
 class SITable:
     """Holds data and schema for a Single Item response Table."""
 
     name: str  # data item name
-    data: dict[str, list[Any]]  # column_name -> list of values
+    data: dict[str, list[Any] | pl.Series]  # column_name -> values (Series once typed)
     schema: dict[str, pl.DataType]  # column_name -> Polars datatype
 
 
@@ -120,18 +197,36 @@ class BqlResult:
     dataframes: list[pl.DataFrame]
     names: list[str]
 
-    def combine(self) -> pl.DataFrame:
+    def combine(
+        self, how: str = "full", lazy: bool = False
+    ) -> pl.DataFrame | pl.LazyFrame:
         """Combine all dataframes into one by joining on common columns.
 
         This method merges all the DataFrames in the `dataframes` attribute into a single
-        DataFrame by performing a full join on the common columns. If no common columns
-        are found, it raises a ValueError.
+        DataFrame by joining on the common columns. If no common columns are found, it
+        raises a ValueError.
+
+        When every DataFrame has the same key columns, unique keys and otherwise
+        distinct columns (the usual shape of a BQL `get()` with several items), the
+        frames are combined in a single pass: the key union is built once and each
+        frame's columns are aligned to it and concatenated horizontally. Frames that
+        already share the same key order need no join at all. Other shapes fall back
+        to sequential joins. Columns keep the order of the sequential joins: the
+        first DataFrame's columns, then the new columns of each following one.
+
+        Args:
+            how (str, optional): 'full' keeps the keys of all DataFrames, 'inner'
+                only keys present in every DataFrame and 'left' the keys of the
+                first DataFrame. Defaults to 'full'.
+            lazy (bool, optional): Return the pl.LazyFrame of the combination
+                instead of collecting it. Defaults to False.
 
         Returns:
-            pl.DataFrame: Combined dataframe joined on common columns.
+            pl.DataFrame | pl.LazyFrame: Combined dataframe joined on common columns.
 
         Raises:
-            ValueError: If no common columns exist or no dataframes are present.
+            ValueError: If no common columns exist, no dataframes are present or
+                `how` is not one of 'full', 'inner' or 'left'.
 
         Example:
             Combine results of a BQL query:
@@ -177,13 +272,85 @@ class BqlResult:
         """  # noqa: E501
         if not self.dataframes:
             raise ValueError("No DataFrames to combine.")
+        if how not in ("full", "inner", "left"):
+            raise ValueError(f"Unsupported join type: {how!r}.")
+
+        keys = self._shared_keys()
+        if keys is None:
+            result = self._join_sequentially(how)
+        else:
+            result = self._align_on_keys(keys, how)
+        return result if lazy else result.collect()
+
+    def _shared_keys(self) -> list[str] | None:
+        """Return the key columns if the frames can be combined in a single pass.
+
+        That is the case when all frames share the same key columns, the keys are
+        unique and non-null in every frame, and no other column appears twice.
+        """
+        keys = [
+            col
+            for col in self.dataframes[0].columns
+            if all(col in df.columns for df in self.dataframes[1:])
+        ]
+        if not keys or len(self.dataframes) == 1:
+            return None
+        values = [col for df in self.dataframes for col in df.columns if col not in keys]
+        if len(values) != len(set(values)):
+            return None
+        for df in self.dataframes:
+            key_frame = df.select(keys)
+            if key_frame.null_count().sum_horizontal().item() or (
+                key_frame.is_duplicated().any()
+            ):
+                return None
+        return keys
+
+    def _align_on_keys(self, keys: list[str], how: str) -> pl.LazyFrame:
+        """Align every frame to one key frame and concatenate them horizontally."""
+        first, *others = self.dataframes
+        columns = first.columns + [
+            c for df in others for c in df.columns if c not in keys
+        ]
+        key_frame = first.select(keys)
+        if all(df.select(keys).equals(key_frame) for df in others):
+            # Same keys in the same order: no join needed
+            aligned = [first, *(df.drop(keys) for df in others)]
+            return pl.concat(aligned, how="horizontal").lazy().select(columns)
+
+        if how == "full":
+            key_frame = pl.concat(
+                [df.select(keys) for df in self.dataframes], how="vertical_relaxed"
+            ).unique(maintain_order=True)
+        elif how == "inner":
+            for df in others:
+                key_frame = key_frame.join(df.select(keys), on=keys, how="semi")
+        keys_lazy = key_frame.lazy()
+        aligned = [
+            keys_lazy.join(df.lazy(), on=keys, how="left", maintain_order="left").drop(
+                keys
+            )
+            for df in self.dataframes
+        ]
+        return pl.concat([keys_lazy, *aligned], how="horizontal").select(columns)
 
-        result = self.dataframes[0]  # Initialize with the first DataFrame
+    def _join_sequentially(self, how: str) -> pl.LazyFrame:
+        """Join the frames one after another on the columns they have in common."""
+        result = self.dataframes[0].lazy()  # Initialize with the first DataFrame
+        columns = list(self.dataframes[0].columns)
         for df in self.dataframes[1:]:
-            common_cols = set(result.columns) & set(df.columns)
+            common_cols = [col for col in columns if col in df.columns]
             if not common_cols:
                 raise ValueError("No common columns found to join on.")
-            result = result.join(df, on=list(common_cols), how="full", coalesce=True)
+            result = result.join(
+                df.lazy(),
+                on=common_cols,
+                how=how,
+                coalesce=True,
+                # right_left keeps the row order of the former eager full join
+                maintain_order="right_left" if how == "full" else "left_right",
+            )
+            columns += [col for col in df.columns if col not in common_cols]
         return result
 
     def __getitem__(self, idx: int) -> pl.DataFrame:
@@ -199,6 +366,285 @@ class BqlResult:
         return iter(self.dataframes)
 
 
+@dataclass
+class _Query:
+    """Requests of one bdp/bdh/bdib call and how to turn their responses into a frame.
+
+    `parse(idx, responses)` fills the column buffers of request `idx`; `build`
+    assembles the final frame from the buffers of all requests.
+    """
+
+    requests: list[Any]
+    parse: Callable[[int, Iterable[dict]], dict[str, list[Any]]]
+    build: Callable[[list[dict[str, list[Any]]]], pl.DataFrame]
+
+
+class _BdhCache:
+    """On-disk store of bdh() history, one Parquet file per series.
+
+    A series is identified by (security, field, overrides, options). Next to each
+    Parquet file a JSON sidecar records the date ranges already fetched from
+    Bloomberg, so dates without data (weekends, holidays) are not requested again.
+
+    Writes go through unique temporary files and are serialized per series, so
+    threads of one process (and several BQuery instances in it) may share a cache
+    directory. Writers in separate processes are not coordinated and should use
+    separate directories.
+    """
+
+    # Per-series write locks, shared by all instances: {parquet path: lock}
+    _locks: ClassVar[dict[Path, threading.Lock]] = {}
+    _locks_guard: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        self.root = Path(root).expanduser().resolve() / "bdh"
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _lock(self, key: str) -> threading.Lock:
+        """Return the write lock of a series."""
+        with self._locks_guard:
+            return self._locks.setdefault(self.root / key, threading.Lock())
+
+    def _replace(self, path: Path, write: Callable[[Any], Any]) -> None:
+        """Atomically replace `path` with what `write` writes to a binary file."""
+        with tempfile.NamedTemporaryFile(
+            dir=self.root, suffix=".tmp", delete=False
+        ) as f:
+            try:
+                write(f)
+                f.close()  # flush before the rename
+                os.replace(f.name, path)
+            except BaseException:
+                f.close()
+                Path(f.name).unlink(missing_ok=True)
+                raise
+
+    @staticmethod
+    def key(
+        security: str,
+        field: str,
+        overrides: Sequence | None,
+        options: dict | None,
+    ) -> str:
+        """Return a file-name safe key identifying one cached series."""
+        spec = {
+            "security": security,
+            "field": field,
+            "overrides": [list(o) for o in overrides or []],
+            "options": options or {},
+        }
+        raw = json.dumps(spec, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def coverage(self, key: str) -> list[tuple[date, date]]:
+        """Return the sorted, merged date ranges already fetched for a series."""
+        path = self.root / f"{key}.json"
+        if not path.exists():
+            return []
+        with path.open(encoding="utf-8") as f:
+            meta = json.load(f)
+        return [(date.fromisoformat(s), date.fromisoformat(e)) for s, e in meta]
+
+    def missing(self, key: str, start: date, end: date) -> list[tuple[date, date]]:
+        """Return the sub-ranges of [start, end] not yet fetched for a series."""
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in self.coverage(key):
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start - timedelta(days=1)))
+            cursor = covered_end + timedelta(days=1)
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def load(self, key: str, start: date, end: date) -> pl.DataFrame:
+        """Return cached (date, value) rows of a series between start and end."""
+        path = self.root / f"{key}.parquet"
+        if not path.exists():
+            return pl.DataFrame(schema={"date": pl.Date, "value": pl.Null})
+        return (
+            pl.scan_parquet(path).filter(pl.col("date").is_between(start, end)).collect()
+        )
+
+    def store(
+        self, key: str, frame: pl.DataFrame, covered: tuple[date, date] | None
+    ) -> None:
+        """Merge fetched (date, value) rows into a series and extend its coverage.
+
+        Rows outside `covered` are kept but their dates are requested again on the
+        next call, which refreshes values that were not final yet.
+        """
+        with self._lock(key):
+            self._store(key, frame, covered)
+
+    def _store(
+        self, key: str, frame: pl.DataFrame, covered: tuple[date, date] | None
+    ) -> None:
+        """Read-modify-write of store(); the caller holds the series lock."""
+        path = self.root / f"{key}.parquet"
+        if not frame.is_empty():
+            if path.exists():
+                frame = pl.concat(
+                    [pl.read_parquet(path), frame], how="vertical_relaxed"
+                ).unique(subset="date", keep="last")
+            self._replace(path, frame.sort("date").write_parquet)
+        if covered is None:
+            return
+
+        # Record coverage only after the data is on disk
+        ranges = sorted([*self.coverage(key), covered])
+        merged: list[tuple[date, date]] = [ranges[0]]
+        for range_start, range_end in ranges[1:]:
+            last_start, last_end = merged[-1]
+            if range_start <= last_end + timedelta(days=1):
+                merged[-1] = (last_start, max(last_end, range_end))
+            else:
+                merged.append((range_start, range_end))
+        meta = json.dumps([[s.isoformat(), e.isoformat()] for s, e in merged])
+        self._replace(self.root / f"{key}.json", lambda f: f.write(meta.encode()))
+
+
+class _BdpCache:
+    """In-memory LRU store of bdp() values with a time-to-live per field.
+
+    Entries are keyed by (security, field, overrides, options). Fields without a
+    TTL (or with a TTL <= 0) are never cached and always requested from Bloomberg.
+    """
+
+    def __init__(self, ttl: float | Mapping[str, float], maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+    def field_ttl(self, field: str) -> float | None:
+        """Return the TTL in seconds for a field, or None if it is not cached."""
+        ttl = self.ttl.get(field) if isinstance(self.ttl, Mapping) else self.ttl
+        return ttl if ttl is not None and ttl > 0 else None
+
+    @staticmethod
+    def key(
+        security: str,
+        field: str,
+        overrides: Sequence | None,
+        options: dict | None,
+    ) -> tuple[str, str, str, str]:
+        """Return a hashable key identifying one cached value."""
+        return (
+            security,
+            field,
+            json.dumps([list(o) for o in overrides or []], default=str),
+            json.dumps(options or {}, sort_keys=True, default=str),
+        )
+
+    def get(self, key: tuple) -> tuple[Any] | None:
+        """Return a one-element tuple with the cached value, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return (value,)
+
+    def lookup(
+        self,
+        security: str,
+        field: str,
+        overrides: Sequence | None,
+        options: dict | None,
+    ) -> tuple[Any] | None:
+        """Return the cached value of a cacheable field, or None on a miss."""
+        if self.field_ttl(field) is None:
+            return None
+        return self.get(self.key(security, field, overrides, options))
+
+    def put(self, key: tuple, value: Any, ttl: float) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._entries.clear()
+
+
+class _RequestWindow:
+    """Requests of one `_stream_requests` call that are in flight or await a retry."""
+
+    def __init__(self, bq: "BQuery", requests: Sequence[blpapi.Request]) -> None:
+        self.bq = bq
+        self.requests = requests
+        self.pending = deque(range(len(requests)))  # not sent yet
+        self.in_flight: dict[int, int] = {}  # correlation id value -> request index
+        self.waiting: list[int] = []  # failed requests to re-send once connected
+        self.retries: dict[int, int] = {}
+        self.debug_responses: dict[int, list[dict]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.in_flight or self.waiting or self.pending)
+
+    def send(self, idx: int) -> None:
+        cid = blpapi.CorrelationId(next(self.bq._correlation_ids))
+        self.in_flight[cid.value()] = idx
+        self.bq.session.sendRequest(self.requests[idx], correlationId=cid)
+
+    def send_next(self) -> None:
+        if self.pending:
+            self.send(self.pending.popleft())
+
+    def finish(self, finished: dict[int, int]) -> None:
+        """Free the in-flight slots of requests whose final response was consumed."""
+        for cid_value, idx in finished.items():
+            del self.in_flight[cid_value]
+            if self.bq.debug:
+                self.bq._save_debug_responses(self.debug_responses.pop(idx))
+            self.send_next()
+
+    def retry(self, cid_value: int, msg: blpapi.Message) -> int:
+        """Re-send a request failed by a lost connection now or once connected.
+
+        Raises:
+            Exception: If the request failed for another reason, or was already
+                re-sent `max_reconnects` times.
+
+        """
+        idx = self.in_flight.pop(cid_value)
+        self.debug_responses.pop(idx, None)
+        self.retries[idx] = self.retries.get(idx, 0) + 1
+        failure = msg.toPy()
+        if (
+            not self._lost_connection(failure)
+            or self.retries[idx] > self.bq.max_reconnects
+        ):
+            raise Exception(f"Request failed: {failure}")
+        logger.warning(
+            "Bloomberg request failed; re-sending (attempt %d).", self.retries[idx]
+        )
+        self.waiting.append(idx)
+        self.resend_waiting()
+        return idx
+
+    def resend_waiting(self) -> None:
+        while self.waiting and self.bq._connected:
+            self.send(self.waiting.pop(0))
+
+    def _lost_connection(self, failure: dict) -> bool:
+        """Whether a RequestFailure was caused by a dropped connection."""
+        if not self.bq._connected:
+            return True
+        reason = failure.get("reason") or {}
+        text = " ".join(str(value) for value in reason.values()).lower()
+        return any(word in text for word in _CONNECTION_FAILURE_WORDS)
+
+
 class BQuery:
     """Provides methods to query Bloomberg API and return data as Polars DataFrames.
 
@@ -229,12 +675,23 @@ class BQuery:
 
     session: blpapi.Session
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         host: str = "localhost",
         port: int = 8194,
         timeout: int = 32_000,
         debug: bool = False,
+        securities_per_request: int = 500,
+        fields_per_request: int | None = None,
+        max_in_flight: int = 8,
+        cache_dir: str | os.PathLike | None = None,
+        bdp_ttl: float | Mapping[str, float] | None = None,
+        bdp_cache_size: int = 100_000,
+        max_reconnects: int = 3,
+        reconnect_delay: float = 1.0,
+        bql_categorical: bool = False,
+        bql_downcast: bool = False,
+        categorical_keys: bool = False,
     ) -> None:
         """Initialize a BQuery instance with connection parameters.
 
@@ -251,6 +708,50 @@ class BQuery:
             debug (bool, optional):
                 Enable debug logging/saving of intermediate results.
                 Defaults to False.
+            securities_per_request (int, optional):
+                Maximum number of securities sent in one bdp()/bdh() request;
+                larger universes are split into several requests.
+                Defaults to 500.
+            fields_per_request (int | None, optional):
+                Maximum number of fields sent in one bdp()/bdh() request.
+                Defaults to None, i.e. Bloomberg's limit for the request type
+                (400 for bdp, 25 for bdh).
+            max_in_flight (int, optional):
+                Maximum number of requests outstanding at the same time when a
+                call is split into several requests. Defaults to 8.
+            cache_dir (str | os.PathLike | None, optional):
+                Directory for a persistent bdh() cache. When set, history is stored
+                per (security, field, overrides, options) as Parquet and later calls
+                only request the date ranges not cached yet. Only daily history is
+                cached; other `periodicitySelection` options bypass the cache. The
+                directory should not be shared by several processes. Defaults to
+                None (no caching).
+            bdp_ttl (float | Mapping[str, float] | None, optional):
+                Keep bdp() values in memory for this many seconds. A mapping sets
+                the TTL per field; fields not in the mapping are always requested.
+                Defaults to None (no caching).
+            bdp_cache_size (int, optional):
+                Maximum number of (security, field) values kept by the bdp()
+                cache; the least recently used are evicted first.
+                Defaults to 100000.
+            max_reconnects (int, optional):
+                How often a lost connection is re-established before giving up;
+                requests failed by the outage are re-sent once it is back.
+                0 disables reconnecting. Defaults to 3.
+            reconnect_delay (float, optional):
+                Seconds to wait before restarting a terminated session, doubled
+                after every failed attempt. Defaults to 1.0.
+            bql_categorical (bool, optional):
+                Return string secondary columns of BQL results (e.g. CURRENCY,
+                PERIOD) as pl.Categorical instead of repeating each string per
+                row. Defaults to False.
+            bql_downcast (bool, optional):
+                Return BQL numbers as Float32, and as Int32 where the values fit,
+                halving their memory. Defaults to False.
+            categorical_keys (bool, optional):
+                Return the `security` column of bdp(), bdh(), bdib(), bdit() and
+                subscribe() and the `ID` column of BQL results as pl.Categorical,
+                so each identifier is stored once. Defaults to False.
 
         Raises:
             ConnectionError: If unable to establish connection to Bloomberg API.
@@ -260,31 +761,135 @@ class BQuery:
         self.port = port
         self.timeout = timeout
         self.debug = debug
+        self.securities_per_request = securities_per_request
+        self.fields_per_request = fields_per_request
+        self.max_in_flight = max_in_flight
+        self.max_reconnects = max_reconnects
+        self.reconnect_delay = reconnect_delay
+        self.bql_categorical = bql_categorical
+        self.bql_downcast = bql_downcast
+        self.categorical_keys = categorical_keys
+        if categorical_keys:
+            _enable_string_cache()
+        self._correlation_ids = itertools.count(1)
+        self._services: dict[str, blpapi.Service] = {}
+        self._connected = False
+        self._bdh_cache = _BdhCache(cache_dir) if cache_dir is not None else None
+        self._bdp_cache = (
+            _BdpCache(bdp_ttl, bdp_cache_size) if bdp_ttl is not None else None
+        )
 
     def __enter__(self):  # noqa: D105
         # Enter the runtime context related to this object.
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # noqa: D105
+        # Exit the context manager and stop the Bloomberg session.
+        self.stop()
+
+    def start(self) -> None:
+        """Start the Bloomberg session.
+
+        Use start() and stop() instead of the context manager when a long-running
+        process keeps one BQuery. Services are opened on first use, see
+        `open_services()`. With `max_reconnects` > 0 the session restarts itself
+        after a dropped connection.
+
+        Raises:
+            ConnectionError: If the session cannot be started.
+
+        """
         options = blpapi.SessionOptions()
         options.setServerHost(self.host)
         options.setServerPort(self.port)
+        if self.max_reconnects > 0:
+            options.setAutoRestartOnDisconnection(True)
+            options.setNumStartAttempts(self.max_reconnects + 1)
         self.session = blpapi.Session(options)
 
         if not self.session.start():
             raise ConnectionError("Failed to start Bloomberg session.")
 
-        # Open both required services
-        if not self.session.openService("//blp/refdata"):
-            raise ConnectionError("Failed to open service //blp/refdata.")
-        if not self.session.openService("//blp/bqlsvc"):
-            raise ConnectionError("Failed to open service //blp/bqlsvc.")
-        if not self.session.openService("//blp/exrsvc"):
-            raise ConnectionError("Failed to open service //blp/exrsvc.")
+        self._services = {}
+        self._connected = True
 
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):  # noqa: D105
-        # Exit the context manager and stop the Bloomberg session.
+    def stop(self) -> None:
+        """Stop the Bloomberg session."""
         if self.session:
             self.session.stop()
+        self._connected = False
+
+    def open_services(self, *names: str) -> None:
+        """Open several services in parallel before they are first used.
+
+        Services are otherwise opened lazily, one blocking round-trip each, by the
+        first request that needs them. Opening them up front with
+        `openServiceAsync` overlaps those round-trips.
+
+        Args:
+            *names (str): Services to open. Defaults to //blp/refdata,
+                //blp/bqlsvc and //blp/exrsvc.
+
+        Raises:
+            ConnectionError: If a service cannot be opened.
+            TimeoutError: If no service status arrives within `timeout` ms.
+
+        """
+        pending: dict[int, str] = {}
+        for name in dict.fromkeys(names or _SERVICES):
+            if name not in self._services:
+                cid = blpapi.CorrelationId(next(self._correlation_ids))
+                pending[cid.value()] = name
+                self.session.openServiceAsync(name, cid)
+        while pending:
+            event = self.session.nextEvent(self.timeout)
+            if event.eventType() == blpapi.Event.TIMEOUT:
+                raise TimeoutError(
+                    f"Opening services timed out after {self.timeout} milliseconds"
+                )
+            if event.eventType() == blpapi.Event.SERVICE_STATUS:
+                for msg in event:
+                    self._on_service_status(msg, pending)
+
+    def _on_service_status(self, msg: blpapi.Message, pending: dict[int, str]) -> None:
+        """Cache a service opened by open_services() or raise if it failed."""
+        for cid in msg.correlationIds():
+            name = pending.pop(cid.value(), None)
+            if name is None:
+                continue
+            if str(msg.messageType()) != "ServiceOpened":
+                raise ConnectionError(f"Failed to open service {name}.")
+            self._services[name] = self.session.getService(name)
+
+    def _service(self, name: str) -> blpapi.Service:
+        """Return a service, opening it on first use and caching it afterwards."""
+        service = self._services.get(name)
+        if service is None:
+            if not self.session.openService(name):
+                raise ConnectionError(f"Failed to open service {name}.")
+            service = self._services[name] = self.session.getService(name)
+        return service
+
+    def _session_alive(self) -> bool:
+        """Drain queued session status events and report if the connection is up.
+
+        Only called on an idle session, so any queued response belongs to an
+        abandoned request and can be dropped.
+        """
+        alive = True
+        while (event := self.session.tryNextEvent()) is not None:
+            if event.eventType() != blpapi.Event.SESSION_STATUS:
+                continue
+            for msg in event:
+                msg_type = str(msg.messageType())
+                if msg_type in ("SessionTerminated", "SessionStartupFailure"):
+                    return False
+                if msg_type == "SessionConnectionDown":
+                    alive = False
+                elif msg_type == "SessionConnectionUp":
+                    alive = True
+        return alive
 
     def bdp(
         self,
@@ -292,7 +897,8 @@ class BQuery:
         fields: list[str],
         overrides: list[tuple] | None = None,
         options: dict | None = None,
-    ) -> pl.DataFrame:
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
         """Bloomberg Data Point, equivalent to Excel BDP() function.
 
         Fetch reference data for given securities and fields.
@@ -302,9 +908,13 @@ class BQuery:
             fields (list[str]): List of data fields to retrieve (e.g., 'PX_LAST').
             overrides (list[tuple], optional): List of tuples for field overrides. Defaults to None.
             options (dict, optional): Additional request options. Defaults to None.
+            lazy (bool, optional): Return a pl.LazyFrame so that downstream
+                filters, selects and joins run as one optimized plan. The data is
+                fetched when the method is called. Defaults to False.
 
         Returns:
-            pl.DataFrame: A Polars DataFrame containing the requested reference data.
+            pl.DataFrame | pl.LazyFrame: A Polars DataFrame containing the requested
+                reference data, or a LazyFrame if `lazy` is True.
 
         Raises:
             ConnectionError: If there is an issue with the Bloomberg session.
@@ -335,14 +945,118 @@ class BQuery:
             ```
 
         """  # noqa: E501
-        request = self._create_request(
-            "ReferenceDataRequest", securities, fields, overrides, options
+        if self._bdp_cache is not None and securities and fields:
+            df = self._cached_bdp(
+                self._bdp_cache, securities, fields, overrides, options
+            )
+        else:
+            df = self._fetch_bdp(securities, fields, overrides, options)
+        return self._output(df, lazy)
+
+    def _fetch_bdp(
+        self,
+        securities: list[str],
+        fields: list[str],
+        overrides: list[tuple] | None = None,
+        options: dict | None = None,
+        errors: set[tuple[str, str]] | None = None,
+    ) -> pl.DataFrame:
+        """Request reference data from Bloomberg, bypassing the cache.
+
+        When `errors` is given, the (security, field) pairs Bloomberg reported a
+        securityError or fieldException for are added to it.
+        """
+        return self._run_query(
+            self._bdp_query(securities, fields, overrides, options, errors)
+        )
+
+    def _bdp_query(
+        self,
+        securities: list[str],
+        fields: list[str],
+        overrides: list[tuple] | None = None,
+        options: dict | None = None,
+        errors: set[tuple[str, str]] | None = None,
+    ) -> _Query:
+        """Build the chunked ReferenceDataRequests of a bdp() call."""
+        # Request each security once; duplicates are restored in build()
+        plan = self._plan_chunks(
+            "ReferenceDataRequest", list(dict.fromkeys(securities)), fields
+        )
+        requests = [
+            self._create_request(
+                "ReferenceDataRequest",
+                chunk_securities,
+                chunk_fields,
+                overrides,
+                options,
+            )
+            for chunk_securities, chunk_fields in plan
+        ]
+
+        def build(columns: list[dict[str, list[Any]]]) -> pl.DataFrame:
+            schema = {"security": pl.Utf8}
+            frames = [self._frame_from_columns(c, schema) for c in columns]
+            df = self._merge_chunks(plan, frames, keys=["security"])
+            return self._expand_duplicates(df, securities)
+
+        return _Query(
+            requests,
+            lambda idx, responses: self._parse_bdp_responses(
+                responses, plan[idx][1], errors
+            ),
+            build,
         )
-        responses = self._send_request(request)
-        data = self._parse_bdp_responses(responses, fields)
-        return pl.DataFrame(data)
 
-    def bdh(
+    def _cached_bdp(
+        self,
+        cache: _BdpCache,
+        securities: list[str],
+        fields: list[str],
+        overrides: list[tuple] | None = None,
+        options: dict | None = None,
+    ) -> pl.DataFrame:
+        """Serve bdp() from the in-memory cache, requesting only missing values.
+
+        Securities missing the same set of fields are fetched in one bdp call, so
+        live fields are requested for every security while cached static fields
+        are skipped. Values Bloomberg reported an error for are not cached.
+        """
+        fields = list(dict.fromkeys(fields))
+        values: dict[tuple[str, str], Any] = {}
+
+        # Group securities by the fields they miss: {fields: securities}
+        to_fetch: dict[tuple[str, ...], list[str]] = {}
+        for sec in dict.fromkeys(securities):
+            missed = []
+            for fld in fields:
+                hit = cache.lookup(sec, fld, overrides, options)
+                if hit is None:
+                    missed.append(fld)
+                else:
+                    values[(sec, fld)] = hit[0]
+            if missed:
+                to_fetch.setdefault(tuple(missed), []).append(sec)
+
+        for flds, secs in to_fetch.items():
+            errors: set[tuple[str, str]] = set()
+            df = self._fetch_bdp(secs, list(flds), overrides, options, errors=errors)
+            for fld in flds:
+                ttl = cache.field_ttl(fld)
+                for sec, value in zip(df["security"], df[fld], strict=True):
+                    values[(sec, fld)] = value
+                    if ttl is not None and (sec, fld) not in errors:
+                        cache.put(cache.key(sec, fld, overrides, options), value, ttl)
+
+        # Keep securities Bloomberg returned (or that were cached), in input order
+        # and as often as they were requested, like the uncached bdp()
+        rows = [sec for sec in securities if (sec, fields[0]) in values]
+        columns: dict[str, list[Any]] = {"security": rows}
+        for fld in fields:
+            columns[fld] = [values.get((sec, fld)) for sec in rows]
+        return self._frame_from_columns(columns, {"security": pl.Utf8})
+
+    def bdh(  # noqa: PLR0913
         self,
         securities: list[str],
         fields: list[str],
@@ -350,7 +1064,9 @@ class BQuery:
         end_date: date,
         overrides: list[tuple] | None = None,
         options: dict | None = None,
-    ) -> pl.DataFrame:
+        lazy: bool = False,
+        wide: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame | dict[str, pl.DataFrame | pl.LazyFrame]:
         """Bloomberg Data History, equivalent to Excel BDH() function.
 
         Fetch historical data for given securities and fields between dates.
@@ -362,9 +1078,17 @@ class BQuery:
             end_date (date): End date for the historical data.
             overrides (list[tuple], optional): List of tuples for field overrides. Defaults to None.
             options (dict, optional): Additional request options. Defaults to None.
+            lazy (bool, optional): Return a pl.LazyFrame so that downstream
+                filters, selects and joins run as one optimized plan. The data is
+                fetched when the method is called. Defaults to False.
+            wide (bool, optional): Return one frame per field with a `date` column
+                and one column per security instead of the long layout.
+                Defaults to False.
 
         Returns:
-            pl.DataFrame: A Polars DataFrame containing the requested historical data.
+            pl.DataFrame | pl.LazyFrame | dict: A Polars DataFrame containing the
+                requested historical data, or a LazyFrame if `lazy` is True. With
+                `wide`, a dict mapping each field to its date x security frame.
 
         Raises:
             ConnectionError: If there is an issue with the Bloomberg session.
@@ -403,39 +1127,225 @@ class BQuery:
             ```
 
         """  # noqa: E501
-        request = self._create_request(
-            "HistoricalDataRequest", securities, fields, overrides, options
+        # Coverage is tracked per calendar day, so only daily history is cached
+        daily = (options or {}).get("periodicitySelection", "DAILY") == "DAILY"
+        if self._bdh_cache is not None and securities and fields and daily:
+            df = self._cached_bdh(
+                self._bdh_cache,
+                securities,
+                fields,
+                start_date,
+                end_date,
+                overrides,
+                options,
+            )
+        else:
+            df = self._fetch_bdh(
+                securities, fields, start_date, end_date, overrides, options
+            )
+        if wide:
+            return self._wide_bdh(df, securities, fields, lazy)
+        return self._output(df, lazy)
+
+    def _fetch_bdh(  # noqa: PLR0913
+        self,
+        securities: list[str],
+        fields: list[str],
+        start_date: date,
+        end_date: date,
+        overrides: list[tuple] | None = None,
+        options: dict | None = None,
+        errors: set[tuple[str, str]] | None = None,
+    ) -> pl.DataFrame:
+        """Request historical data from Bloomberg, bypassing the cache.
+
+        When `errors` is given, the (security, field) pairs Bloomberg reported a
+        securityError or fieldException for are added to it.
+        """
+        return self._run_query(
+            self._bdh_query(
+                securities, fields, start_date, end_date, overrides, options, errors
+            )
+        )
+
+    def _bdh_query(  # noqa: PLR0913
+        self,
+        securities: list[str],
+        fields: list[str],
+        start_date: date,
+        end_date: date,
+        overrides: list[tuple] | None = None,
+        options: dict | None = None,
+        errors: set[tuple[str, str]] | None = None,
+    ) -> _Query:
+        """Build the chunked HistoricalDataRequests of a bdh() call."""
+        # Request each security once; duplicates are restored in build()
+        plan = self._plan_chunks(
+            "HistoricalDataRequest", list(dict.fromkeys(securities)), fields
+        )
+        requests = []
+        for chunk_securities, chunk_fields in plan:
+            request = self._create_request(
+                "HistoricalDataRequest",
+                chunk_securities,
+                chunk_fields,
+                overrides,
+                options,
+            )
+            request.set("startDate", start_date.strftime("%Y%m%d"))
+            request.set("endDate", end_date.strftime("%Y%m%d"))
+            requests.append(request)
+
+        def build(columns: list[dict[str, list[Any]]]) -> pl.DataFrame:
+            schema = {"security": pl.Utf8, "date": pl.Date}
+            frames = [self._frame_from_columns(c, schema) for c in columns]
+            df = self._merge_chunks(plan, frames, keys=["security", "date"])
+            return self._expand_duplicates(df, securities)
+
+        return _Query(
+            requests,
+            lambda idx, responses: self._parse_bdh_responses(
+                responses, plan[idx][1], errors
+            ),
+            build,
         )
-        request.set("startDate", start_date.strftime("%Y%m%d"))
-        request.set("endDate", end_date.strftime("%Y%m%d"))
-        responses = self._send_request(request)
-        data = self._parse_bdh_responses(responses, fields)
-        return pl.DataFrame(data, infer_schema_length=None)
+
+    def _cached_bdh(  # noqa: PLR0913
+        self,
+        cache: _BdhCache,
+        securities: list[str],
+        fields: list[str],
+        start_date: date,
+        end_date: date,
+        overrides: list[tuple] | None = None,
+        options: dict | None = None,
+    ) -> pl.DataFrame:
+        """Serve bdh() from the on-disk cache, fetching only missing date ranges.
+
+        Series sharing the same missing range are fetched in one bdh call. Today's
+        values may still change, so coverage is only recorded up to yesterday.
+        Series Bloomberg reported an error for (e.g. a usage limit or missing
+        entitlement) are not marked as covered and are requested again next time.
+        """
+        keys = {
+            (sec, fld): cache.key(sec, fld, overrides, options)
+            for sec in securities
+            for fld in fields
+        }
+
+        # Group series by missing range: {(start, end): (securities, fields)}
+        to_fetch: dict[tuple[date, date], tuple[dict, dict]] = {}
+        for (sec, fld), key in keys.items():
+            for gap in cache.missing(key, start_date, end_date):
+                secs, flds = to_fetch.setdefault(gap, ({}, {}))
+                secs[sec] = None
+                flds[fld] = None
+
+        last_final_date = date.today() - timedelta(days=1)
+        for (gap_start, gap_end), (secs, flds) in to_fetch.items():
+            errors: set[tuple[str, str]] = set()
+            df = self._fetch_bdh(
+                list(secs),
+                list(flds),
+                gap_start,
+                gap_end,
+                overrides,
+                options,
+                errors=errors,
+            )
+            covered_end = min(gap_end, last_final_date)
+            covered = (gap_start, covered_end) if covered_end >= gap_start else None
+            for sec in secs:
+                df_sec = df.filter(pl.col("security") == sec)
+                for fld in flds:
+                    series = df_sec.select("date", pl.col(fld).alias("value"))
+                    cache.store(
+                        keys[(sec, fld)],
+                        series.drop_nulls("value"),
+                        None if (sec, fld) in errors else covered,
+                    )
+
+        # Assemble per field across securities, then join the fields once
+        unique = list(dict.fromkeys(securities))
+        field_frames = []
+        for fld in fields:
+            parts = [
+                cache.load(keys[(sec, fld)], start_date, end_date)
+                .with_columns(security=pl.lit(sec, dtype=pl.Utf8))
+                .select("security", "date", pl.col("value").alias(fld))
+                for sec in unique
+            ]
+            field_frames.append(pl.concat(parts, how="vertical_relaxed"))
+        df = field_frames[0]
+        for frame in field_frames[1:]:
+            df = df.join(frame, on=["security", "date"], how="full", coalesce=True)
+        df = df.filter(pl.any_horizontal(pl.col(fields).is_not_null()))
+        rank = {sec: i for i, sec in enumerate(unique)}
+        df = df.sort(
+            pl.col("security").replace_strict(rank, default=None), "date"
+        ).select(["security", "date", *dict.fromkeys(fields)])
+        return self._expand_duplicates(df, securities)
+
+    @staticmethod
+    def _wide_bdh(
+        df: pl.DataFrame, securities: list[str], fields: list[str], lazy: bool
+    ) -> dict[str, pl.DataFrame | pl.LazyFrame]:
+        """Lay out a long bdh() frame as one date x security frame per field.
+
+        The dates of all securities form one sorted index; each security's rows are
+        left-joined onto it in index order, so no pivot is needed. Every requested
+        security gets a column, all null if Bloomberg returned no rows for it.
+        """
+        dates = df.select(pl.col("date").unique().sort())
+        groups = df.partition_by("security", as_dict=True, include_key=False)
+        columns: dict[str, list[pl.Series]] = {fld: [dates["date"]] for fld in fields}
+        for sec in dict.fromkeys(securities):
+            rows = groups.get((sec,))
+            if rows is not None:
+                rows = dates.join(rows, on="date", how="left", maintain_order="left")
+            for fld, cols in columns.items():
+                if rows is None:
+                    col = pl.repeat(None, len(dates), dtype=df[fld].dtype, eager=True)
+                else:
+                    col = rows[fld]
+                cols.append(col.alias(sec))
+        frames = {fld: pl.DataFrame(cols) for fld, cols in columns.items()}
+        return {fld: f.lazy() if lazy else f for fld, f in frames.items()}
 
     def bdib(  # noqa: PLR0913
         self,
-        security: str,
+        security: str | Sequence[str],
         event_type: str,
         interval: int,
         start_datetime: datetime,
         end_datetime: datetime,
         overrides: Sequence | None = None,
         options: dict | None = None,
-    ) -> pl.DataFrame:
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
         """Fetch intraday bars from Bloomberg, mirroring Excel's BDIB() function.
 
         Args:
-            security (str): Instrument identifier (for example 'AAPL US Equity').
+            security (str | Sequence[str]): Instrument identifier (for example
+                'AAPL US Equity') or a list of them. Bloomberg serves one security per
+                IntradayBarRequest, so a list is fetched as concurrent per-security
+                requests and returned as a single frame.
             event_type (str): One of TRADE, BID, ASK, BEST_BID, BEST_ASK.
-            interval (int): Bar length in minutes (1-1440).
+            interval (int): Bar length in minutes (1-1440); values below 1 raise
+                ValueError.
             start_datetime (datetime): First bar timestamp; naive vals are treated as UTC
                 tz-aware values are converted to UTC before the request is sent.
-            end_datetime (datetime): Last bar timestamp; handled same way as start_dtm
+            end_datetime (datetime): Last bar timestamp; handled same way as start_dtm.
+                Ranges longer than 10,000 bars are split into windows that are
+                requested concurrently and stitched back together.
             overrides (Sequence | None, optional): Sequence of (field, value) overrides.
             options (dict | None, optional): Additional Bloomberg request options.
+            lazy (bool, optional): Return a pl.LazyFrame so that downstream
+                filters, selects and joins run as one optimized plan. The data is
+                fetched when the method is called. Defaults to False.
 
         Returns:
-            pl.DataFrame: Bars sorted by security/time with columns
+            pl.DataFrame | pl.LazyFrame: Bars sorted by security/time with columns
                 ['security', 'time', 'open', 'high', 'low', 'close', 'volume',
                 'numEvents', 'value']. Bloomberg emits `time` in UTC and the DataFrame
                 preserves that timezone.
@@ -486,17 +1396,51 @@ class BQuery:
             ```
 
         """  # noqa: E501
-        request = self._create_intraday_bar_request(
-            security=security,
-            event_type=event_type,
-            interval=interval,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            overrides=overrides,
-            options=options,
+        df = self._run_query(
+            self._bdib_query(
+                security,
+                event_type,
+                interval,
+                start_datetime,
+                end_datetime,
+                overrides,
+                options,
+            )
+        )
+        return self._output(df, lazy)
+
+    def _bdib_query(  # noqa: PLR0913
+        self,
+        security: str | Sequence[str],
+        event_type: str,
+        interval: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        overrides: Sequence | None = None,
+        options: dict | None = None,
+    ) -> _Query:
+        """Build the per-security, per-window IntradayBarRequests of a bdib() call."""
+        if interval < 1:
+            raise ValueError("interval must be at least 1 minute.")
+        securities = [security] if isinstance(security, str) else list(security)
+        windows = self._split_datetime_range(
+            start_datetime,
+            end_datetime,
+            timedelta(minutes=interval * _BDIB_BARS_PER_REQUEST),
         )
-        responses = self._send_request(request)
-        data = self._parse_bdib_responses(responses, fallback_security=security)
+        plan = [(sec, start, end) for sec in securities for start, end in windows]
+        requests = [
+            self._create_intraday_bar_request(
+                security=sec,
+                event_type=event_type,
+                interval=interval,
+                start_datetime=start,
+                end_datetime=end,
+                overrides=overrides,
+                options=options,
+            )
+            for sec, start, end in plan
+        ]
         schema = {
             "security": pl.Utf8,
             "time": pl.Datetime,
@@ -508,8 +1452,151 @@ class BQuery:
             "numEvents": pl.Int64,
             "value": pl.Float64,
         }
-        df = pl.DataFrame(data, schema=schema, strict=False, infer_schema_length=None)
-        return df.sort(["security", "time"]) if not df.is_empty() else df
+
+        def build(columns: list[dict[str, list[Any]]]) -> pl.DataFrame:
+            df = pl.concat([self._frame_from_columns(c, schema) for c in columns])
+            if len(windows) > 1:
+                # Adjacent windows share their boundary bar
+                df = df.unique(subset=["security", "time"], keep="first")
+            return df.sort(["security", "time"]) if not df.is_empty() else df
+
+        return _Query(
+            requests,
+            lambda idx, responses: self._parse_bdib_responses(
+                responses, fallback_security=plan[idx][0]
+            ),
+            build,
+        )
+
+    def bdit(  # noqa: PLR0913
+        self,
+        security: str | Sequence[str],
+        event_types: Sequence[str],
+        start_datetime: datetime,
+        end_datetime: datetime,
+        options: dict | None = None,
+        condition_codes: bool = True,
+        window: timedelta = _BDIT_WINDOW,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Fetch intraday ticks from Bloomberg (IntradayTickRequest).
+
+        Args:
+            security (str | Sequence[str]): Instrument identifier or a list of them.
+                Bloomberg serves one security per IntradayTickRequest, so a list is
+                fetched as concurrent per-security requests.
+            event_types (Sequence[str]): Tick types, e.g. ['TRADE', 'BID', 'ASK'].
+            start_datetime (datetime): Start of the range; naive values are UTC.
+            end_datetime (datetime): End of the range; naive values are UTC.
+            options (dict | None, optional): Additional Bloomberg request options,
+                e.g. {'includeExchangeCodes': True}. The `includeExchangeCodes`,
+                `includeBrokerCodes` and `includeRpsCodes` flags add the
+                `exchangeCode`, `brokerBuyCode`/`brokerSellCode` and `rpsCode`
+                columns. Defaults to None.
+            condition_codes (bool, optional): Request trade condition codes.
+                Defaults to True.
+            window (timedelta, optional): Longest time span of a single request.
+                Longer ranges are split into windows that are requested
+                concurrently and stitched back together. Must be positive.
+                Defaults to one hour.
+            lazy (bool, optional): Return a pl.LazyFrame so that downstream
+                filters, selects and joins run as one optimized plan. The data is
+                fetched when the method is called. Defaults to False.
+
+        Returns:
+            pl.DataFrame | pl.LazyFrame: Ticks sorted by security/time with columns
+                ['security', 'time', 'type', 'value', 'size', 'conditionCodes'],
+                followed by the columns of any flags set in `options`.
+                `time` is a UTC datetime and `type` is categorical.
+
+        Example:
+            ```python
+            from datetime import datetime
+            from polars_bloomberg import BQuery
+
+            with BQuery() as bq:
+                df = bq.bdit(
+                    ["AAPL US Equity", "MSFT US Equity"],
+                    event_types=["TRADE"],
+                    start_datetime=datetime(2025, 11, 5, 14, 30),
+                    end_datetime=datetime(2025, 11, 5, 21),
+                )
+            ```
+
+        """
+        df = self._run_query(
+            self._bdit_query(
+                security,
+                event_types,
+                start_datetime,
+                end_datetime,
+                options,
+                condition_codes,
+                window,
+            )
+        )
+        return self._output(df, lazy)
+
+    def _bdit_query(  # noqa: PLR0913
+        self,
+        security: str | Sequence[str],
+        event_types: Sequence[str],
+        start_datetime: datetime,
+        end_datetime: datetime,
+        options: dict | None,
+        condition_codes: bool,
+        window: timedelta,
+    ) -> _Query:
+        """Build the per-security, per-window IntradayTickRequests of a bdit() call."""
+        if window <= timedelta(0):
+            raise ValueError("window must be positive.")
+        securities = [security] if isinstance(security, str) else list(security)
+        windows = self._split_datetime_range(start_datetime, end_datetime, window)
+        # (security, window position, start, end) of every request
+        plan = [
+            (sec, pos, start, end)
+            for sec in securities
+            for pos, (start, end) in enumerate(windows)
+        ]
+        requests = [
+            self._create_intraday_tick_request(
+                sec, event_types, start, end, options, condition_codes
+            )
+            for sec, _, start, end in plan
+        ]
+        schema = {
+            "security": pl.Utf8,
+            "time": pl.Datetime("us", "UTC"),
+            "type": pl.Categorical,
+            "value": pl.Float64,
+            "size": pl.Int64,
+            "conditionCodes": pl.Utf8,
+        }
+        fields: tuple[str, ...] = _TICK_FIELDS
+        for flag, extra in _TICK_OPTION_FIELDS.items():
+            if (options or {}).get(flag):
+                fields += extra
+                schema.update(dict.fromkeys(extra, pl.Utf8))
+        last = len(windows) - 1
+
+        def build(columns: list[dict[str, list[Any]]]) -> pl.DataFrame:
+            frames = []
+            for (_, pos, _, end), cols in zip(plan, columns, strict=True):
+                df = self._frame_from_columns(cols, schema)
+                if pos != last and isinstance(end, datetime):
+                    # Ticks on a window boundary belong to the next window
+                    df = df.filter(pl.col("time") < self._to_utc(end))
+                frames.append(df)
+            df = pl.concat(frames)
+            return df.sort(["security", "time"], maintain_order=True)
+
+        return _Query(
+            requests,
+            lambda idx, responses: self._parse_bdit_responses(
+                responses, security=plan[idx][0], fields=fields
+            ),
+            build,
+        )
 
     def bql(self, expression: str) -> BqlResult:
         """Execute a Bloomberg Query Language (BQL) query.
@@ -592,7 +1679,10 @@ class BQuery:
 
         """  # noqa: E501
         request = self._create_bql_request(expression)
-        responses = self._send_request(request)
+        return self._bql_result(self._stream_request(request))
+
+    def _bql_result(self, responses: Iterable[Any]) -> BqlResult:
+        """Parse BQL responses into a BqlResult of one DataFrame per data item."""
         tables = self._parse_bql_responses(responses)
         dataframes = [
             pl.DataFrame(table.data, schema=table.schema, strict=True)
@@ -601,36 +1691,178 @@ class BQuery:
         names = [table.name for table in tables]
         return BqlResult(dataframes, names)
 
-    def bsrch(
-        self,
-        domain: str,
-        overrides: dict[str, Any] | None = None,
-        options: dict | None = None,
-    ) -> pl.DataFrame:
-        r"""Bloomberg SRCH (search) via ExcelGetGridRequest on //blp/exrsvc.
+    def bql_many(self, expressions: Sequence[str]) -> list[BqlResult]:
+        """Execute several BQL queries concurrently.
+
+        All `sendQuery` requests share the session's request window, so up to
+        `max_in_flight` queries run at the same time and the next one is sent as
+        soon as one completes. Each query behaves like `bql()`: an invalid
+        expression logs its error and yields an empty result.
 
         Args:
-            domain: Domain string, e.g. ``\"FI:SRCHEX.@COCO\"``.
-            overrides: Optional override map (e.g. ``{\"LIMIT\": 20000}``).
-            options: Additional request options applied directly to the request.
+            expressions (Sequence[str]): BQL query expressions.
 
         Returns:
-            pl.DataFrame with one row per search record and columns from the grid.
-
-        Raises:
-            ValueError: When Bloomberg returns an error string in GridResponse.
-            TimeoutError/ConnectionError: As surfaced by the session helpers.
+            list[BqlResult]: One result per expression, in input order.
 
         Example:
-            Fetch Contingent COnvertible bonds based on Example Search @COCO
-            For sake of example limit number of bonds to two
+            Run one template over several dates:
 
             ```python
             from polars_bloomberg import BQuery
 
-            with BQuery() as bq:
-                df = bq.bsrch("FI:SRCHEX.@COCO", {"LIMIT": 2})
-                print(df)
+            dates = ["2024-01-31", "2024-02-29", "2024-03-28"]
+            expressions = [
+                f"get(px_last(dates={d})) for(members('OMX Index'))" for d in dates
+            ]
+            with BQuery(max_in_flight=16) as bq:
+                results = bq.bql_many(expressions)
+            frames = [r.combine() for r in results]
+            ```
+
+        """
+        requests = [self._create_bql_request(expr) for expr in expressions]
+        responses: list[list[dict]] = [[] for _ in requests]
+        results: dict[int, BqlResult] = {}
+        completed: list[int] = []
+
+        def collect() -> None:
+            # Parse finished queries right away so their responses can be freed
+            while completed:
+                idx = completed.pop()
+                results[idx] = self._bql_result(responses[idx])
+                responses[idx] = []
+
+        for idx, response in self._stream_requests(requests, completed=completed):
+            collect()
+            if response is None:  # request re-sent, drop its partial results
+                responses[idx] = []
+            else:
+                responses[idx].append(response)
+        collect()
+        return [results[idx] for idx in range(len(requests))]
+
+    def bql_chunked(
+        self, template: str, ids: Sequence[str], chunk_size: int = 500
+    ) -> BqlResult:
+        """Execute a BQL query over a large universe in concurrent chunks.
+
+        The ids are split into chunks of `chunk_size`; each chunk is written into
+        the `{universe}` placeholder of `template` as a BQL list and the chunk
+        queries run concurrently via `bql_many()`. The tables of each data item
+        are then concatenated across chunks.
+
+        Args:
+            template (str): BQL expression with a `{universe}` placeholder, e.g.
+                "get(px_last) for({universe})".
+            ids (Sequence[str]): Security identifiers to query.
+            chunk_size (int, optional): Ids per query. Defaults to 500.
+
+        Returns:
+            BqlResult: One DataFrame per data item covering all chunks. Chunks that
+            fail are logged and left out.
+
+        Raises:
+            ValueError: If `template` has no `{universe}` placeholder,
+                `chunk_size` is not positive or an id contains both `'` and `"`.
+
+        Example:
+            ```python
+            from polars_bloomberg import BQuery
+
+            with BQuery() as bq:
+                tickers = bq.bsrch("FI:SRCHEX.@COCO")["id"].to_list()
+                result = bq.bql_chunked(
+                    "get(name, duration, spread) for({universe})", tickers
+                )
+                df = result.combine()
+            ```
+
+        """
+        expressions = self._chunk_bql_expressions(template, ids, chunk_size)
+        return self._concat_bql_results(self.bql_many(expressions))
+
+    @staticmethod
+    def _chunk_bql_expressions(
+        template: str, ids: Sequence[str], chunk_size: int
+    ) -> list[str]:
+        """Fill the `{universe}` placeholder of template with chunks of ids.
+
+        Ids are quoted with `'`, or with `"` when they contain a `'` themselves.
+        """
+        if "{universe}" not in template:
+            raise ValueError("BQL template must contain a '{universe}' placeholder.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        literals = []
+        for id_ in ids:
+            if "'" not in id_:
+                literals.append(f"'{id_}'")
+            elif '"' not in id_:
+                literals.append(f'"{id_}"')
+            else:
+                raise ValueError(f"BQL id cannot contain both quote types: {id_}")
+        expressions = []
+        for start in range(0, len(literals), chunk_size):
+            universe = "[" + ", ".join(literals[start : start + chunk_size]) + "]"
+            expressions.append(template.replace("{universe}", universe))
+        return expressions
+
+    @staticmethod
+    def _concat_bql_results(results: list[BqlResult]) -> BqlResult:
+        """Concatenate the tables of each data item across chunk results.
+
+        Chunks may return different secondary columns for the same item; columns
+        missing from a chunk are filled with nulls.
+        """
+        failed = [idx for idx, result in enumerate(results) if not len(result)]
+        if failed:
+            logger.warning(
+                "BQL returned no data for %d of %d chunks: %s",
+                len(failed),
+                len(results),
+                failed,
+            )
+        frames: dict[str, list[pl.DataFrame]] = {}
+        for result in results:
+            for name, df in zip(result.names, result.dataframes, strict=True):
+                frames.setdefault(name, []).append(df)
+        dataframes = [pl.concat(dfs, how="diagonal_relaxed") for dfs in frames.values()]
+        return BqlResult(dataframes, list(frames))
+
+    def bsrch(
+        self,
+        domain: str,
+        overrides: dict[str, Any] | None = None,
+        options: dict | None = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        r"""Bloomberg SRCH (search) via ExcelGetGridRequest on //blp/exrsvc.
+
+        Args:
+            domain: Domain string, e.g. ``\"FI:SRCHEX.@COCO\"``.
+            overrides: Optional override map (e.g. ``{\"LIMIT\": 20000}``).
+            options: Additional request options applied directly to the request.
+            lazy: Return a pl.LazyFrame instead of a DataFrame.
+
+        Returns:
+            pl.DataFrame with one row per search record and columns from the grid,
+            or a pl.LazyFrame if `lazy` is True.
+
+        Raises:
+            ValueError: When Bloomberg returns an error string in GridResponse.
+            TimeoutError/ConnectionError: As surfaced by the session helpers.
+
+        Example:
+            Fetch Contingent COnvertible bonds based on Example Search @COCO
+            For sake of example limit number of bonds to two
+
+            ```python
+            from polars_bloomberg import BQuery
+
+            with BQuery() as bq:
+                df = bq.bsrch("FI:SRCHEX.@COCO", {"LIMIT": 2})
+                print(df)
             ```
 
             Expected output:
@@ -649,10 +1881,208 @@ class BQuery:
 
         """
         request = self._create_bsrch_request(domain, overrides, options)
-        responses = self._send_request(request)
+        responses = self._stream_request(request)
         limit_applied = bool(overrides and "LIMIT" in overrides)
-        rows = self._parse_bsrch_responses(responses, limit_applied=limit_applied)
-        return pl.DataFrame(rows, infer_schema_length=None, strict=False)
+        df = self._parse_bsrch_responses(responses, limit_applied=limit_applied)
+        return df.lazy() if lazy else df
+
+    def subscribe(
+        self,
+        securities: list[str],
+        fields: list[str],
+        interval: int = 1000,
+        max_ticks: int = 10_000,
+        callback: Callable[[pl.DataFrame], None] | None = None,
+        options: list[str] | None = None,
+    ) -> Iterator[pl.DataFrame] | None:
+        """Subscribe to real-time data and stream it as DataFrame micro-batches.
+
+        Ticks are appended to column buffers as they arrive and emitted as one
+        DataFrame every `interval` milliseconds, or as soon as `max_ticks`
+        ticks are buffered. Each batch has a `time` column (UTC receive time), a
+        `security` column and one column per field; fields missing from a tick
+        are null.
+
+        Args:
+            securities (list[str]): Securities to subscribe to.
+            fields (list[str]): Real-time fields, e.g. 'LAST_PRICE', 'BID', 'ASK'.
+            interval (int, optional): Maximum milliseconds between batches.
+                Defaults to 1000.
+            max_ticks (int, optional): Maximum ticks per batch. Defaults to 10000.
+            callback (Callable[[pl.DataFrame], None] | None, optional): When
+                given, each batch is passed to it and the call blocks until the
+                callback raises. Defaults to None.
+            options (list[str] | None, optional): Subscription options such as
+                'interval=1.0' for Bloomberg-side conflation. Defaults to None.
+
+        Returns:
+            Iterator[pl.DataFrame] | None: Generator of batches, or None when a
+            callback is given. Closing the generator (e.g. leaving a for loop)
+            cancels the subscription.
+
+        Example:
+            ```python
+            from polars_bloomberg import BQuery
+
+            with BQuery() as bq:
+                for batch in bq.subscribe(["ESA Index"], ["LAST_PRICE", "BID"]):
+                    print(batch)
+            ```
+
+        """
+        batches = self._subscription_batches(
+            securities, fields, interval, max_ticks, options
+        )
+        if callback is None:
+            return batches
+        with closing(batches):
+            for batch in batches:
+                callback(batch)
+        return None
+
+    def _subscription_batches(
+        self,
+        securities: list[str],
+        fields: list[str],
+        interval: int,
+        max_ticks: int,
+        options: list[str] | None,
+    ) -> Iterator[pl.DataFrame]:
+        """Yield tick batches of a subscription until the generator is closed."""
+        subscriptions = blpapi.SubscriptionList()
+        topics: dict[int, str] = {}  # correlation id value -> security
+        for security in securities:
+            cid = blpapi.CorrelationId(next(self._correlation_ids))
+            topics[cid.value()] = security
+            subscriptions.add(security, fields, options or [], cid)
+        self.session.subscribe(subscriptions)
+
+        key_dtype = pl.Categorical if self.categorical_keys else pl.Utf8
+        schema = {"time": pl.Datetime("us", "UTC"), "security": key_dtype}
+        columns = self._empty_tick_columns(fields)
+        deadline = time.monotonic() + interval / 1000
+        try:
+            while True:
+                wait_ms = max(int((deadline - time.monotonic()) * 1000), 1)
+                event = self.session.nextEvent(wait_ms)
+                event_type = event.eventType()
+                if event_type == blpapi.Event.SUBSCRIPTION_DATA:
+                    self._append_ticks(event, topics, fields, columns)
+                elif event_type == blpapi.Event.SUBSCRIPTION_STATUS:
+                    self._log_subscription_status(event, topics)
+                elif event_type == blpapi.Event.SESSION_STATUS:
+                    session = self.session
+                    self._on_session_status(event, in_flight=False)
+                    if self.session is not session:  # restarted after termination
+                        self.session.subscribe(subscriptions)
+                ticks = len(columns["security"])
+                if ticks >= max_ticks or time.monotonic() >= deadline:
+                    if ticks:
+                        yield self._frame_from_columns(columns, schema)
+                        columns = self._empty_tick_columns(fields)
+                    deadline = time.monotonic() + interval / 1000
+        finally:
+            self.session.unsubscribe(subscriptions)
+
+    @staticmethod
+    def _empty_tick_columns(fields: list[str]) -> dict[str, list[Any]]:
+        return {"time": [], "security": [], **{field: [] for field in fields}}
+
+    @staticmethod
+    def _append_ticks(
+        event: blpapi.Event,
+        topics: dict[int, str],
+        fields: list[str],
+        columns: dict[str, list[Any]],
+    ) -> None:
+        """Append the requested fields of every tick in an event to the buffers."""
+        received = datetime.now(UTC)
+        field_columns = [(field, columns[field]) for field in fields]
+        for msg in event:
+            security = topics.get(msg.correlationIds()[0].value())
+            if security is None:
+                continue
+            columns["time"].append(received)
+            columns["security"].append(security)
+            for field, values in field_columns:
+                values.append(
+                    msg.getElementValue(field) if msg.hasElement(field, True) else None
+                )
+
+    @staticmethod
+    def _log_subscription_status(event: blpapi.Event, topics: dict[int, str]) -> None:
+        """Log failed or terminated subscriptions; other statuses are ignored."""
+        for msg in event:
+            msg_type = str(msg.messageType())
+            if msg_type in ("SubscriptionFailure", "SubscriptionTerminated"):
+                security = topics.get(msg.correlationIds()[0].value())
+                logger.error("%s for %s: %s", msg_type, security, msg.toPy())
+
+    def _plan_chunks(
+        self, request_type: str, securities: list[str], fields: list[str]
+    ) -> list[tuple[list[str], list[str]]]:
+        """Split securities and fields into batches that fit in a single request.
+
+        Returns (securities, fields) pairs ordered by security batch first, so all
+        field batches for the same securities are adjacent.
+        """
+        max_securities = max(self.securities_per_request, 1)
+        max_fields = max(
+            self.fields_per_request or _MAX_FIELDS_PER_REQUEST.get(request_type, 25), 1
+        )
+        security_chunks = [
+            securities[i : i + max_securities]
+            for i in range(0, len(securities), max_securities)
+        ] or [securities]
+        field_chunks = [
+            fields[i : i + max_fields] for i in range(0, len(fields), max_fields)
+        ] or [fields]
+        return [(secs, flds) for secs in security_chunks for flds in field_chunks]
+
+    @staticmethod
+    def _expand_duplicates(df: pl.DataFrame, securities: list[str]) -> pl.DataFrame:
+        """Repeat the rows of securities requested more than once, in input order.
+
+        Field batches are joined on the security, so duplicates would multiply
+        rows; each security is requested once and its rows copied here instead.
+        """
+        if len(set(securities)) == len(securities):
+            return df
+        order = pl.DataFrame({"security": securities}, schema={"security": pl.Utf8})
+        return order.join(df, on="security", how="inner", maintain_order="left")
+
+    @staticmethod
+    def _merge_chunks(
+        plan: list[tuple[list[str], list[str]]],
+        frames: list[pl.DataFrame],
+        keys: list[str],
+    ) -> pl.DataFrame:
+        """Combine per-chunk frames into one frame with a stable column order.
+
+        Frames for different field batches of the same securities are joined on
+        `keys`; security batches are then stacked in plan order.
+        """
+        if len(frames) == 1:
+            return frames[0]
+
+        stacked = []
+        chunks = zip(plan, frames, strict=True)
+        for securities, group in itertools.groupby(chunks, key=lambda c: c[0][0]):
+            group_frames = [frame for _, frame in group]
+            merged = group_frames[0]
+            for frame in group_frames[1:]:
+                merged = merged.join(frame, on=keys, how="full", coalesce=True)
+            if len(group_frames) > 1:
+                # Joins do not keep row order: restore request order of securities
+                # (and ascending dates within a security for bdh)
+                rank = {sec: i for i, sec in reversed(list(enumerate(securities)))}
+                merged = merged.sort(
+                    pl.col("security").replace_strict(rank, default=None), *keys[1:]
+                )
+            stacked.append(merged)
+
+        columns = [*keys, *dict.fromkeys(f for _, flds in plan for f in flds)]
+        return pl.concat(stacked, how="diagonal_relaxed").select(columns)
 
     def _create_request(
         self,
@@ -663,7 +2093,7 @@ class BQuery:
         options: dict | None = None,
     ) -> blpapi.Request:
         """Create a Bloomberg request with support for overrides and options."""
-        service = self.session.getService("//blp/refdata")
+        service = self._service("//blp/refdata")
         request = service.createRequest(request_type)
 
         # Add securities
@@ -698,7 +2128,7 @@ class BQuery:
         options: dict | None = None,
     ) -> blpapi.Request:
         """Create an ExcelGetGridRequest for BSRCH on //blp/exrsvc."""
-        service = self.session.getService("//blp/exrsvc")
+        service = self._service("//blp/exrsvc")
         request = service.createRequest("ExcelGetGridRequest")
         request.set("Domain", domain)
 
@@ -726,7 +2156,7 @@ class BQuery:
         options: dict | None,
     ) -> blpapi.Request:
         """Create an IntradayBarRequest with overrides and options support."""
-        service = self.session.getService("//blp/refdata")
+        service = self._service("//blp/refdata")
         request = service.createRequest("IntradayBarRequest")
         request.set("security", security)
         request.set("eventType", event_type)
@@ -747,9 +2177,34 @@ class BQuery:
 
         return request
 
+    def _create_intraday_tick_request(
+        self,
+        security: str,
+        event_types: Sequence[str],
+        start_datetime: datetime | str,
+        end_datetime: datetime | str,
+        options: dict | None,
+        condition_codes: bool,
+    ) -> blpapi.Request:
+        """Create an IntradayTickRequest for one security and time window."""
+        service = self._service("//blp/refdata")
+        request = service.createRequest("IntradayTickRequest")
+        request.set("security", security)
+        for event_type in event_types:
+            request.append("eventTypes", event_type)
+        request.set("startDateTime", self._format_datetime(start_datetime))
+        request.set("endDateTime", self._format_datetime(end_datetime))
+        request.set("includeConditionCodes", condition_codes)
+
+        if options:
+            for key, value in options.items():
+                request.set(key, value)
+
+        return request
+
     def _create_bql_request(self, expression: str) -> blpapi.Request:
         """Create a BQL request."""
-        service = self.session.getService("//blp/bqlsvc")
+        service = self._service("//blp/bqlsvc")
         request = service.createRequest("sendQuery")
         request.set("expression", expression)
         # BLPAPI requires setting sub-elements on the sequence element.
@@ -764,99 +2219,358 @@ class BQuery:
         return request
 
     def _send_request(self, request) -> list[dict]:
-        """Send a Bloomberg request and collect responses with timeout handling."""
-        self.session.sendRequest(request)
-        responses = []
+        """Send a Bloomberg request and collect all responses in a list."""
+        return list(self._stream_request(request))
+
+    def _stream_request(self, request) -> Iterator[dict]:
+        """Send a Bloomberg request and yield responses as they arrive.
+
+        Each message is converted and handed to the caller as soon as its event is
+        received, so parsers fill their column buffers while later partial responses
+        are still in flight and no message is retained after it has been consumed.
+        """
+        received = False
+        for _, response in self._stream_requests([request]):
+            if response is None:
+                if received:
+                    raise ConnectionError(
+                        "Bloomberg connection lost after part of the response "
+                        "was consumed; please retry."
+                    )
+                continue
+            received = True
+            yield response
+
+    def _stream_requests(
+        self,
+        requests: Sequence[blpapi.Request],
+        completed: list[int] | None = None,
+    ) -> Iterator[tuple[int, dict | None]]:
+        """Send requests concurrently and yield (request index, response) pairs.
+
+        Every request gets its own correlation id, so responses can be matched to
+        their request while several requests are outstanding on the session. At most
+        `max_in_flight` requests are sent at a time; the next one goes out as soon as
+        a previous one receives its final RESPONSE event.
+
+        A request failed by a dropped connection is re-sent once the connection is
+        back (up to `max_reconnects` times). `(idx, None)` is yielded first so the
+        caller can discard the partial responses it already received for `idx`.
+
+        When `completed` is given, the index of each request is appended to it once
+        its final response has been consumed, before the next pair is yielded.
+        """
+        window = _RequestWindow(self, requests)
+        for _ in range(max(self.max_in_flight, 1)):
+            window.send_next()
+
+        while window:
+            event = self._next_response_event()
+            event_type = event.eventType()
+            if event_type == blpapi.Event.SESSION_STATUS:
+                self._on_session_status(event, bool(window))
+                window.resend_waiting()
+                continue
+            finished: dict[int, int] = {}  # correlation id value -> request index
+            for msg in event:
+                cid_value = msg.correlationIds()[0].value()
+                if cid_value not in window.in_flight:
+                    continue  # late message of a request abandoned by an earlier call
+                if event_type == blpapi.Event.REQUEST_STATUS:
+                    idx = window.retry(cid_value, msg)
+                    yield idx, None
+                    continue
+                idx = window.in_flight[cid_value]
+                self._raise_for_response_error(msg)
+                response = msg.toPy()
+                if self.debug:
+                    window.debug_responses.setdefault(idx, []).append(response)
+                yield idx, response
+                if event_type == blpapi.Event.RESPONSE:
+                    finished[cid_value] = idx
+            # The final RESPONSE event of a request frees its in-flight slot once
+            # all of its messages have been consumed
+            window.finish(finished)
+            if completed is not None:
+                completed.extend(finished.values())
+
+    def _next_response_event(self) -> blpapi.Event:
+        """Wait for the next response, request status or session status event."""
         while True:
             # Wait for an event with the specified timeout
             event = self.session.nextEvent(self.timeout)
-            if event.eventType() == blpapi.Event.TIMEOUT:
-                # Handle the timeout scenario
+            event_type = event.eventType()
+            if event_type == blpapi.Event.TIMEOUT:
                 raise TimeoutError(
                     f"Request timed out after {self.timeout} milliseconds"
                 )
-            for msg in event:
-                # Check for errors in the message
-                if msg.hasElement("responseError"):
-                    error = msg.getElement("responseError")
-                    error_message = error.getElementAsString("message")
-                    raise Exception(f"Response error: {error_message}")
-                responses.append(msg.toPy())
-            # Break the loop when the final response is received
-            if event.eventType() == blpapi.Event.RESPONSE:
-                break
+            if event_type in (
+                blpapi.Event.PARTIAL_RESPONSE,
+                blpapi.Event.RESPONSE,
+                blpapi.Event.REQUEST_STATUS,
+                blpapi.Event.SESSION_STATUS,
+            ):
+                return event
+
+    def _on_session_status(self, event: blpapi.Event, in_flight: bool) -> None:
+        """Track the connection state and restart a terminated session.
+
+        `in_flight` tells whether the current call still has requests that are
+        unanswered, waiting for a retry or not sent yet.
+
+        Raises:
+            ConnectionError: If the session terminated while requests of the call
+                were unfinished. Requests are bound to the session that created
+                them, so they cannot be sent on the restarted session.
+
+        """
+        for msg in event:
+            msg_type = str(msg.messageType())
+            if msg_type == "SessionConnectionDown":
+                logger.warning("Bloomberg connection down; waiting for reconnect.")
+                self._connected = False
+            elif msg_type == "SessionConnectionUp":
+                logger.info("Bloomberg connection re-established.")
+                self._connected = True
+            elif msg_type == "SessionTerminated":
+                self._restart()
+                if in_flight:
+                    raise ConnectionError(
+                        "Bloomberg session terminated during the request; "
+                        "the session was restarted, please retry."
+                    )
+
+    def _restart(self) -> None:
+        """Start a new session after termination, with exponential backoff."""
+        services = list(self._services)
+        delay = self.reconnect_delay
+        error: Exception | None = None
+        for attempt in range(1, self.max_reconnects + 1):
+            logger.warning(
+                "Restarting Bloomberg session (attempt %d of %d).",
+                attempt,
+                self.max_reconnects,
+            )
+            time.sleep(delay)
+            try:
+                self.start()
+                if services:
+                    self.open_services(*services)
+            except (ConnectionError, TimeoutError) as exc:
+                error = exc
+                delay *= 2
+            else:
+                return
+        self._connected = False
+        raise ConnectionError("Failed to restart Bloomberg session.") from error
+
+    @staticmethod
+    def _raise_for_response_error(msg: blpapi.Message) -> None:
+        """Raise if a response message carries a responseError element."""
+        if msg.hasElement("responseError"):
+            error = msg.getElement("responseError")
+            error_message = error.getElementAsString("message")
+            raise Exception(f"Response error: {error_message}")
+
+    def _run_query(self, query: _Query) -> pl.DataFrame:
+        """Send the requests of a query and build its frame from the responses."""
+        return query.build(self._stream_columns(query.requests, query.parse))
+
+    def _stream_columns(
+        self,
+        requests: Sequence[blpapi.Request],
+        parse: Callable[[int, Iterable[dict]], dict[str, list[Any]]],
+    ) -> list[dict[str, list[Any]]]:
+        """Dispatch requests concurrently and parse responses into column buffers.
+
+        `parse(idx, responses)` is one of the column parsers bound to the settings of
+        request `idx`; each response is parsed on arrival and appended to that
+        request's buffers.
+        """
+        columns = [parse(idx, ()) for idx in range(len(requests))]
+        for idx, response in self._stream_requests(requests):
+            if response is None:  # request re-sent, drop its partial results
+                columns[idx] = parse(idx, ())
+                continue
+            for name, values in parse(idx, (response,)).items():
+                columns[idx][name].extend(values)
+        return columns
 
-        if getattr(self, "debug", False):
-            os.makedirs("debug_cases", exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            with open(
-                f"debug_cases/responses_{timestamp}.json", "w", encoding="utf-8"
-            ) as f:
-                json.dump(responses, f, default=str, indent=2)
-        return responses
+    @staticmethod
+    def _save_debug_responses(responses: list[dict]) -> None:
+        """Save raw responses of one request to a JSON file for debugging."""
+        os.makedirs("debug_cases", exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        with open(f"debug_cases/responses_{timestamp}.json", "w", encoding="utf-8") as f:
+            json.dump(responses, f, default=str, indent=2)
 
     def _parse_bdp_responses(
-        self, responses: list[dict], fields: list[str]
-    ) -> list[dict]:
-        data = []
+        self,
+        responses: Iterable[dict],
+        fields: list[str],
+        errors: set[tuple[str, str]] | None = None,
+    ) -> dict[str, list[Any]]:
+        """Accumulate ReferenceDataResponse payloads column by column.
+
+        When `errors` is given, (security, field) pairs with a securityError or
+        fieldException are added to it.
+        """
+        columns: dict[str, list[Any]] = {"security": []}
+        field_columns = [columns.setdefault(field, []) for field in fields]
         for response in responses:
             security_data = response.get("securityData", [])
-            for sec in security_data:
-                security = sec.get("security")
-                field_data = sec.get("fieldData", {})
-                record = {"security": security}
-                for field in fields:
-                    record[field] = field_data.get(field)
-                data.append(record)
-        return data
+            if errors is not None:
+                for sec in security_data:
+                    errors.update(self._bdh_errors(sec, fields))
+            columns["security"].extend(sec.get("security") for sec in security_data)
+            field_data = [sec.get("fieldData", {}) for sec in security_data]
+            for field, values in zip(fields, field_columns, strict=True):
+                values.extend(data.get(field) for data in field_data)
+        return columns
 
     def _parse_bdh_responses(
-        self, responses: list[dict], fields: list[str]
-    ) -> list[dict]:
-        data = []
+        self,
+        responses: Iterable[dict],
+        fields: list[str],
+        errors: set[tuple[str, str]] | None = None,
+    ) -> dict[str, list[Any]]:
+        """Accumulate HistoricalDataResponse payloads column by column.
+
+        When `errors` is given, (security, field) pairs with a securityError or
+        fieldException are added to it.
+        """
+        columns: dict[str, list[Any]] = {"security": [], "date": []}
+        field_columns = [columns.setdefault(field, []) for field in fields]
         for response in responses:
             security_data = response.get("securityData", {})
             security = security_data.get("security")
+            if errors is not None:
+                errors.update(self._bdh_errors(security_data, fields))
             field_data_array = security_data.get("fieldData", [])
-            for entry in field_data_array:
-                record = {"security": security, "date": entry.get("date")}
-                for field in fields:
-                    record[field] = entry.get(field)
-                data.append(record)
-        return data
+            columns["security"].extend([security] * len(field_data_array))
+            columns["date"].extend(entry.get("date") for entry in field_data_array)
+            for field, values in zip(fields, field_columns, strict=True):
+                values.extend(entry.get(field) for entry in field_data_array)
+        return columns
+
+    @staticmethod
+    def _bdh_errors(security_data: dict, fields: list[str]) -> set[tuple[str, str]]:
+        """Return the (security, field) pairs a securityData element has errors for.
+
+        Used for both HistoricalDataResponse and ReferenceDataResponse elements.
+        """
+        security = security_data.get("security")
+        if security_data.get("securityError"):
+            return {(security, field) for field in fields}
+        return {
+            (security, exception.get("fieldId"))
+            for exception in security_data.get("fieldExceptions", [])
+        }
+
+    @staticmethod
+    def _infer_dtype(values: list[Any]) -> pl.DataType | None:
+        """Infer a Polars dtype from the first non-null value of a column.
+
+        Bloomberg returns schema-typed values, so a single value is representative
+        for the whole column. Returns None when Polars should infer the type itself
+        (all-null columns, bulk/sequence values).
+        """
+        value = next((v for v in values if v is not None), None)
+        # bool before int and datetime before date: subclasses come first
+        type_map = (
+            (bool, pl.Boolean),
+            (int, pl.Int64),
+            (float, pl.Float64),
+            (str, pl.Utf8),
+            (datetime, pl.Datetime),
+            (date, pl.Date),
+        )
+        for py_type, dtype in type_map:
+            if isinstance(value, py_type):
+                return dtype
+        return None
+
+    def _frame_from_columns(
+        self,
+        columns: dict[str, list[Any]],
+        schema: dict[str, pl.DataType] | None = None,
+    ) -> pl.DataFrame:
+        """Build a DataFrame from column buffers without row-wise type inference.
+
+        Columns listed in `schema` use the given dtype; the rest get a dtype from
+        `_infer_dtype`. A column whose values do not all fit that dtype (e.g. ints
+        followed by a float) falls back to Polars' own inference instead of being
+        truncated or nulled.
+        """
+        schema = schema or {}
+        series = []
+        for name, values in columns.items():
+            if name in schema:
+                series.append(pl.Series(name, values, dtype=schema[name], strict=False))
+                continue
+            try:
+                series.append(pl.Series(name, values, dtype=self._infer_dtype(values)))
+            except (TypeError, pl.exceptions.PolarsError):
+                series.append(pl.Series(name, values, strict=False))
+        return pl.DataFrame(series)
+
+    def _output(self, df: pl.DataFrame, lazy: bool) -> pl.DataFrame | pl.LazyFrame:
+        """Apply the `categorical_keys` option and the `lazy` flag to a result."""
+        if self.categorical_keys:
+            df = df.with_columns(pl.col("security").cast(pl.Categorical))
+        return df.lazy() if lazy else df
 
     def _parse_bdib_responses(
-        self, responses: list[dict], fallback_security: str | None = None
-    ) -> list[dict]:
-        bars: list[dict[str, Any]] = []
+        self, responses: Iterable[dict], fallback_security: str | None = None
+    ) -> dict[str, list[Any]]:
+        """Accumulate IntradayBarResponse payloads column by column."""
+        columns: dict[str, list[Any]] = {"security": []}
+        bar_columns = [columns.setdefault(field, []) for field in _BAR_FIELDS]
         for response in responses:
             bar_data = response.get("barData", {})
             security = bar_data.get("security") or fallback_security
-            entries = bar_data.get("barTickData", [])
-            for entry in entries:
-                bar_entry = entry.get("barTickData", entry)
-                record = {
-                    "security": security,
-                    "time": bar_entry.get("time"),
-                    "open": bar_entry.get("open"),
-                    "high": bar_entry.get("high"),
-                    "low": bar_entry.get("low"),
-                    "close": bar_entry.get("close"),
-                    "volume": bar_entry.get("volume"),
-                    "numEvents": bar_entry.get("numEvents"),
-                    "value": bar_entry.get("value"),
-                }
-                bars.append(record)
-        return bars
+            entries = [
+                entry.get("barTickData", entry)
+                for entry in bar_data.get("barTickData", [])
+            ]
+            columns["security"].extend([security] * len(entries))
+            for field, values in zip(_BAR_FIELDS, bar_columns, strict=True):
+                values.extend(entry.get(field) for entry in entries)
+        return columns
+
+    def _parse_bdit_responses(
+        self,
+        responses: Iterable[dict],
+        security: str,
+        fields: Sequence[str] = _TICK_FIELDS,
+    ) -> dict[str, list[Any]]:
+        """Accumulate IntradayTickResponse payloads column by column."""
+        columns: dict[str, list[Any]] = {"security": []}
+        tick_columns = [columns.setdefault(field, []) for field in fields]
+        for response in responses:
+            entries = [
+                entry.get("tickData", entry)
+                for entry in response.get("tickData", {}).get("tickData", [])
+            ]
+            columns["security"].extend([security] * len(entries))
+            for field, values in zip(fields, tick_columns, strict=True):
+                values.extend(entry.get(field) for entry in entries)
+        return columns
 
     def _parse_bsrch_responses(
-        self, responses: list[dict], *, limit_applied: bool = False
-    ) -> list[dict]:
-        """Parse GridResponse payloads from ExcelGetGridRequest."""
-        rows: list[dict[str, Any]] = []
+        self, responses: Iterable[dict], *, limit_applied: bool = False
+    ) -> pl.DataFrame:
+        """Parse GridResponse payloads from ExcelGetGridRequest column by column.
+
+        The value key of each column (e.g. `DoubleValue`) is taken from its first
+        non-blank cell and determines the column dtype; later cells are read with
+        that key directly.
+        """
+        columns: list[list[Any]] = []
+        value_keys: list[str | None] = []
         errors: list[str] = []
         reach_max = False
-        column_titles: list[str] | None = None
+        column_titles: list[str] = []
 
         for response in responses:
             grid = response.get("GridResponse", {})
@@ -874,21 +2588,9 @@ class BQuery:
             if error_text and not data_records:
                 errors.append(error_text)
                 continue
+            self._fill_bsrch_columns(data_records, columns, value_keys)
 
-            for record in data_records:
-                data_fields = record.get("DataFields", []) or []
-                row: dict[str, Any] = {}
-                for idx, field in enumerate(data_fields):
-                    value = self._extract_bsrch_field_value(field)
-                    col_name = (
-                        column_titles[idx]
-                        if column_titles and idx < len(column_titles)
-                        else f"col_{idx}"
-                    )
-                    row[col_name] = value
-                rows.append(row)
-
-        if errors and not rows:
+        if errors and not any(columns):
             raise ValueError(f"BSRCH error: {errors[0]}")
 
         if reach_max and not limit_applied:
@@ -896,10 +2598,67 @@ class BQuery:
                 "BSRCH response reached internal limit; consider using LIMIT override."
             )
 
-        if rows:
-            self._coerce_bsrch_numeric_columns(rows)
+        series = []
+        for idx, (values, key) in enumerate(zip(columns, value_keys, strict=True)):
+            name = column_titles[idx] if idx < len(column_titles) else f"col_{idx}"
+            dtype = _BSRCH_VALUE_KEYS.get(key) if key else None
+            series.append(self._bsrch_series(name, values, dtype))
+        return pl.DataFrame(series)
+
+    def _fill_bsrch_columns(
+        self,
+        data_records: list[dict],
+        columns: list[list[Any]],
+        value_keys: list[str | None],
+    ) -> None:
+        """Append the DataFields of each record to per-column buffers."""
+        for record in data_records:
+            data_fields = record.get("DataFields", []) or []
+            rows = len(columns[0]) if columns else 0
+            for idx, field in enumerate(data_fields):
+                if idx == len(columns):
+                    columns.append([None] * rows)
+                    value_keys.append(None)
+                try:
+                    value = field[value_keys[idx]]
+                except (KeyError, TypeError):
+                    value = self._extract_bsrch_field_value(field)
+                    blank = value is None or (
+                        isinstance(value, str) and not value.strip()
+                    )
+                    if value_keys[idx] is None and not blank:
+                        value_keys[idx] = self._bsrch_value_key(field)
+                columns[idx].append(value)
+            # Pad columns missing from short records
+            for values in columns[len(data_fields) :]:
+                values.append(None)
+
+    @staticmethod
+    def _bsrch_value_key(field: Any) -> str | None:
+        """Return the first known value key present in a GridResponse DataField."""
+        if not isinstance(field, dict):
+            return None
+        return next((key for key in _BSRCH_VALUE_KEYS if key in field), None)
 
-        return rows
+    @staticmethod
+    def _bsrch_series(
+        name: str, values: list[Any], dtype: pl.DataType | None
+    ) -> pl.Series:
+        """Build a bsrch column, casting to `dtype` when all values allow it.
+
+        Blank strings in numeric columns are treated as missing values; columns
+        holding other non-numeric strings are kept as strings.
+        """
+        series = pl.Series(name, values, strict=False)
+        if dtype is None or series.dtype == dtype:
+            return series
+        cleaned = series
+        if series.dtype == pl.Utf8:
+            cleaned = series.str.strip_chars().replace("", None)
+        try:
+            return cleaned.cast(dtype)
+        except pl.exceptions.InvalidOperationError:
+            return series
 
     @staticmethod
     def _extract_bsrch_field_value(field: Any) -> Any:  # noqa: PLR0911
@@ -907,25 +2666,7 @@ class BQuery:
         if not isinstance(field, dict):
             return field
 
-        # Possible keys observed in GridResponse DataFields
-        key_order = [
-            "Ticker",
-            "StringValue",
-            "StringData",
-            "value",
-            "Value",
-            "DoubleData",
-            "DoubleValue",
-            "FloatValue",
-            "Int32Data",
-            "Int32Value",
-            "IntValue",
-            "LongValue",
-            "DateValue",
-            "TimeValue",
-            "DateTimeValue",
-        ]
-        for key in key_order:
+        for key in _BSRCH_VALUE_KEYS:
             if key in field:
                 val = field.get(key)
                 if key.startswith("Double") or key.startswith("Float"):
@@ -938,79 +2679,56 @@ class BQuery:
                         return int(val)
                     except (TypeError, ValueError):
                         return val
-                if key in {"DateValue", "TimeValue", "DateTimeValue"}:
-                    return val
                 return val
         # If no known key found, return the dict itself
         return field
 
-    @staticmethod
-    def _coerce_bsrch_numeric_columns(rows: list[dict[str, Any]]) -> None:
-        """Convert empty/whitespace strings to None to allow numeric inference."""
-        if not rows:
-            return
-
-        cols = rows[0].keys()
-        for col in cols:
-            values = [row.get(col) for row in rows]
-            cleaned: list[Any] = []
-            numeric_candidate = True
-
-            for val in values:
-                if isinstance(val, str) and val.strip() == "":
-                    cleaned.append(None)
-                    continue
-                cleaned.append(val)
-                if val is None or isinstance(val, (int, float)):
-                    continue
-                numeric_candidate = False
-                # leave column untouched if any non-numeric string present
-                # other than whitespace
-                # Note: do not break early to align cleaned length
-
-            if numeric_candidate:
-                for idx, cleaned_val in enumerate(cleaned):
-                    rows[idx][col] = cleaned_val
-
-    def _parse_bql_responses(self, responses: list[Any]):
+    def _parse_bql_responses(self, responses: Iterable[Any]):
         """Parse BQL responses into a list of SITable objects."""
         tables: list[SITable] = []
         results: list[dict] = self._extract_results(responses)
 
         for result in results:
             tables.extend(self._parse_result(result))
-        return [self._apply_schema(table) for table in tables]
+        return tables
 
     def _apply_schema(self, table: SITable) -> SITable:
-        """Convert data based on the schema (e.g., str -> date, 'NaN' -> None)."""
-        date_format = "%Y-%m-%dT%H:%M:%SZ"
+        """Convert data based on the schema (e.g., str -> date, 'NaN' -> None).
+
+        Every column is stored as a `pl.Series` of its schema dtype, created once
+        from the response values, so the final DataFrame takes the Series as they
+        are instead of converting Python lists again.
+        """
         for col, dtype in table.schema.items():
-            if dtype == pl.Date:
-                table.data[col] = [
-                    (
-                        datetime.strptime(v, date_format).date()
-                        if isinstance(v, str)
-                        else None
-                    )
-                    for v in table.data[col]
-                ]
-            elif dtype in {pl.Float64, pl.Int64}:
-
-                def _convert_number(val: Any):
-                    if isinstance(val, str):
-                        lower_val = val.lower()
-                        if lower_val == "nan":
-                            return None
-                        if lower_val in {"infinity", "inf"}:
-                            return float("inf")
-                        if lower_val in {"-infinity", "-inf"}:
-                            return float("-inf")
-                    return val
-
-                table.data[col] = [_convert_number(x) for x in table.data[col]]
+            table.data[col] = self._bql_series(col, table.data[col], dtype)
         return table
 
-    def _extract_results(self, responses: list[Any]) -> list[dict]:
+    @staticmethod
+    def _bql_series(name: str, values: list[Any], dtype: pl.DataType) -> pl.Series:
+        """Build the Series of one BQL column with the given dtype."""
+        if dtype == pl.Date:
+            return pl.Series(name, values, dtype=pl.Utf8, strict=False).str.to_date(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
+        if dtype == pl.Datetime:
+            return pl.Series(name, values, dtype=pl.Utf8, strict=False).str.to_datetime(
+                time_unit="us", time_zone="UTC"
+            )
+        if dtype in {pl.Float64, pl.Int64}:
+            try:
+                return pl.Series(name, values, dtype=dtype)
+            except (TypeError, pl.exceptions.PolarsError):
+                pass
+            series = pl.Series(name, values, strict=False)
+            if series.dtype == pl.Utf8:
+                # Non-finite numbers arrive as strings, e.g. "NaN", "Infinity"
+                series = series.str.to_lowercase().replace(
+                    {"nan": None, "infinity": "inf", "-infinity": "-inf"}
+                )
+            return series.cast(dtype)
+        return pl.Series(name, values, dtype=dtype, strict=False)
+
+    def _extract_results(self, responses: Iterable[Any]) -> list[dict]:
         """Extract the 'results' section from each response, handling JSON strings.
 
         Logs an error if responseExceptions are present (e.g., BQL syntax errors).
@@ -1019,9 +2737,10 @@ class BQuery:
         extracted = []
         for response in responses:
             resp_dict = response
-            if isinstance(response, str):
+            if isinstance(response, str | bytes):
                 try:
-                    resp_dict = json.loads(response)
+                    # Large BQL payloads decode several times faster with orjson
+                    resp_dict = _json_loads(response)
                 except json.JSONDecodeError as e:
                     logger.error("Failed to decode JSON: %s. Error: %s", response, e)
                     continue
@@ -1048,7 +2767,11 @@ class BQuery:
         return extracted
 
     def _parse_result(self, results: dict[str, Any]) -> list[SITable]:
-        """Convert a single BQL results dictionary into a list[SITable]."""
+        """Convert a single BQL results dictionary into a list[SITable].
+
+        The response value lists are referenced, not copied, and each column is
+        turned into a typed Series once by `_apply_schema`.
+        """
         tables: list[SITable] = []
         for field, content in results.items():
             data = {}
@@ -1072,7 +2795,32 @@ class BQuery:
         if self.debug:
             self._save_debug_case(results, tables)
 
-        return tables
+        return [self._compact_table(self._apply_schema(table)) for table in tables]
+
+    def _compact_table(self, table: SITable) -> SITable:
+        """Apply the categorical and `bql_downcast` options to a typed table.
+
+        `bql_categorical` covers secondary columns and `categorical_keys` the ID
+        column; the value column keeps its type.
+        """
+        for col, series in table.data.items():
+            if col == table.name or series.dtype != pl.Utf8:
+                continue
+            if self.categorical_keys if col == "ID" else self.bql_categorical:
+                table.data[col] = series.cast(pl.Categorical)
+        if self.bql_downcast:
+            for col, series in table.data.items():
+                if series.dtype == pl.Float64:
+                    table.data[col] = series.cast(pl.Float32)
+                elif series.dtype == pl.Int64 and self._fits_int32(series):
+                    table.data[col] = series.cast(pl.Int32)
+        table.schema = {col: series.dtype for col, series in table.data.items()}
+        return table
+
+    @staticmethod
+    def _fits_int32(series: pl.Series) -> bool:
+        low, high = series.min(), series.max()
+        return low is None or (low >= -(2**31) and high < 2**31)
 
     def _map_types(self, type_map: dict[str, str]) -> dict[str, pl.DataType]:
         """Map string-based types to Polars data types. Default to Utf8."""
@@ -1081,10 +2829,45 @@ class BQuery:
             "DOUBLE": pl.Float64,
             "INT": pl.Int64,
             "DATE": pl.Date,
+            "DATETIME": pl.Datetime("us", "UTC"),
             "BOOLEAN": pl.Boolean,
         }
         return {col: mapping.get(t.upper(), pl.Utf8) for col, t in type_map.items()}
 
+    @staticmethod
+    def _split_datetime_range(
+        start: datetime | str, end: datetime | str, step: timedelta
+    ) -> list[tuple[datetime | str, datetime | str]]:
+        """Split [start, end] into consecutive windows of at most `step`.
+
+        Adjacent windows share their boundary. Ranges given as strings or mixing
+        naive and tz-aware datetimes are returned as a single window.
+
+        Raises:
+            ValueError: If `step` is not positive.
+
+        """
+        if step <= timedelta(0):
+            raise ValueError("Window length must be positive.")
+        if not (isinstance(start, datetime) and isinstance(end, datetime)):
+            return [(start, end)]
+        if (start.tzinfo is None) != (end.tzinfo is None):
+            return [(start, end)]
+        windows: list[tuple[datetime | str, datetime | str]] = []
+        window_start = start
+        while window_start + step < end:
+            windows.append((window_start, window_start + step))
+            window_start += step
+        windows.append((window_start, end))
+        return windows
+
+    @staticmethod
+    def _to_utc(value: datetime) -> datetime:
+        """Convert a request datetime to an aware UTC datetime; naive values are UTC."""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+
     @staticmethod
     def _format_datetime(value: datetime | str) -> str:
         """Convert datetime objects to Bloomberg's ISO8601 string format."""
@@ -1120,3 +2903,603 @@ class BQuery:
             json.dump(to_save, f, indent=2)
 
         logger.debug("Saved debug case to %s", filename)
+
+
+class _PendingRequest:
+    """State of one request (or service open) awaited by AsyncBQuery."""
+
+    def __init__(
+        self,
+        future: asyncio.Future,
+        on_response: Callable[[dict], None] | None = None,
+    ) -> None:
+        self.future = future
+        self.on_response = on_response
+        self.received = 0  # messages seen so far, used for the inactivity timeout
+
+    def handle(
+        self, event_type: int, msg_type: str, payload: dict, error: Exception | None
+    ) -> None:
+        """Apply one message of this request's correlation id."""
+        self.received += 1
+        if error is not None:
+            self.future.set_exception(error)
+        elif event_type == blpapi.Event.SERVICE_STATUS:
+            self.future.set_result(msg_type)
+        elif event_type == blpapi.Event.REQUEST_STATUS:
+            self.future.set_exception(Exception(f"Request failed: {payload}"))
+        elif event_type in (blpapi.Event.PARTIAL_RESPONSE, blpapi.Event.RESPONSE):
+            try:
+                if self.on_response is not None:
+                    self.on_response(payload)
+            except Exception as exc:
+                self.future.set_exception(exc)
+
+
+class AsyncBQuery(BQuery):
+    """Asyncio variant of BQuery for use inside an event loop.
+
+    The Bloomberg session runs with an event handler: its callbacks hand each
+    message over to the event loop, where it resolves the future of the request
+    it belongs to. Many requests can therefore be awaited concurrently without a
+    thread per call.
+
+    Example:
+        Fetch reference and historical data concurrently:
+
+        ```python
+        import asyncio
+        from datetime import date
+        from polars_bloomberg import AsyncBQuery
+
+        async def main():
+            async with AsyncBQuery() as bq:
+                ref, hist = await asyncio.gather(
+                    bq.bdp(['AAPL US Equity'], ['PX_LAST']),
+                    bq.bdh(['AAPL US Equity'], ['PX_LAST'],
+                           date(2024, 1, 1), date(2024, 1, 31)),
+                )
+            print(ref, hist)
+
+        asyncio.run(main())
+        ```
+
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        host: str = "localhost",
+        port: int = 8194,
+        timeout: int = 32_000,
+        debug: bool = False,
+        securities_per_request: int = 500,
+        fields_per_request: int | None = None,
+        max_in_flight: int = 8,
+        bql_categorical: bool = False,
+        bql_downcast: bool = False,
+        categorical_keys: bool = False,
+    ) -> None:
+        """Initialize an AsyncBQuery instance with connection parameters.
+
+        Args:
+            host (str, optional): The hostname for the Bloomberg API server.
+                Defaults to "localhost".
+            port (int, optional): The port number for the Bloomberg API server.
+                Defaults to 8194.
+            timeout (int, optional): Milliseconds to wait for the next message of a
+                request before it is cancelled. Defaults to 32000.
+            debug (bool, optional): Save raw responses for debugging.
+                Defaults to False.
+            securities_per_request (int, optional): Maximum number of securities
+                sent in one bdp()/bdh() request. Defaults to 500.
+            fields_per_request (int | None, optional): Maximum number of fields
+                sent in one bdp()/bdh() request. Defaults to None.
+            max_in_flight (int, optional): Maximum number of requests of one call
+                outstanding at the same time. Defaults to 8.
+            bql_categorical (bool, optional): Return string secondary columns of
+                BQL results as pl.Categorical. Defaults to False.
+            bql_downcast (bool, optional): Return BQL numbers as Float32/Int32.
+                Defaults to False.
+            categorical_keys (bool, optional): Return `security` and BQL `ID`
+                columns as pl.Categorical. Defaults to False.
+
+        """
+        super().__init__(
+            host=host,
+            port=port,
+            timeout=timeout,
+            debug=debug,
+            securities_per_request=securities_per_request,
+            fields_per_request=fields_per_request,
+            max_in_flight=max_in_flight,
+            bql_categorical=bql_categorical,
+            bql_downcast=bql_downcast,
+            categorical_keys=categorical_keys,
+        )
+        self._pending: dict[int, _PendingRequest] = {}
+        self._session_started: asyncio.Future | None = None
+
+    async def __aenter__(self):  # noqa: D105
+        self._loop = asyncio.get_running_loop()
+        self._session_started = self._loop.create_future()
+        options = blpapi.SessionOptions()
+        options.setServerHost(self.host)
+        options.setServerPort(self.port)
+        self.session = blpapi.Session(options, self._handle_event)
+        self._services = {}
+
+        if not self.session.startAsync():
+            raise ConnectionError("Failed to start Bloomberg session.")
+        try:
+            await asyncio.wait_for(self._session_started, self.timeout / 1000)
+        except TimeoutError:
+            raise ConnectionError("Failed to start Bloomberg session.") from None
+
+        async with asyncio.TaskGroup() as tg:
+            for name in _SERVICES:
+                tg.create_task(self._open_service_async(name))
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):  # noqa: D105
+        if self.session:
+            self.session.stopAsync()
+
+    def start(self) -> None:
+        """Not supported: connect with `async with AsyncBQuery() as bq`."""
+        self._blocking_only("start")
+
+    def stop(self) -> None:
+        """Not supported: the session is stopped when `async with` exits."""
+        self._blocking_only("stop")
+
+    def open_services(self, *names: str) -> None:
+        """Not supported: services are opened by `async with AsyncBQuery()`."""
+        self._blocking_only("open_services")
+
+    def subscribe(self, *args: Any, **kwargs: Any) -> None:
+        """Not supported: subscriptions need the blocking session of BQuery."""
+        self._blocking_only("subscribe")
+
+    @staticmethod
+    def _blocking_only(name: str) -> NoReturn:
+        raise NotImplementedError(
+            f"{name}() needs the blocking session of BQuery; AsyncBQuery connects "
+            "with 'async with AsyncBQuery() as bq'."
+        )
+
+    async def bdp(
+        self,
+        securities: list[str],
+        fields: list[str],
+        overrides: list[tuple] | None = None,
+        options: dict | None = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Async version of `BQuery.bdp()`."""
+        query = self._bdp_query(securities, fields, overrides, options)
+        df = await self._run_query_async(query)
+        return self._output(df, lazy)
+
+    async def bdh(  # noqa: PLR0913
+        self,
+        securities: list[str],
+        fields: list[str],
+        start_date: date,
+        end_date: date,
+        overrides: list[tuple] | None = None,
+        options: dict | None = None,
+        lazy: bool = False,
+        wide: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame | dict[str, pl.DataFrame | pl.LazyFrame]:
+        """Async version of `BQuery.bdh()`."""
+        query = self._bdh_query(
+            securities, fields, start_date, end_date, overrides, options
+        )
+        df = await self._run_query_async(query)
+        if wide:
+            return self._wide_bdh(df, securities, fields, lazy)
+        return self._output(df, lazy)
+
+    async def bdib(  # noqa: PLR0913
+        self,
+        security: str | Sequence[str],
+        event_type: str,
+        interval: int,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        overrides: Sequence | None = None,
+        options: dict | None = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Async version of `BQuery.bdib()`."""
+        query = self._bdib_query(
+            security,
+            event_type,
+            interval,
+            start_datetime,
+            end_datetime,
+            overrides,
+            options,
+        )
+        df = await self._run_query_async(query)
+        return self._output(df, lazy)
+
+    async def bdit(  # noqa: PLR0913
+        self,
+        security: str | Sequence[str],
+        event_types: Sequence[str],
+        start_datetime: datetime,
+        end_datetime: datetime,
+        options: dict | None = None,
+        condition_codes: bool = True,
+        window: timedelta = _BDIT_WINDOW,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Async version of `BQuery.bdit()`."""
+        query = self._bdit_query(
+            security,
+            event_types,
+            start_datetime,
+            end_datetime,
+            options,
+            condition_codes,
+            window,
+        )
+        df = await self._run_query_async(query)
+        return self._output(df, lazy)
+
+    async def bql(self, expression: str) -> BqlResult:
+        """Async version of `BQuery.bql()`."""
+        responses: list[dict] = []
+        await self._request_async(self._create_bql_request(expression), responses.append)
+        return self._bql_result(responses)
+
+    async def bql_many(self, expressions: Sequence[str]) -> list[BqlResult]:
+        """Async version of `BQuery.bql_many()`."""
+        slots = asyncio.Semaphore(max(self.max_in_flight, 1))
+
+        async def run(expression: str) -> BqlResult:
+            async with slots:
+                return await self.bql(expression)
+
+        return list(await asyncio.gather(*(run(expr) for expr in expressions)))
+
+    async def bql_chunked(
+        self, template: str, ids: Sequence[str], chunk_size: int = 500
+    ) -> BqlResult:
+        """Async version of `BQuery.bql_chunked()`."""
+        expressions = self._chunk_bql_expressions(template, ids, chunk_size)
+        return self._concat_bql_results(await self.bql_many(expressions))
+
+    async def bsrch(
+        self,
+        domain: str,
+        overrides: dict[str, Any] | None = None,
+        options: dict | None = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Async version of `BQuery.bsrch()`."""
+        request = self._create_bsrch_request(domain, overrides, options)
+        responses: list[dict] = []
+        await self._request_async(request, responses.append)
+        limit_applied = bool(overrides and "LIMIT" in overrides)
+        df = self._parse_bsrch_responses(responses, limit_applied=limit_applied)
+        return df.lazy() if lazy else df
+
+    async def _run_query_async(self, query: _Query) -> pl.DataFrame:
+        """Await the requests of a query concurrently and build its frame."""
+        columns = [query.parse(idx, ()) for idx in range(len(query.requests))]
+        slots = asyncio.Semaphore(max(self.max_in_flight, 1))
+
+        async def send(idx: int, request: blpapi.Request) -> None:
+            def on_response(response: dict) -> None:
+                for name, values in query.parse(idx, (response,)).items():
+                    columns[idx][name].extend(values)
+
+            async with slots:
+                await self._request_async(request, on_response)
+
+        async with asyncio.TaskGroup() as tg:
+            for idx, request in enumerate(query.requests):
+                tg.create_task(send(idx, request))
+        return query.build(columns)
+
+    async def _request_async(
+        self, request: blpapi.Request, on_response: Callable[[dict], None]
+    ) -> None:
+        """Send a request and wait until its final response has been handled.
+
+        The request is cancelled when no message arrives within `timeout`
+        milliseconds.
+        """
+        debug_responses: list[dict] = []
+
+        def handle(response: dict) -> None:
+            if self.debug:
+                debug_responses.append(response)
+            on_response(response)
+
+        cid = blpapi.CorrelationId(next(self._correlation_ids))
+        pending = _PendingRequest(self._loop.create_future(), handle)
+        self._pending[cid.value()] = pending
+        try:
+            self.session.sendRequest(request, correlationId=cid)
+            await self._wait_pending(pending, cid)
+        finally:
+            del self._pending[cid.value()]
+        if self.debug:
+            self._save_debug_responses(debug_responses)
+
+    async def _open_service_async(self, name: str) -> None:
+        """Open a service without blocking the event loop."""
+        cid = blpapi.CorrelationId(next(self._correlation_ids))
+        pending = _PendingRequest(self._loop.create_future())
+        self._pending[cid.value()] = pending
+        try:
+            self.session.openServiceAsync(name, cid)
+            status = await self._wait_pending(pending, cid)
+        finally:
+            del self._pending[cid.value()]
+        if status != "ServiceOpened":
+            raise ConnectionError(f"Failed to open service {name}.")
+        self._services[name] = self.session.getService(name)
+
+    async def _wait_pending(
+        self, pending: _PendingRequest, cid: blpapi.CorrelationId
+    ) -> Any:
+        """Wait for a pending request, timing out after `timeout` ms of silence."""
+        received = -1
+        while received != pending.received:
+            received = pending.received
+            done, _ = await asyncio.wait({pending.future}, timeout=self.timeout / 1000)
+            if done:
+                return pending.future.result()
+        self.session.cancel(cid)
+        raise TimeoutError(f"Request timed out after {self.timeout} milliseconds")
+
+    def _handle_event(self, event: blpapi.Event, session: blpapi.Session) -> None:
+        """Session event handler; runs on a Bloomberg API thread.
+
+        Messages are converted while the event is still valid and passed to the
+        event loop, which owns all request state.
+        """
+        event_type = event.eventType()
+        items = []
+        for msg in event:
+            try:
+                self._raise_for_response_error(msg)
+                error = None
+            except Exception as exc:
+                error = exc
+            cid_values = [cid.value() for cid in msg.correlationIds()]
+            items.append((cid_values, str(msg.messageType()), msg.toPy(), error))
+        self._loop.call_soon_threadsafe(self._dispatch_event, event_type, items)
+
+    def _dispatch_event(self, event_type: int, items: list[tuple]) -> None:
+        """Route converted messages to the futures of their correlation ids.
+
+        A request is resolved by its final RESPONSE event only after all messages
+        of that event have been handled.
+        """
+        finished: list[_PendingRequest] = []
+        for cid_values, msg_type, payload, error in items:
+            if event_type == blpapi.Event.SESSION_STATUS:
+                self._on_async_session_status(msg_type)
+                continue
+            for value in cid_values:
+                pending = self._pending.get(value)
+                if pending is not None and not pending.future.done():
+                    pending.handle(event_type, msg_type, payload, error)
+                    if event_type == blpapi.Event.RESPONSE:
+                        finished.append(pending)
+        for pending in finished:
+            if not pending.future.done():
+                pending.future.set_result(None)
+
+    def _on_async_session_status(self, msg_type: str) -> None:
+        """Resolve session start-up and fail outstanding requests on termination."""
+        started = self._session_started
+        if msg_type == "SessionStarted":
+            if started is not None and not started.done():
+                started.set_result(None)
+        elif msg_type in ("SessionStartupFailure", "SessionTerminated"):
+            error = ConnectionError(f"Bloomberg session failed: {msg_type}")
+            if started is not None and not started.done():
+                started.set_exception(error)
+            for pending in self._pending.values():
+                if not pending.future.done():
+                    pending.future.set_exception(error)
+
+
+class BQueryPool:
+    """Thread-safe pool of started BQuery sessions.
+
+    A BQuery owns every event on its session, so one instance must not be used by
+    two threads at once. The pool keeps up to `size` connected instances, each with
+    //blp/refdata, //blp/bqlsvc and //blp/exrsvc opened, and lends them to one
+    thread at a time. Sessions are health-checked when handed out and reconnected
+    when they are down or a call failed with a connection error or timeout.
+
+    Example:
+        Share one pool between the worker threads of a web application:
+
+        ```python
+        from polars_bloomberg import BQueryPool
+
+        pool = BQueryPool(size=4)
+
+        def handler(tickers):
+            with pool.connection() as bq:
+                return bq.bdp(tickers, ['PX_LAST'])
+
+        # or use the shortcuts that borrow a session for one call
+        df = pool.bdp(['AAPL US Equity'], ['PX_LAST'])
+        pool.close()
+        ```
+
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        acquire_timeout: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize a pool; sessions are started on first use or by start().
+
+        Args:
+            size (int, optional): Maximum number of sessions. Defaults to 4.
+            acquire_timeout (float | None, optional): Seconds to wait for a free
+                session before raising TimeoutError. Defaults to None (wait).
+            **kwargs: Arguments passed to every BQuery, e.g. host, port, timeout.
+
+        """
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self._kwargs = kwargs
+        self._idle: queue.LifoQueue[BQuery] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    def __enter__(self):  # noqa: D105
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # noqa: D105
+        self.close()
+
+    def start(self) -> None:
+        """Start all `size` sessions up front instead of on first use."""
+        while (bq := self._new_connection()) is not None:
+            self._idle.put(bq)
+
+    def close(self) -> None:
+        """Stop idle sessions; borrowed sessions are stopped when returned."""
+        self._closed = True
+        while True:
+            try:
+                bq = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(bq)
+
+    @contextmanager
+    def connection(self) -> Iterator[BQuery]:
+        """Borrow a connected BQuery for exclusive use by the calling thread.
+
+        Raises:
+            TimeoutError: If no session is free within `acquire_timeout` seconds.
+            ConnectionError: If the pool is closed or a session cannot be started.
+
+        """
+        bq = self._acquire()
+        try:
+            yield bq
+        except (ConnectionError, TimeoutError):
+            self._discard(bq)
+            raise
+        except BaseException:
+            self._release(bq)
+            raise
+        self._release(bq)
+
+    def bdp(self, *args: Any, **kwargs: Any) -> pl.DataFrame:
+        """Run `BQuery.bdp()` on a pooled session."""
+        with self.connection() as bq:
+            return bq.bdp(*args, **kwargs)
+
+    def bdh(self, *args: Any, **kwargs: Any) -> pl.DataFrame:
+        """Run `BQuery.bdh()` on a pooled session."""
+        with self.connection() as bq:
+            return bq.bdh(*args, **kwargs)
+
+    def bdib(self, *args: Any, **kwargs: Any) -> pl.DataFrame:
+        """Run `BQuery.bdib()` on a pooled session."""
+        with self.connection() as bq:
+            return bq.bdib(*args, **kwargs)
+
+    def bdit(self, *args: Any, **kwargs: Any) -> pl.DataFrame:
+        """Run `BQuery.bdit()` on a pooled session."""
+        with self.connection() as bq:
+            return bq.bdit(*args, **kwargs)
+
+    def bql(self, *args: Any, **kwargs: Any) -> BqlResult:
+        """Run `BQuery.bql()` on a pooled session."""
+        with self.connection() as bq:
+            return bq.bql(*args, **kwargs)
+
+    def bql_many(self, *args: Any, **kwargs: Any) -> list[BqlResult]:
+        """Run `BQuery.bql_many()` on a pooled session."""
+        with self.connection() as bq:
+            return bq.bql_many(*args, **kwargs)
+
+    def bql_chunked(self, *args: Any, **kwargs: Any) -> BqlResult:
+        """Run `BQuery.bql_chunked()` on a pooled session."""
+        with self.connection() as bq:
+            return bq.bql_chunked(*args, **kwargs)
+
+    def bsrch(self, *args: Any, **kwargs: Any) -> pl.DataFrame:
+        """Run `BQuery.bsrch()` on a pooled session."""
+        with self.connection() as bq:
+            return bq.bsrch(*args, **kwargs)
+
+    def _acquire(self) -> BQuery:
+        """Take an idle healthy session, starting a new one while below `size`."""
+        if self._closed:
+            raise ConnectionError("BQueryPool is closed.")
+        try:
+            bq = self._idle.get_nowait()
+        except queue.Empty:
+            bq = self._new_connection()
+            if bq is None:
+                try:
+                    bq = self._idle.get(timeout=self.acquire_timeout)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No free Bloomberg session within {self.acquire_timeout} s"
+                    ) from None
+        if not bq._session_alive():
+            logger.warning("Bloomberg session is down; reconnecting.")
+            self._stop(bq)
+            bq = self._connect()
+        return bq
+
+    def _release(self, bq: BQuery) -> None:
+        if self._closed:
+            self._discard(bq)
+        else:
+            self._idle.put(bq)
+
+    def _new_connection(self) -> BQuery | None:
+        """Start a new session if the pool has a free slot, else return None."""
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+        return self._connect()
+
+    def _connect(self) -> BQuery:
+        """Start a session for an already reserved slot; free the slot on failure."""
+        bq = BQuery(**self._kwargs)
+        try:
+            bq.__enter__()
+            bq.open_services()
+        except BaseException:
+            with self._lock:
+                self._created -= 1
+            raise
+        return bq
+
+    def _discard(self, bq: BQuery) -> None:
+        """Stop a session and free its slot."""
+        with self._lock:
+            self._created -= 1
+        self._stop(bq)
+
+    @staticmethod
+    def _stop(bq: BQuery) -> None:
+        try:
+            bq.__exit__(None, None, None)
+        except Exception:
+            logger.exception("Failed to stop Bloomberg session.")
@@ -0,0 +1,412 @@
+import asyncio
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import blpapi
+import polars as pl
+import pytest
+
+from polars_bloomberg import AsyncBQuery, BqlResult
+
+pytestmark = pytest.mark.no_bbg
+
+
+def _message(payload=None, cid=None, msg_type="", error=None):
+    msg = MagicMock()
+    msg.correlationIds.return_value = [] if cid is None else [cid]
+    msg.messageType.return_value = msg_type
+    msg.toPy.return_value = payload or {}
+    msg.hasElement.side_effect = lambda name: error is not None
+    msg.getElement.return_value.getElementAsString.return_value = error
+    return msg
+
+
+def _event(event_type, messages):
+    event = MagicMock()
+    event.eventType.return_value = event_type
+    event.__iter__.return_value = iter(messages)
+    return event
+
+
+class FakeSession:
+    """Session stand-in that answers requests through the event handler."""
+
+    def __init__(self, bq, responses=None, service_status="ServiceOpened"):
+        self.bq = bq
+        self.responses = responses or {}
+        self.service_status = service_status
+        self.sent = []
+        self.cancelled = []
+        self.stopped = False
+
+    def emit(self, event_type, messages):
+        # Bloomberg calls the handler from its own thread; call_soon keeps it async
+        asyncio.get_running_loop().call_soon(
+            self.bq._handle_event, _event(event_type, messages), self
+        )
+
+    def startAsync(self):  # noqa: N802
+        self.emit(blpapi.Event.SESSION_STATUS, [_message(msg_type="SessionStarted")])
+        return True
+
+    def openServiceAsync(self, name, cid):  # noqa: N802
+        message = _message({"serviceName": name}, cid, self.service_status)
+        self.emit(blpapi.Event.SERVICE_STATUS, [message])
+
+    def getService(self, name):  # noqa: N802
+        return MagicMock()
+
+    def sendRequest(self, request, correlationId):  # noqa: N802, N803
+        self.sent.append(request)
+        for event_type, payload, error in self.responses.get(request, []):
+            self.emit(event_type, [_message(payload, correlationId, error=error)])
+
+    def cancel(self, cid):
+        self.cancelled.append(cid)
+
+    def stopAsync(self):  # noqa: N802
+        self.stopped = True
+
+
+def _connect(bq, session):
+    async def enter():
+        with patch("polars_bloomberg.plbbg.blpapi.Session", return_value=session):
+            return await bq.__aenter__()
+
+    return enter()
+
+
+def _bdp_payload(security, fields):
+    return {"securityData": [{"security": security, "fieldData": fields}]}
+
+
+class TestAsyncBQuery:
+    def test_enter_opens_services_and_exit_stops(self):
+        bq = AsyncBQuery()
+        session = FakeSession(bq)
+
+        async def run():
+            await _connect(bq, session)
+            await bq.__aexit__(None, None, None)
+
+        asyncio.run(run())
+        assert session.stopped
+        assert bq._pending == {}
+
+    def test_service_open_failure(self):
+        bq = AsyncBQuery()
+        session = FakeSession(bq, service_status="ServiceOpenFailure")
+
+        with pytest.raises(ExceptionGroup) as excinfo:
+            asyncio.run(_connect(bq, session))
+        assert excinfo.group_contains(ConnectionError, match="Failed to open service")
+
+    def test_start_failure(self):
+        bq = AsyncBQuery()
+        session = FakeSession(bq)
+        session.startAsync = MagicMock(return_value=False)
+
+        with pytest.raises(ConnectionError, match="Failed to start"):
+            asyncio.run(_connect(bq, session))
+
+    def test_startup_failure_status(self):
+        bq = AsyncBQuery()
+        session = FakeSession(bq)
+
+        def start_async():
+            failure = _message(msg_type="SessionStartupFailure")
+            session.emit(blpapi.Event.SESSION_STATUS, [failure])
+            return True
+
+        session.startAsync = start_async
+        with pytest.raises(ConnectionError, match="SessionStartupFailure"):
+            asyncio.run(_connect(bq, session))
+
+    def test_start_timeout(self):
+        bq = AsyncBQuery(timeout=10)
+        session = FakeSession(bq)
+        session.startAsync = MagicMock(return_value=True)
+
+        with pytest.raises(ConnectionError, match="Failed to start"):
+            asyncio.run(_connect(bq, session))
+
+    def test_bdp_requests_run_concurrently(self):
+        bq = AsyncBQuery(securities_per_request=1)
+        requests = [MagicMock(name="A"), MagicMock(name="B")]
+        session = FakeSession(
+            bq,
+            {
+                requests[0]: [
+                    (blpapi.Event.RESPONSE, _bdp_payload("A", {"PX_LAST": 1.0}), None)
+                ],
+                requests[1]: [
+                    (
+                        blpapi.Event.PARTIAL_RESPONSE,
+                        _bdp_payload("B", {"PX_LAST": 2.0}),
+                        None,
+                    ),
+                    (blpapi.Event.RESPONSE, {"securityData": []}, None),
+                ],
+            },
+        )
+
+        async def run():
+            await _connect(bq, session)
+            with patch.object(bq, "_create_request", side_effect=requests):
+                return await bq.bdp(["A", "B"], ["PX_LAST"])
+
+        df = asyncio.run(run())
+        assert df.to_dicts() == [
+            {"security": "A", "PX_LAST": 1.0},
+            {"security": "B", "PX_LAST": 2.0},
+        ]
+        assert session.sent == requests
+
+    def test_bdh_and_bdib_use_shared_queries(self):
+        bq = AsyncBQuery()
+        hist = {
+            "securityData": {
+                "security": "A",
+                "fieldData": [{"date": date(2024, 1, 2), "PX_LAST": 1.0}],
+            }
+        }
+        bars = {"barData": {"barTickData": []}}
+        bdh_request, bdib_request = MagicMock(), MagicMock()
+        session = FakeSession(
+            bq,
+            {
+                bdh_request: [(blpapi.Event.RESPONSE, hist, None)],
+                bdib_request: [(blpapi.Event.RESPONSE, bars, None)],
+            },
+        )
+
+        async def run():
+            await _connect(bq, session)
+            with (
+                patch.object(bq, "_create_request", return_value=bdh_request),
+                patch.object(
+                    bq, "_create_intraday_bar_request", return_value=bdib_request
+                ),
+            ):
+                return await asyncio.gather(
+                    bq.bdh(["A"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 2)),
+                    bq.bdib("A", "TRADE", 60, "2024-01-02T10:00", "2024-01-02T12:00"),
+                )
+
+        df_hist, df_bars = asyncio.run(run())
+        assert df_hist.to_dicts() == [
+            {"security": "A", "date": date(2024, 1, 2), "PX_LAST": 1.0}
+        ]
+        assert df_bars.is_empty()
+
+    def test_bdh_wide(self):
+        bq = AsyncBQuery()
+        hist = {
+            "securityData": {
+                "security": "A",
+                "fieldData": [{"date": date(2024, 1, 2), "PX_LAST": 1.0}],
+            }
+        }
+        request = MagicMock()
+        session = FakeSession(bq, {request: [(blpapi.Event.RESPONSE, hist, None)]})
+
+        async def run():
+            await _connect(bq, session)
+            with patch.object(bq, "_create_request", return_value=request):
+                return await bq.bdh(
+                    ["A"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 2), wide=True
+                )
+
+        frames = asyncio.run(run())
+        assert frames["PX_LAST"].to_dicts() == [{"date": date(2024, 1, 2), "A": 1.0}]
+
+    def test_bdit(self):
+        bq = AsyncBQuery(categorical_keys=True)
+        request = MagicMock()
+        tick = {"time": datetime(2024, 1, 2, 14, 30), "type": "TRADE", "value": 1.0}
+        ticks = {"tickData": {"tickData": [tick]}}
+        session = FakeSession(bq, {request: [(blpapi.Event.RESPONSE, ticks, None)]})
+
+        async def run():
+            await _connect(bq, session)
+            with patch.object(bq, "_create_intraday_tick_request", return_value=request):
+                return await bq.bdit(
+                    "A", ["TRADE"], "2024-01-02T14:00", "2024-01-02T15:00"
+                )
+
+        df = asyncio.run(run())
+        assert df.select("security", "value").to_dicts() == [
+            {"security": "A", "value": 1.0}
+        ]
+        assert df["security"].dtype == pl.Categorical
+
+    def test_bql_and_bsrch(self):
+        bq = AsyncBQuery()
+        bql_request, bsrch_request = MagicMock(), MagicMock()
+        grid = {
+            "GridResponse": {
+                "ColumnTitles": ["Ticker"],
+                "DataRecords": [{"DataFields": [{"Ticker": "A Corp"}]}],
+            }
+        }
+        session = FakeSession(
+            bq,
+            {
+                bql_request: [(blpapi.Event.RESPONSE, {}, None)],
+                bsrch_request: [(blpapi.Event.RESPONSE, grid, None)],
+            },
+        )
+
+        async def run():
+            await _connect(bq, session)
+            with (
+                patch.object(bq, "_create_bql_request", return_value=bql_request),
+                patch.object(bq, "_create_bsrch_request", return_value=bsrch_request),
+            ):
+                return await bq.bql("get(px_last) for('A')"), await bq.bsrch("FI:X")
+
+        result, df = asyncio.run(run())
+        assert isinstance(result, BqlResult)
+        assert len(result) == 0
+        assert df["Ticker"].to_list() == ["A Corp"]
+
+    def test_response_error_is_raised(self):
+        bq = AsyncBQuery()
+        request = MagicMock()
+        session = FakeSession(bq, {request: [(blpapi.Event.RESPONSE, {}, "Bad field")]})
+
+        async def run():
+            await _connect(bq, session)
+            with patch.object(bq, "_create_bsrch_request", return_value=request):
+                await bq.bsrch("FI:X")
+
+        with pytest.raises(Exception, match="Response error: Bad field"):
+            asyncio.run(run())
+        assert bq._pending == {}
+
+    def test_request_failure_status(self):
+        bq = AsyncBQuery()
+        request = MagicMock()
+        session = FakeSession(
+            bq, {request: [(blpapi.Event.REQUEST_STATUS, {"reason": "x"}, None)]}
+        )
+
+        async def run():
+            await _connect(bq, session)
+            with patch.object(bq, "_create_bsrch_request", return_value=request):
+                await bq.bsrch("FI:X")
+
+        with pytest.raises(Exception, match="Request failed"):
+            asyncio.run(run())
+
+    def test_parser_error_fails_request(self):
+        bq = AsyncBQuery()
+        request = MagicMock()
+        payload = {"GridResponse": {"Error": "Invalid domain", "DataRecords": []}}
+        session = FakeSession(bq, {request: [(blpapi.Event.RESPONSE, payload, None)]})
+
+        async def run():
+            await _connect(bq, session)
+            with (
+                patch.object(bq, "_create_request", return_value=request),
+                patch.object(bq, "_parse_bdp_responses", side_effect=[{}, ValueError]),
+            ):
+                await bq.bdp(["A"], ["PX_LAST"])
+
+        with pytest.raises(ExceptionGroup) as excinfo:
+            asyncio.run(run())
+        assert excinfo.group_contains(ValueError)
+
+    def test_timeout_cancels_request(self):
+        bq = AsyncBQuery(timeout=10)
+        request = MagicMock()
+        session = FakeSession(bq)
+
+        async def run():
+            await _connect(bq, session)
+            with patch.object(bq, "_create_bsrch_request", return_value=request):
+                await bq.bsrch("FI:X")
+
+        with pytest.raises(TimeoutError, match="timed out after 10 milliseconds"):
+            asyncio.run(run())
+        assert len(session.cancelled) == 1
+        assert bq._pending == {}
+
+    def test_session_terminated_fails_pending_requests(self):
+        bq = AsyncBQuery()
+        request = MagicMock()
+        session = FakeSession(bq)
+
+        def send_request(request, correlationId):  # noqa: N803
+            terminated = _message(msg_type="SessionTerminated")
+            session.emit(blpapi.Event.SESSION_STATUS, [terminated])
+
+        session.sendRequest = send_request
+
+        async def run():
+            await _connect(bq, session)
+            with patch.object(bq, "_create_bsrch_request", return_value=request):
+                await bq.bsrch("FI:X")
+
+        with pytest.raises(ConnectionError, match="SessionTerminated"):
+            asyncio.run(run())
+
+    def test_final_event_with_several_messages(self):
+        bq = AsyncBQuery()
+        request = MagicMock()
+        session = FakeSession(bq)
+
+        def send_request(request, correlationId):  # noqa: N803
+            session.emit(
+                blpapi.Event.RESPONSE,
+                [
+                    _message(_bdp_payload("A", {"PX_LAST": 1.0}), correlationId),
+                    _message(_bdp_payload("B", {"PX_LAST": 2.0}), correlationId),
+                ],
+            )
+
+        session.sendRequest = send_request
+
+        async def run():
+            await _connect(bq, session)
+            with patch.object(bq, "_create_request", return_value=request):
+                return await bq.bdp(["A", "B"], ["PX_LAST"])
+
+        df = asyncio.run(run())
+        assert df["security"].to_list() == ["A", "B"]
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [("start", ()), ("stop", ()), ("open_services", ()), ("subscribe", (["A"],))],
+    )
+    def test_blocking_methods_are_not_supported(self, method, args):
+        bq = AsyncBQuery()
+        with pytest.raises(NotImplementedError, match=f"{method}\\(\\) needs"):
+            getattr(bq, method)(*args)
+        with pytest.raises(NotImplementedError), bq:
+            pass
+
+    def test_unknown_correlation_ids_are_ignored(self):
+        bq = AsyncBQuery()
+        # Late messages of finished requests and status before start are no-ops
+        bq._dispatch_event(blpapi.Event.RESPONSE, [([999], "", {}, None)])
+        bq._on_async_session_status("SessionStarted")
+        assert bq._pending == {}
+        assert bq._session_started is None
+
+    def test_debug_saves_responses(self):
+        bq = AsyncBQuery(debug=True)
+        request = MagicMock()
+        session = FakeSession(bq, {request: [(blpapi.Event.RESPONSE, {"a": 1}, None)]})
+
+        async def run():
+            await _connect(bq, session)
+            with (
+                patch.object(bq, "_create_bsrch_request", return_value=request),
+                patch.object(bq, "_save_debug_responses") as save_mock,
+            ):
+                await bq.bsrch("FI:X")
+            return save_mock
+
+        save_mock = asyncio.run(run())
+        save_mock.assert_called_once_with([{"a": 1}])
@@ -0,0 +1,233 @@
+import threading
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from polars_bloomberg import BQuery
+from polars_bloomberg.plbbg import _BdhCache
+
+pytestmark = pytest.mark.no_bbg
+
+
+def _fake_history(  # noqa: PLR0913
+    securities, fields, start, end, overrides=None, options=None, *, errors=None
+):
+    """Daily history with weekdays only; value encodes security, field and day."""
+    rows = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            for sec in securities:
+                row = {"security": sec, "date": day}
+                for j, fld in enumerate(fields):
+                    row[fld] = float(100 * ord(sec[0]) + 10 * j + day.day)
+                rows.append(row)
+        day += timedelta(days=1)
+    schema = {"security": pl.Utf8, "date": pl.Date} | dict.fromkeys(fields, pl.Float64)
+    return pl.DataFrame(rows, schema=schema)
+
+
+class TestBdhCacheStore:
+    def test_missing_without_coverage_is_full_range(self, tmp_path):
+        cache = _BdhCache(tmp_path)
+        assert cache.missing("k", date(2024, 1, 1), date(2024, 1, 31)) == [
+            (date(2024, 1, 1), date(2024, 1, 31))
+        ]
+
+    def test_store_merges_coverage_and_reports_gaps(self, tmp_path):
+        cache = _BdhCache(tmp_path)
+        frame = pl.DataFrame({"date": [date(2024, 1, 10)], "value": [1.0]})
+        cache.store("k", frame, (date(2024, 1, 10), date(2024, 1, 15)))
+        cache.store("k", frame.clear(), (date(2024, 1, 16), date(2024, 1, 20)))
+        cache.store("k", frame.clear(), (date(2024, 1, 25), date(2024, 1, 26)))
+
+        assert cache.coverage("k") == [
+            (date(2024, 1, 10), date(2024, 1, 20)),
+            (date(2024, 1, 25), date(2024, 1, 26)),
+        ]
+        assert cache.missing("k", date(2024, 1, 1), date(2024, 1, 31)) == [
+            (date(2024, 1, 1), date(2024, 1, 9)),
+            (date(2024, 1, 21), date(2024, 1, 24)),
+            (date(2024, 1, 27), date(2024, 1, 31)),
+        ]
+        assert cache.missing("k", date(2024, 1, 11), date(2024, 1, 19)) == []
+        assert cache.missing("k", date(2024, 1, 22), date(2024, 1, 31)) == [
+            (date(2024, 1, 22), date(2024, 1, 24)),
+            (date(2024, 1, 27), date(2024, 1, 31)),
+        ]
+
+    def test_load_unknown_series_is_empty(self, tmp_path):
+        df = _BdhCache(tmp_path).load("k", date(2024, 1, 1), date(2024, 1, 31))
+        assert df.is_empty()
+        assert df.columns == ["date", "value"]
+
+    def test_store_replaces_values_of_same_date(self, tmp_path):
+        cache = _BdhCache(tmp_path)
+        cache.store(
+            "k",
+            pl.DataFrame(
+                {"date": [date(2024, 1, 1), date(2024, 1, 2)], "value": [1.0, 2.0]}
+            ),
+            None,
+        )
+        cache.store(
+            "k", pl.DataFrame({"date": [date(2024, 1, 2)], "value": [3.0]}), None
+        )
+
+        df = cache.load("k", date(2024, 1, 1), date(2024, 1, 31))
+        assert df["value"].to_list() == [1.0, 3.0]
+        assert cache.coverage("k") == []
+
+    def test_concurrent_stores_keep_all_rows_and_coverage(self, tmp_path):
+        days = [date(2024, 1, 1) + timedelta(days=i) for i in range(16)]
+        barrier = threading.Barrier(len(days))
+
+        def store(day):
+            cache = _BdhCache(tmp_path)  # instances share the series locks
+            barrier.wait()
+            cache.store("k", pl.DataFrame({"date": [day], "value": [1.0]}), (day, day))
+
+        threads = [threading.Thread(target=store, args=(day,)) for day in days]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        cache = _BdhCache(tmp_path)
+        assert cache.load("k", days[0], days[-1])["date"].to_list() == days
+        assert cache.coverage("k") == [(days[0], days[-1])]
+        assert not list(cache.root.glob("*.tmp"))
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        cache = _BdhCache(tmp_path)
+        frame = pl.DataFrame({"date": [date(2024, 1, 1)], "value": [1.0]})
+        cache.store("k", frame, None)
+
+        with (
+            patch.object(pl.DataFrame, "write_parquet", side_effect=OSError("full")),
+            pytest.raises(OSError, match="full"),
+        ):
+            cache.store("k", frame.with_columns(value=pl.lit(2.0)), None)
+
+        assert cache.load("k", date(2024, 1, 1), date(2024, 1, 1))["value"][0] == 1.0
+        assert not list(cache.root.glob("*.tmp"))
+
+    def test_key_depends_on_overrides_and_options(self):
+        base = _BdhCache.key("A", "PX_LAST", None, None)
+        assert base == _BdhCache.key("A", "PX_LAST", [], {})
+        assert base != _BdhCache.key("A", "PX_LAST", [("CRNCY", "EUR")], None)
+        assert base != _BdhCache.key("A", "PX_LAST", None, {"adjustmentSplit": True})
+
+
+class TestCachedBdh:
+    def test_second_call_is_served_from_cache(self, tmp_path):
+        bq = BQuery(cache_dir=tmp_path)
+        args = (["A", "B"], ["PX_LAST", "VOLUME"], date(2024, 1, 1), date(2024, 1, 31))
+
+        with patch.object(bq, "_fetch_bdh", side_effect=_fake_history) as fetch_mock:
+            first = bq.bdh(*args)
+            second = bq.bdh(*args)
+
+        fetch_mock.assert_called_once_with(
+            ["A", "B"],
+            ["PX_LAST", "VOLUME"],
+            date(2024, 1, 1),
+            date(2024, 1, 31),
+            None,
+            None,
+            errors=set(),
+        )
+        assert_frame_equal(first, _fake_history(*args).sort("security", "date"))
+        assert_frame_equal(second, first)
+
+    def test_non_daily_history_bypasses_cache(self, tmp_path):
+        bq = BQuery(cache_dir=tmp_path)
+        args = (["A"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 31))
+        options = {"periodicitySelection": "WEEKLY"}
+
+        with patch.object(bq, "_fetch_bdh", side_effect=_fake_history) as fetch_mock:
+            bq.bdh(*args, options=options)
+            bq.bdh(*args, options=options)
+
+        assert fetch_mock.call_count == 2
+        fetch_mock.assert_called_with(*args, None, options)
+        assert not list(bq._bdh_cache.root.iterdir())
+
+    def test_only_missing_ranges_are_requested(self, tmp_path):
+        bq = BQuery(cache_dir=tmp_path)
+
+        with patch.object(bq, "_fetch_bdh", side_effect=_fake_history) as fetch_mock:
+            bq.bdh(["A"], ["PX_LAST"], date(2024, 1, 10), date(2024, 1, 20))
+            df = bq.bdh(["A", "B"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 31))
+
+        requested = [call.args[:4] for call in fetch_mock.call_args_list[1:]]
+        assert requested == [
+            (["A"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 9)),
+            (["A"], ["PX_LAST"], date(2024, 1, 21), date(2024, 1, 31)),
+            (["B"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 31)),
+        ]
+        expected = _fake_history(
+            ["A", "B"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+        assert_frame_equal(df, expected.sort("security", "date"))
+
+    def test_today_is_requested_again(self, tmp_path):
+        bq = BQuery(cache_dir=tmp_path)
+        today = date.today()
+        start = today - timedelta(days=10)
+
+        with patch.object(bq, "_fetch_bdh", side_effect=_fake_history) as fetch_mock:
+            bq.bdh(["A"], ["PX_LAST"], start, today)
+            bq.bdh(["A"], ["PX_LAST"], start, today)
+
+        assert fetch_mock.call_args_list[1].args[2:4] == (today, today)
+
+    def test_series_with_errors_are_requested_again(self, tmp_path):
+        bq = BQuery(cache_dir=tmp_path)
+        args = (["A", "B"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 31))
+
+        def failing_history(*args, errors):
+            errors.add(("B", "PX_LAST"))  # e.g. a daily usage limit was hit
+            df = _fake_history(*args)
+            return df.filter(pl.col("security") != "B")
+
+        with patch.object(bq, "_fetch_bdh", side_effect=failing_history):
+            bq.bdh(*args)
+        with patch.object(bq, "_fetch_bdh", side_effect=_fake_history) as fetch_mock:
+            df = bq.bdh(*args)
+
+        assert [c.args[:2] for c in fetch_mock.call_args_list] == [(["B"], ["PX_LAST"])]
+        assert_frame_equal(df, _fake_history(*args).sort("security", "date"))
+
+    def test_duplicate_securities_keep_their_rows(self, tmp_path):
+        bq = BQuery(cache_dir=tmp_path)
+        args = (["PX_LAST", "VOLUME"], date(2024, 1, 1), date(2024, 1, 5))
+
+        with patch.object(bq, "_fetch_bdh", side_effect=_fake_history):
+            df = bq.bdh(["A", "B", "A"], *args)
+
+        single = _fake_history(["A"], *args)
+        expected = pl.concat([single, _fake_history(["B"], *args), single])
+        assert_frame_equal(df, expected)
+
+
+def test_parse_bdh_responses_collects_errors():
+    responses = [
+        {"securityData": {"security": "A", "securityError": {"message": "Unknown"}}},
+        {
+            "securityData": {
+                "security": "B",
+                "fieldExceptions": [{"fieldId": "VOLUME", "errorInfo": {}}],
+                "fieldData": [{"date": date(2024, 1, 2), "PX_LAST": 1.0}],
+            }
+        },
+    ]
+    errors = set()
+
+    columns = BQuery()._parse_bdh_responses(responses, ["PX_LAST", "VOLUME"], errors)
+
+    assert errors == {("A", "PX_LAST"), ("A", "VOLUME"), ("B", "VOLUME")}
+    assert columns["PX_LAST"] == [1.0]
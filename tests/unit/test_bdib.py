@@ -1,5 +1,5 @@
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -58,65 +58,38 @@ def test_parse_bdib_responses():
 
     result = bq._parse_bdib_responses(mock_responses, fallback_security="MSFT US Equity")
 
-    assert result == [
-        {
-            "security": "MSFT US Equity",
-            "time": first_bar_time,
-            "open": 370.0,
-            "high": 370.5,
-            "low": 369.8,
-            "close": 370.2,
-            "volume": 800,
-            "numEvents": 8,
-            "value": 296160.0,
-        },
-        {
-            "security": "MSFT US Equity",
-            "time": second_bar_time,
-            "open": 370.3,
-            "high": 371.0,
-            "low": 370.1,
-            "close": 370.9,
-            "volume": 600,
-            "numEvents": 6,
-            "value": 222540.0,
-        },
-    ]
+    assert result == {
+        "security": ["MSFT US Equity", "MSFT US Equity"],
+        "time": [first_bar_time, second_bar_time],
+        "open": [370.0, 370.3],
+        "high": [370.5, 371.0],
+        "low": [369.8, 370.1],
+        "close": [370.2, 370.9],
+        "volume": [800, 600],
+        "numEvents": [8, 6],
+        "value": [296160.0, 222540.0],
+    }
 
 
 def test_bdib_returns_dataframe():
     """bdib should build request, parse responses, and return a sorted DataFrame."""
     bq = BQuery()
     mock_request = MagicMock()
-    bar_rows = [
-        {
-            "security": "AAPL US Equity",
-            "time": datetime(2024, 1, 2, 9, 35),
-            "open": 189.5,
-            "high": 190.0,
-            "low": 189.4,
-            "close": 189.9,
-            "volume": 1200,
-            "numEvents": 10,
-            "value": 227400.0,
-        },
-        {
-            "security": "AAPL US Equity",
-            "time": datetime(2024, 1, 2, 9, 30),
-            "open": 189.0,
-            "high": 189.7,
-            "low": 188.9,
-            "close": 189.6,
-            "volume": 1500,
-            "numEvents": 12,
-            "value": 284400.0,
-        },
-    ]
+    bar_columns = {
+        "security": ["AAPL US Equity", "AAPL US Equity"],
+        "time": [datetime(2024, 1, 2, 9, 35), datetime(2024, 1, 2, 9, 30)],
+        "open": [189.5, 189.0],
+        "high": [190.0, 189.7],
+        "low": [189.4, 188.9],
+        "close": [189.9, 189.6],
+        "volume": [1200, 1500],
+        "numEvents": [10, 12],
+        "value": [227400.0, 284400.0],
+    }
 
     with (
         patch.object(bq, "_create_intraday_bar_request", return_value=mock_request),
-        patch.object(bq, "_send_request", return_value=["raw_response"]),
-        patch.object(bq, "_parse_bdib_responses", return_value=bar_rows),
+        patch.object(bq, "_stream_columns", return_value=[bar_columns]),
     ):
         df = bq.bdib(
             security="AAPL US Equity",
@@ -165,7 +138,7 @@ def test_bdib_uses_recorded_response():
 
     with (
         patch.object(bq, "_create_intraday_bar_request", return_value=mock_request),
-        patch.object(bq, "_send_request", return_value=payloads),
+        patch.object(bq, "_stream_requests", return_value=((0, p) for p in payloads)),
     ):
         df = bq.bdib(
             "OMX Index",
@@ -195,3 +168,103 @@ def test_bdib_uses_recorded_response():
     )
 
     assert_frame_equal(df, df_exp)
+
+
+def test_bdib_multiple_securities_sends_one_request_each():
+    bq = BQuery()
+
+    def stream_requests(requests):
+        # Answer in reverse order to mimic interleaved completion
+        for idx in reversed(range(len(requests))):
+            yield idx, {
+                "barData": {
+                    "barTickData": [
+                        {
+                            "time": datetime(2024, 1, 2, 9, 30 + 5 * k),
+                            "open": float(idx),
+                            "high": float(idx),
+                            "low": float(idx),
+                            "close": float(idx),
+                            "volume": 10,
+                            "numEvents": 1,
+                            "value": 0.0,
+                        }
+                        for k in (1, 0)
+                    ]
+                }
+            }
+
+    with (
+        patch.object(
+            bq,
+            "_create_intraday_bar_request",
+            side_effect=lambda **kwargs: kwargs["security"],
+        ) as create_mock,
+        patch.object(bq, "_stream_requests", side_effect=stream_requests) as send_mock,
+    ):
+        df = bq.bdib(
+            ["MSFT US Equity", "AAPL US Equity"],
+            event_type="TRADE",
+            interval=5,
+            start_datetime=datetime(2024, 1, 2, 9, 30),
+            end_datetime=datetime(2024, 1, 2, 9, 40),
+        )
+
+    assert create_mock.call_count == 2
+    send_mock.assert_called_once_with(["MSFT US Equity", "AAPL US Equity"])
+    assert df["security"].to_list() == ["AAPL US Equity"] * 2 + ["MSFT US Equity"] * 2
+    assert df["open"].to_list() == [1.0, 1.0, 0.0, 0.0]
+    assert (
+        df["time"].to_list()
+        == [
+            datetime(2024, 1, 2, 9, 30),
+            datetime(2024, 1, 2, 9, 35),
+        ]
+        * 2
+    )
+
+
+@pytest.mark.parametrize("interval", [0, -5])
+def test_bdib_rejects_non_positive_interval(interval):
+    bq = BQuery()
+    with (
+        patch.object(bq, "_create_intraday_bar_request") as create_mock,
+        pytest.raises(ValueError, match="interval must be at least 1"),
+    ):
+        bq.bdib("A", "TRADE", interval, datetime(2024, 1, 1), datetime(2024, 1, 2))
+    create_mock.assert_not_called()
+
+
+def test_bdib_splits_long_ranges_and_drops_boundary_duplicates():
+    bq = BQuery()
+
+    def stream_requests(requests):
+        for idx, (start, end) in enumerate(requests):
+            bars = []
+            bar_time = start
+            while bar_time <= end:
+                bars.append({"time": bar_time, "open": 1.0, "volume": 1})
+                bar_time += timedelta(days=1)
+            yield idx, {"barData": {"barTickData": bars}}
+
+    with (
+        patch("polars_bloomberg.plbbg._BDIB_BARS_PER_REQUEST", 2880),
+        patch.object(
+            bq,
+            "_create_intraday_bar_request",
+            side_effect=lambda **kw: (kw["start_datetime"], kw["end_datetime"]),
+        ) as create_mock,
+        patch.object(bq, "_stream_requests", side_effect=stream_requests),
+    ):
+        df = bq.bdib(
+            "AAPL US Equity",
+            event_type="TRADE",
+            interval=1,
+            start_datetime=datetime(2024, 1, 1),
+            end_datetime=datetime(2024, 1, 6),
+        )
+
+    # 2880 one-minute bars = 2 days per window
+    assert create_mock.call_count == 3
+    assert df["time"].to_list() == [datetime(2024, 1, d) for d in range(1, 7)]
+    assert df["security"].to_list() == ["AAPL US Equity"] * 6
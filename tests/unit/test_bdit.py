@@ -0,0 +1,197 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, call, patch
+
+import polars as pl
+import pytest
+
+from polars_bloomberg import BQuery
+
+pytestmark = pytest.mark.no_bbg
+
+
+def _tick(time, tick_type="TRADE", value=1.0, size=100, codes=None):
+    tick = {"time": time, "type": tick_type, "value": value, "size": size}
+    if codes is not None:
+        tick["conditionCodes"] = codes
+    return tick
+
+
+def test_parse_bdit_responses():
+    bq = BQuery()
+    first, second = datetime(2024, 1, 2, 14, 30), datetime(2024, 1, 2, 14, 30, 1)
+    responses = [
+        {"tickData": {"tickData": [{"tickData": _tick(first, codes="R6")}]}},
+        {"tickData": {"tickData": [_tick(second, "BID", 2.0, 50)]}},
+        {"tickData": {"eidData": []}},
+    ]
+
+    result = bq._parse_bdit_responses(responses, security="AAPL US Equity")
+
+    assert result == {
+        "security": ["AAPL US Equity"] * 2,
+        "time": [first, second],
+        "type": ["TRADE", "BID"],
+        "value": [1.0, 2.0],
+        "size": [100, 50],
+        "conditionCodes": ["R6", None],
+    }
+
+
+def test_create_intraday_tick_request():
+    bq = BQuery()
+    bq._services["//blp/refdata"] = service = MagicMock()
+    request = service.createRequest.return_value
+
+    bq._create_intraday_tick_request(
+        "AAPL US Equity",
+        ["TRADE", "BID"],
+        datetime(2024, 1, 2, 14, 30),
+        datetime(2024, 1, 2, 15, 30, tzinfo=UTC),
+        {"includeExchangeCodes": True},
+        True,
+    )
+
+    service.createRequest.assert_called_once_with("IntradayTickRequest")
+    assert request.append.call_args_list == [
+        call("eventTypes", "TRADE"),
+        call("eventTypes", "BID"),
+    ]
+    assert request.set.call_args_list == [
+        call("security", "AAPL US Equity"),
+        call("startDateTime", "2024-01-02T14:30:00"),
+        call("endDateTime", "2024-01-02T15:30:00Z"),
+        call("includeConditionCodes", True),
+        call("includeExchangeCodes", True),
+    ]
+
+
+def test_bdit_columns_and_multiple_securities():
+    bq = BQuery()
+    t0 = datetime(2024, 1, 2, 14, 30)
+
+    def stream_requests(requests):
+        for idx in reversed(range(len(requests))):
+            ticks = [_tick(t0 + timedelta(seconds=k), value=float(idx)) for k in (1, 0)]
+            yield idx, {"tickData": {"tickData": ticks}}
+
+    with (
+        patch.object(
+            bq, "_create_intraday_tick_request", side_effect=lambda sec, *a: sec
+        ),
+        patch.object(bq, "_stream_requests", side_effect=stream_requests) as send_mock,
+    ):
+        df = bq.bdit(
+            ["MSFT US Equity", "AAPL US Equity"],
+            ["TRADE"],
+            t0,
+            t0 + timedelta(minutes=5),
+        )
+
+    send_mock.assert_called_once_with(["MSFT US Equity", "AAPL US Equity"])
+    assert dict(df.schema) == {
+        "security": pl.Utf8,
+        "time": pl.Datetime("us", "UTC"),
+        "type": pl.Categorical,
+        "value": pl.Float64,
+        "size": pl.Int64,
+        "conditionCodes": pl.Utf8,
+    }
+    assert df["security"].to_list() == ["AAPL US Equity"] * 2 + ["MSFT US Equity"] * 2
+    assert df["value"].to_list() == [1.0, 1.0, 0.0, 0.0]
+    assert df["time"].to_list()[:2] == [
+        t0.replace(tzinfo=UTC),
+        (t0 + timedelta(seconds=1)).replace(tzinfo=UTC),
+    ]
+
+
+@pytest.mark.parametrize("tz", [None, UTC])
+def test_bdit_splits_windows_and_keeps_boundary_ticks_once(tz):
+    bq = BQuery()
+    start = datetime(2024, 1, 2, 14, 0, tzinfo=tz)
+
+    def stream_requests(requests):
+        for idx, (window_start, window_end) in enumerate(requests):
+            # Bloomberg includes ticks at both ends of a window
+            ticks = [_tick(window_start), _tick(window_end)]
+            yield idx, {"tickData": {"tickData": ticks}}
+
+    with (
+        patch.object(
+            bq,
+            "_create_intraday_tick_request",
+            side_effect=lambda sec, types, start, end, *a: (start, end),
+        ) as create_mock,
+        patch.object(bq, "_stream_requests", side_effect=stream_requests),
+    ):
+        df = bq.bdit(
+            "AAPL US Equity",
+            ["TRADE"],
+            start,
+            start + timedelta(hours=2, minutes=30),
+            window=timedelta(hours=1),
+        )
+
+    assert create_mock.call_count == 3
+    expected = [
+        datetime(2024, 1, 2, 14, 0, tzinfo=UTC),
+        datetime(2024, 1, 2, 15, 0, tzinfo=UTC),
+        datetime(2024, 1, 2, 16, 0, tzinfo=UTC),
+        datetime(2024, 1, 2, 16, 30, tzinfo=UTC),
+    ]
+    assert df["time"].to_list() == expected
+
+
+def test_bdit_without_ticks():
+    bq = BQuery()
+    with (
+        patch.object(bq, "_create_intraday_tick_request"),
+        patch.object(bq, "_stream_requests", return_value=iter([])),
+    ):
+        df = bq.bdit("AAPL US Equity", ["TRADE"], "2024-01-02T14:00", "2024-01-02")
+    assert df.is_empty()
+    assert df.columns == ["security", "time", "type", "value", "size", "conditionCodes"]
+
+
+def test_bdit_adds_columns_for_option_flags():
+    bq = BQuery()
+    t0 = datetime(2024, 1, 2, 14, 30)
+    tick = _tick(t0) | {"exchangeCode": "Q", "brokerBuyCode": "GS"}
+
+    with (
+        patch.object(bq, "_create_intraday_tick_request"),
+        patch.object(
+            bq,
+            "_stream_requests",
+            return_value=iter([(0, {"tickData": {"tickData": [tick]}})]),
+        ),
+    ):
+        df = bq.bdit(
+            "AAPL US Equity",
+            ["TRADE"],
+            t0,
+            t0 + timedelta(minutes=5),
+            options={"includeExchangeCodes": True, "includeBrokerCodes": True},
+        )
+
+    assert df.columns[6:] == ["exchangeCode", "brokerBuyCode", "brokerSellCode"]
+    assert df.row(0, named=True)["exchangeCode"] == "Q"
+    assert df.row(0, named=True)["brokerBuyCode"] == "GS"
+    assert df.row(0, named=True)["brokerSellCode"] is None
+    assert df.schema["brokerSellCode"] == pl.Utf8
+
+
+@pytest.mark.parametrize("window", [timedelta(0), timedelta(minutes=-1)])
+def test_bdit_rejects_non_positive_window(window):
+    bq = BQuery()
+    with (
+        patch.object(bq, "_create_intraday_tick_request") as create_mock,
+        pytest.raises(ValueError, match="window must be positive"),
+    ):
+        bq.bdit(
+            "AAPL US Equity",
+            ["TRADE"],
+            datetime(2024, 1, 2, 14),
+            datetime(2024, 1, 2, 15),
+            window=window,
+        )
+    create_mock.assert_not_called()
@@ -14,23 +14,26 @@ def test_bdh_leading_nulls():
     """Test on dataset with leading nulls in a field."""
     bq = BQuery()
 
+    with open("tests/data/bdh/bdh_data_leading_nulls.yaml") as f:
+        rows = yaml.safe_load(f)
+    mock_data = {col: [row[col] for row in rows] for col in rows[0]}
+
     with (
         patch.object(bq, "_create_request", return_value=MagicMock()),
-        patch.object(bq, "_send_request", return_value="mocked_responses"),
+        patch.object(bq, "_stream_columns", return_value=[mock_data]),
     ):
-        with open("tests/data/bdh/bdh_data_leading_nulls.yaml") as f:
-            mock_data = yaml.safe_load(f)
-
-        with patch.object(bq, "_parse_bdh_responses", return_value=mock_data):
-            df = bq.bdh(
-                ["BFGHICE LX Equity", "I00185US Index"],
-                ["BX115", "BX213", "PX_LAST"],
-                start_date=date(2024, 8, 1),
-                end_date=date(2025, 1, 10),
-            )
+        df = bq.bdh(
+            ["BFGHICE LX Equity", "I00185US Index"],
+            ["BX115", "BX213", "PX_LAST"],
+            start_date=date(2024, 8, 1),
+            end_date=date(2025, 1, 10),
+        )
 
     assert isinstance(df, pl.DataFrame)
     assert df.shape == (222, 5)
+    assert df.schema["date"] == pl.Date
+    assert df.schema["PX_LAST"] == pl.Float64
+    assert df.schema["BX115"] == pl.Float64
 
 
 def test_parse_bdp_responses():
@@ -49,10 +52,11 @@ def test_parse_bdp_responses():
             ]
         }
     ]
-    expected_output = [
-        {"security": "IBM US Equity", "PX_LAST": 125.32, "DS002": 0.85},
-        {"security": "AAPL US Equity", "PX_LAST": 150.75, "DS002": 1.10},
-    ]
+    expected_output = {
+        "security": ["IBM US Equity", "AAPL US Equity"],
+        "PX_LAST": [125.32, 150.75],
+        "DS002": [0.85, 1.10],
+    }
 
     result = bq._parse_bdp_responses(mock_responses, fields=["PX_LAST", "DS002"])
     assert result == expected_output
@@ -80,46 +84,78 @@ def test_parse_bdh_responses():
             }
         },
     ]
-    expected_output = [
-        {
-            "security": "IBM US Equity",
-            "date": "2023-01-01",
-            "PX_LAST": 125.32,
-            "VOLUME": 1000000,
-        },
-        {
-            "security": "IBM US Equity",
-            "date": "2023-01-02",
-            "PX_LAST": 126.50,
-            "VOLUME": 1100000,
-        },
-        {
-            "security": "AAPL US Equity",
-            "date": "2023-01-01",
-            "PX_LAST": 150.75,
-            "VOLUME": 2000000,
-        },
-        {
-            "security": "AAPL US Equity",
-            "date": "2023-01-02",
-            "PX_LAST": 151.20,
-            "VOLUME": 2100000,
-        },
-    ]
+    expected_output = {
+        "security": [
+            "IBM US Equity",
+            "IBM US Equity",
+            "AAPL US Equity",
+            "AAPL US Equity",
+        ],
+        "date": ["2023-01-01", "2023-01-02", "2023-01-01", "2023-01-02"],
+        "PX_LAST": [125.32, 126.50, 150.75, 151.20],
+        "VOLUME": [1000000, 1100000, 2000000, 2100000],
+    }
 
     result = bq._parse_bdh_responses(mock_responses, fields=["PX_LAST", "VOLUME"])
     assert result == expected_output
 
 
+def test_bdh_builds_typed_frame_from_columns():
+    bq = BQuery()
+    columns = {
+        "security": ["IBM US Equity", "IBM US Equity"],
+        "date": [date(2023, 1, 2), date(2023, 1, 3)],
+        "PX_LAST": [None, 126.5],
+        "NAME": ["IBM", "IBM"],
+        "EMPTY": [None, None],
+    }
+
+    with (
+        patch.object(bq, "_create_request", return_value=MagicMock()),
+        patch.object(bq, "_stream_columns", return_value=[columns]),
+    ):
+        df = bq.bdh(
+            ["IBM US Equity"],
+            ["PX_LAST", "NAME", "EMPTY"],
+            start_date=date(2023, 1, 2),
+            end_date=date(2023, 1, 3),
+        )
+
+    assert df.schema == pl.Schema(
+        {
+            "security": pl.Utf8,
+            "date": pl.Date,
+            "PX_LAST": pl.Float64,
+            "NAME": pl.Utf8,
+            "EMPTY": pl.Null,
+        }
+    )
+    assert df["PX_LAST"].to_list() == [None, 126.5]
+
+
+def test_frame_from_columns_keeps_values_of_mixed_types():
+    df = BQuery()._frame_from_columns(
+        {"PX_LAST": [1, 2.5], "CODE": [1, "X"], "VOLUME": [1, None]}
+    )
+    assert df["PX_LAST"].to_list() == [1.0, 2.5]
+    assert df["CODE"].to_list() == ["1", "X"]
+    assert df.schema["VOLUME"] == pl.Int64
+
+
 def test_bdp_calls_components():
     bq = BQuery()
     mock_request = MagicMock()
-    parsed = [{"security": "IBM US Equity", "PX_LAST": 123.4}]
+
+    def parse(responses, fields, errors=None):
+        n = len(list(responses))
+        return {"security": ["IBM US Equity"] * n, "PX_LAST": [123.4] * n}
 
     with (
         patch.object(bq, "_create_request", return_value=mock_request) as create_mock,
-        patch.object(bq, "_send_request", return_value=["raw"]) as send_mock,
-        patch.object(bq, "_parse_bdp_responses", return_value=parsed) as parse_mock,
+        patch.object(
+            bq, "_stream_requests", return_value=iter([(0, "raw")])
+        ) as send_mock,
+        patch.object(bq, "_parse_bdp_responses", side_effect=parse) as parse_mock,
     ):
         df = bq.bdp(["IBM US Equity"], ["PX_LAST"])
 
@@ -129,5 +165,288 @@ def test_bdp_calls_components():
     create_mock.assert_called_once_with(
         "ReferenceDataRequest", ["IBM US Equity"], ["PX_LAST"], None, None
     )
-    send_mock.assert_called_once_with(mock_request)
-    parse_mock.assert_called_once_with(["raw"], ["PX_LAST"])
+    send_mock.assert_called_once_with([mock_request])
+    parse_mock.assert_called_with(("raw",), ["PX_LAST"], None)
+
+
+def test_parse_bdp_responses_consumes_stream_lazily():
+    bq = BQuery()
+    seen = []
+
+    def stream():
+        for security, px in (("IBM US Equity", 125.32), ("AAPL US Equity", None)):
+            seen.append(security)
+            yield {
+                "securityData": [
+                    {"security": security, "fieldData": {"PX_LAST": px} if px else {}}
+                ]
+            }
+
+    result = bq._parse_bdp_responses(stream(), fields=["PX_LAST"])
+
+    assert seen == ["IBM US Equity", "AAPL US Equity"]
+    assert result == {
+        "security": ["IBM US Equity", "AAPL US Equity"],
+        "PX_LAST": [125.32, None],
+    }
+
+
+def test_plan_chunks_splits_securities_and_fields():
+    bq = BQuery(securities_per_request=2, fields_per_request=2)
+
+    plan = bq._plan_chunks("ReferenceDataRequest", ["A", "B", "C"], ["F1", "F2", "F3"])
+
+    assert plan == [
+        (["A", "B"], ["F1", "F2"]),
+        (["A", "B"], ["F3"]),
+        (["C"], ["F1", "F2"]),
+        (["C"], ["F3"]),
+    ]
+
+
+def test_plan_chunks_uses_bloomberg_field_limits():
+    bq = BQuery()
+    fields = [f"F{i}" for i in range(30)]
+
+    bdp_plan = bq._plan_chunks("ReferenceDataRequest", ["A"], fields)
+    bdh_plan = bq._plan_chunks("HistoricalDataRequest", ["A"], fields)
+
+    assert bdp_plan == [(["A"], fields)]
+    assert [len(flds) for _, flds in bdh_plan] == [25, 5]
+
+
+def test_plan_chunks_empty_inputs():
+    bq = BQuery()
+    assert bq._plan_chunks("ReferenceDataRequest", [], ["PX_LAST"]) == [
+        ([], ["PX_LAST"])
+    ]
+
+
+def _fake_stream_requests(stream):
+    """Replace BQuery._stream_requests by a per-request fake response stream."""
+
+    def stream_requests(requests):
+        for idx, request in enumerate(requests):
+            for response in stream(request):
+                yield idx, response
+
+    return stream_requests
+
+
+def _reference_stream(request):
+    """Fake ReferenceDataResponse payloads for a (securities, fields) request."""
+    securities, fields = request
+    values = {"PX_LAST": 1.5, "NAME": "n", "CRNCY": "USD"}
+    yield {
+        "securityData": [
+            {"security": sec, "fieldData": {f: values[f] for f in fields}}
+            for sec in securities
+        ]
+    }
+
+
+def test_bdp_merges_chunks_in_request_order():
+    bq = BQuery(securities_per_request=2, fields_per_request=2)
+
+    with (
+        patch.object(
+            bq, "_create_request", side_effect=lambda _, s, f, *__: (s, f)
+        ) as create_mock,
+        patch.object(
+            bq, "_stream_requests", side_effect=_fake_stream_requests(_reference_stream)
+        ),
+    ):
+        df = bq.bdp(["C", "A", "B"], ["PX_LAST", "NAME", "CRNCY"])
+
+    assert create_mock.call_count == 4
+    assert df.columns == ["security", "PX_LAST", "NAME", "CRNCY"]
+    assert df["security"].to_list() == ["C", "A", "B"]
+    assert df["CRNCY"].to_list() == ["USD"] * 3
+    assert df.schema["PX_LAST"] == pl.Float64
+
+
+def test_bdp_duplicate_securities_with_field_batches():
+    bq = BQuery(fields_per_request=1)
+
+    with (
+        patch.object(bq, "_create_request", side_effect=lambda _, s, f, *__: (s, f)),
+        patch.object(
+            bq, "_stream_requests", side_effect=_fake_stream_requests(_reference_stream)
+        ) as send_mock,
+    ):
+        df = bq.bdp(["A", "B", "A"], ["PX_LAST", "NAME"])
+
+    (requests,) = send_mock.call_args.args
+    assert requests == [(["A", "B"], ["PX_LAST"]), (["A", "B"], ["NAME"])]
+    assert df.rows() == [("A", 1.5, "n"), ("B", 1.5, "n"), ("A", 1.5, "n")]
+
+
+def test_bdh_chunks_fields_and_aligns_dates():
+    bq = BQuery(fields_per_request=1)
+    history = {
+        "PX_LAST": {"B": [1, 2], "A": [2, 3]},
+        "VOLUME": {"B": [2, 3], "A": [1]},
+    }
+
+    def stream(request):
+        securities, fields = request.chunk
+        (field,) = fields
+        for sec in securities:
+            yield {
+                "securityData": {
+                    "security": sec,
+                    "fieldData": [
+                        {"date": date(2024, 1, day), field: float(day)}
+                        for day in history[field][sec]
+                    ],
+                }
+            }
+
+    with (
+        patch.object(
+            bq,
+            "_create_request",
+            side_effect=lambda _, s, f, *__: MagicMock(chunk=(s, f)),
+        ),
+        patch.object(bq, "_stream_requests", side_effect=_fake_stream_requests(stream)),
+    ):
+        df = bq.bdh(
+            ["B", "A"],
+            ["PX_LAST", "VOLUME"],
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 3),
+        )
+
+    assert df.columns == ["security", "date", "PX_LAST", "VOLUME"]
+    assert df["security"].to_list() == ["B", "B", "B", "A", "A", "A"]
+    assert df["date"].dt.day().to_list() == [1, 2, 3, 1, 2, 3]
+    assert df["PX_LAST"].to_list() == [1.0, 2.0, None, None, 2.0, 3.0]
+    assert df["VOLUME"].to_list() == [None, 2.0, 3.0, 1.0, None, None]
+
+    with (
+        patch.object(
+            bq,
+            "_create_request",
+            side_effect=lambda _, s, f, *__: MagicMock(chunk=(s, f)),
+        ),
+        patch.object(bq, "_stream_requests", side_effect=_fake_stream_requests(stream)),
+    ):
+        dup = bq.bdh(
+            ["A", "A"], ["PX_LAST", "VOLUME"], date(2024, 1, 1), date(2024, 1, 3)
+        )
+    assert dup.height == 6
+    assert dup.slice(0, 3).equals(dup.slice(3, 3))
+
+
+_KEYED_CALLS = [
+    ("bdp", (["A"], ["PX_LAST"])),
+    ("bdh", (["A"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 2))),
+    ("bdib", ("A", "TRADE", 5, "2024-01-02T09:30", "2024-01-02T10:00")),
+    ("bdit", ("A", ["TRADE"], "2024-01-02T09:30", "2024-01-02T10:00")),
+]
+
+
+@pytest.mark.parametrize(("method", "args"), _KEYED_CALLS)
+def test_lazy_returns_lazyframe(method, args):
+    bq = BQuery()
+    df = pl.DataFrame({"security": ["A"], "PX_LAST": [1.0]})
+    with (
+        patch.object(bq, "_service"),
+        patch.object(bq, "_run_query", return_value=df),
+    ):
+        result = getattr(bq, method)(*args, lazy=True)
+        eager = getattr(bq, method)(*args)
+
+    assert isinstance(result, pl.LazyFrame)
+    assert result.filter(pl.col("PX_LAST") > 0).collect().equals(df)
+    assert eager is df
+
+
+@pytest.mark.parametrize(("method", "args"), _KEYED_CALLS)
+def test_categorical_keys(method, args):
+    bq = BQuery(categorical_keys=True)
+    df = pl.DataFrame({"security": ["A", "B", "A"], "PX_LAST": [1.0, 2.0, 3.0]})
+    with (
+        patch.object(bq, "_service"),
+        patch.object(bq, "_run_query", return_value=df),
+    ):
+        eager = getattr(bq, method)(*args)
+        lazy = getattr(bq, method)(*args, lazy=True).collect()
+
+    for result in (eager, lazy):
+        assert result["security"].dtype == pl.Categorical
+        assert result["security"].to_list() == ["A", "B", "A"]
+    # Categorical keys of separate calls join without casting
+    joined = eager.join(lazy, on="security", how="inner")
+    assert joined.height == 5
+
+
+def test_bsrch_lazy_returns_lazyframe():
+    bq = BQuery()
+    df = pl.DataFrame({"id": ["A Corp"]})
+    with (
+        patch.object(bq, "_create_bsrch_request"),
+        patch.object(bq, "_stream_request", return_value=iter([])),
+        patch.object(bq, "_parse_bsrch_responses", return_value=df),
+    ):
+        result = bq.bsrch("FI:X", lazy=True)
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect().equals(df)
+
+
+def test_bdh_wide():
+    bq = BQuery()
+    df = pl.DataFrame(
+        {
+            "security": ["A", "A", "B", "B"],
+            "date": [
+                date(2024, 1, 3),
+                date(2024, 1, 4),
+                date(2024, 1, 2),
+                date(2024, 1, 4),
+            ],
+            "PX_LAST": [1.0, 2.0, 3.0, 4.0],
+            "VOLUME": [10, None, 30, 40],
+        }
+    )
+    with patch.object(bq, "_fetch_bdh", return_value=df):
+        frames = bq.bdh(
+            ["B", "A", "C"],
+            ["PX_LAST", "VOLUME"],
+            date(2024, 1, 1),
+            date(2024, 1, 5),
+            wide=True,
+        )
+
+    assert list(frames) == ["PX_LAST", "VOLUME"]
+    px = frames["PX_LAST"]
+    assert dict(px.schema) == {
+        "date": pl.Date,
+        "B": pl.Float64,
+        "A": pl.Float64,
+        "C": pl.Float64,
+    }
+    assert px["date"].to_list() == [date(2024, 1, d) for d in (2, 3, 4)]
+    assert px["B"].to_list() == [3.0, None, 4.0]
+    assert px["A"].to_list() == [None, 1.0, 2.0]
+    assert px["C"].to_list() == [None, None, None]
+    assert frames["VOLUME"]["A"].to_list() == [None, 10, None]
+    assert frames["VOLUME"]["B"].dtype == pl.Int64
+
+    expected = df.pivot(on="security", index="date", values="PX_LAST").sort("date")
+    assert px.select("date", "A", "B").equals(expected.select("date", "A", "B"))
+
+
+def test_bdh_wide_lazy_and_empty():
+    bq = BQuery()
+    df = pl.DataFrame(
+        {"security": [], "date": [], "PX_LAST": []},
+        schema={"security": pl.Utf8, "date": pl.Date, "PX_LAST": pl.Float64},
+    )
+    with patch.object(bq, "_fetch_bdh", return_value=df):
+        frames = bq.bdh(
+            ["A"], ["PX_LAST"], date(2024, 1, 1), date(2024, 1, 5), lazy=True, wide=True
+        )
+    assert isinstance(frames["PX_LAST"], pl.LazyFrame)
+    assert frames["PX_LAST"].collect().columns == ["date", "A"]
+    assert frames["PX_LAST"].collect().is_empty()
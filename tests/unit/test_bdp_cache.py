@@ -0,0 +1,167 @@
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from polars_bloomberg import BQuery
+from polars_bloomberg.plbbg import _BdpCache
+
+pytestmark = pytest.mark.no_bbg
+
+
+def _fake_reference(securities, fields, overrides=None, options=None, *, errors=None):
+    """Reference data where each value encodes security and field."""
+    data = {"security": securities}
+    for fld in fields:
+        data[fld] = [f"{sec}/{fld}" for sec in securities]
+    return pl.DataFrame(data)
+
+
+class TestBdpCacheStore:
+    def test_get_returns_stored_value(self):
+        cache = _BdpCache(ttl=60, maxsize=10)
+        cache.put(("A", "NAME", "[]", "{}"), None, 60)
+        assert cache.get(("A", "NAME", "[]", "{}")) == (None,)
+        assert cache.get(("B", "NAME", "[]", "{}")) is None
+
+    def test_expired_entry_is_a_miss(self):
+        cache = _BdpCache(ttl=60, maxsize=10)
+        with patch("polars_bloomberg.plbbg.time.monotonic", return_value=100.0):
+            cache.put("k", 1.0, 60)
+        with patch("polars_bloomberg.plbbg.time.monotonic", return_value=159.0):
+            assert cache.get("k") == (1.0,)
+        with patch("polars_bloomberg.plbbg.time.monotonic", return_value=160.0):
+            assert cache.get("k") is None
+        assert len(cache._entries) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = _BdpCache(ttl=60, maxsize=2)
+        cache.put("a", 1, 60)
+        cache.put("b", 2, 60)
+        cache.get("a")
+        cache.put("c", 3, 60)
+        assert cache.get("b") is None
+        assert cache.get("a") == (1,)
+        assert cache.get("c") == (3,)
+
+    def test_field_ttl(self):
+        assert _BdpCache(ttl=30, maxsize=1).field_ttl("PX_LAST") == 30
+        per_field = _BdpCache(ttl={"NAME": 3600, "PX_LAST": 0}, maxsize=1)
+        assert per_field.field_ttl("NAME") == 3600
+        assert per_field.field_ttl("PX_LAST") is None
+        assert per_field.field_ttl("CRNCY") is None
+
+    def test_clear(self):
+        cache = _BdpCache(ttl=60, maxsize=10)
+        cache.put("a", 1, 60)
+        cache.clear()
+        assert cache.get("a") is None
+
+
+class TestCachedBdp:
+    def test_only_live_fields_are_refetched(self):
+        bq = BQuery(bdp_ttl={"NAME": 3600, "CRNCY": 3600})
+        securities = ["A", "B"]
+        fields = ["NAME", "PX_LAST", "CRNCY"]
+
+        with patch.object(bq, "_fetch_bdp", side_effect=_fake_reference) as fetch_mock:
+            first = bq.bdp(securities, fields)
+            second = bq.bdp(securities, fields)
+
+        assert [c.args[:2] for c in fetch_mock.call_args_list] == [
+            (["A", "B"], ["NAME", "PX_LAST", "CRNCY"]),
+            (["A", "B"], ["PX_LAST"]),
+        ]
+        assert_frame_equal(first, _fake_reference(securities, fields))
+        assert_frame_equal(second, first)
+
+    def test_misses_are_grouped_by_missing_fields(self):
+        bq = BQuery(bdp_ttl=60)
+
+        with patch.object(bq, "_fetch_bdp", side_effect=_fake_reference) as fetch_mock:
+            bq.bdp(["A"], ["NAME"])
+            bq.bdp(["B"], ["CRNCY"])
+            df = bq.bdp(["A", "B", "C"], ["NAME", "CRNCY"])
+
+        assert [c.args[:2] for c in fetch_mock.call_args_list[2:]] == [
+            (["A"], ["CRNCY"]),
+            (["B"], ["NAME"]),
+            (["C"], ["NAME", "CRNCY"]),
+        ]
+        assert_frame_equal(df, _fake_reference(["A", "B", "C"], ["NAME", "CRNCY"]))
+
+    def test_overrides_are_part_of_the_key(self):
+        bq = BQuery(bdp_ttl=60)
+
+        with patch.object(bq, "_fetch_bdp", side_effect=_fake_reference) as fetch_mock:
+            bq.bdp(["A"], ["NAME"])
+            bq.bdp(["A"], ["NAME"], overrides=[("EQY_FUND_CRNCY", "EUR")])
+
+        assert fetch_mock.call_count == 2
+
+    def test_duplicate_securities_keep_their_rows(self):
+        bq = BQuery(bdp_ttl=60)
+
+        with patch.object(bq, "_fetch_bdp", side_effect=_fake_reference) as fetch_mock:
+            df = bq.bdp(["A", "B", "A"], ["NAME"])
+
+        fetch_mock.assert_called_once_with(
+            ["A", "B"], ["NAME"], None, None, errors=set()
+        )
+        assert_frame_equal(df, _fake_reference(["A", "B", "A"], ["NAME"]))
+
+    def test_securities_not_returned_are_dropped(self):
+        bq = BQuery(bdp_ttl=60)
+
+        def fetch(securities, fields, overrides=None, options=None, *, errors=None):
+            return _fake_reference([s for s in securities if s != "BAD"], fields)
+
+        with patch.object(bq, "_fetch_bdp", side_effect=fetch):
+            df = bq.bdp(["A", "BAD"], ["NAME"])
+
+        assert df["security"].to_list() == ["A"]
+
+    def test_without_ttl_bdp_is_not_cached(self):
+        bq = BQuery()
+        with patch.object(bq, "_fetch_bdp", side_effect=_fake_reference) as fetch_mock:
+            bq.bdp(["A"], ["NAME"])
+            bq.bdp(["A"], ["NAME"])
+        assert fetch_mock.call_count == 2
+
+    def test_values_with_errors_are_not_cached(self):
+        bq = BQuery(bdp_ttl=60)
+        security_data = {
+            "A": {
+                "security": "A",
+                "fieldData": {"NAME": "Alpha"},
+                "fieldExceptions": [
+                    {"fieldId": "CRNCY", "errorInfo": {"category": "NO_AUTH"}}
+                ],
+            },
+            "B": {"security": "B", "fieldData": {}, "securityError": {"code": 15}},
+        }
+
+        def stream_requests(requests):
+            (securities,) = requests
+            yield 0, {"securityData": [security_data[sec] for sec in securities]}
+
+        with (
+            patch.object(bq, "_create_request", side_effect=lambda kind, secs, *a: secs),
+            patch.object(
+                bq, "_stream_requests", side_effect=stream_requests
+            ) as stream_mock,
+        ):
+            first = bq.bdp(["A", "B"], ["NAME", "CRNCY"])
+            second = bq.bdp(["A", "B"], ["NAME", "CRNCY"])
+
+        assert [c.args for c in stream_mock.call_args_list] == [
+            ([["A", "B"]],),
+            ([["A"]],),
+            ([["B"]],),
+        ]
+        assert first["NAME"].to_list() == ["Alpha", None]
+        assert_frame_equal(second, first)
+        assert bq._bdp_cache.lookup("A", "NAME", None, None) == ("Alpha",)
+        assert bq._bdp_cache.lookup("A", "CRNCY", None, None) is None
+        assert bq._bdp_cache.lookup("B", "NAME", None, None) is None
@@ -0,0 +1,166 @@
+import asyncio
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from polars_bloomberg import AsyncBQuery, BqlResult, BQuery
+
+pytestmark = pytest.mark.no_bbg
+
+
+def _bql_response(ids, values):
+    return {
+        "results": {
+            "px_last": {
+                "idColumn": {"values": ids, "type": "STRING"},
+                "valuesColumn": {"values": values, "type": "DOUBLE"},
+                "secondaryColumns": [],
+            }
+        }
+    }
+
+
+class TestBqlMany:
+    def test_results_in_input_order(self):
+        bq = BQuery()
+
+        def stream_requests(requests, completed):
+            # Completion order differs from input order; 1 is replayed once
+            yield 1, _bql_response(["stale"], [0.0])
+            yield 1, None
+            yield 2, {"responseExceptions": [{"message": "Unknown function"}]}
+            completed.append(2)
+            yield 1, _bql_response(["B"], [2.0])
+            completed.append(1)
+            yield 0, _bql_response(["A"], [1.0])
+            # Finished queries are parsed before the next response is handled
+            assert parse.call_count == 2
+            completed.append(0)
+
+        with (
+            patch.object(bq, "_create_bql_request", side_effect=lambda e: e),
+            patch.object(bq, "_stream_requests", side_effect=stream_requests) as send,
+            patch.object(bq, "_bql_result", wraps=bq._bql_result) as parse,
+        ):
+            results = bq.bql_many(["q0", "q1", "bad"])
+
+        send.assert_called_once_with(["q0", "q1", "bad"], completed=[])
+        assert [r.combine().to_dicts() for r in results[:2]] == [
+            [{"ID": "A", "px_last": 1.0}],
+            [{"ID": "B", "px_last": 2.0}],
+        ]
+        assert len(results[2]) == 0
+
+    def test_async_bounds_concurrency(self):
+        bq = AsyncBQuery(max_in_flight=2)
+        running = []
+        peak = 0
+
+        async def bql(expression):
+            nonlocal peak
+            running.append(expression)
+            peak = max(peak, len(running))
+            await asyncio.sleep(0)
+            running.remove(expression)
+            return expression
+
+        with patch.object(bq, "bql", side_effect=bql):
+            results = asyncio.run(bq.bql_many([f"q{i}" for i in range(5)]))
+
+        assert results == [f"q{i}" for i in range(5)]
+        assert peak == 2
+
+
+class TestBqlChunked:
+    def test_chunks_run_concurrently_and_tables_are_concatenated(self, caplog):
+        bq = BQuery()
+        chunk_results = [
+            BqlResult(
+                [pl.DataFrame({"ID": ["A", "B"], "px": [1, 2]})],
+                ["px"],
+            ),
+            BqlResult([], []),  # failed chunk
+            BqlResult([pl.DataFrame({"ID": ["E"], "px": [5.5]})], ["px"]),
+        ]
+
+        with (
+            caplog.at_level("WARNING"),
+            patch.object(bq, "bql_many", return_value=chunk_results) as many,
+        ):
+            result = bq.bql_chunked("get(px) for({universe})", list("ABCDE"), 2)
+
+        many.assert_called_once_with(
+            [
+                "get(px) for(['A', 'B'])",
+                "get(px) for(['C', 'D'])",
+                "get(px) for(['E'])",
+            ]
+        )
+        assert result.names == ["px"]
+        assert result[0].to_dict(as_series=False) == {
+            "ID": ["A", "B", "E"],
+            "px": [1.0, 2.0, 5.5],
+        }
+        assert "no data for 1 of 3 chunks: [1]" in caplog.text
+
+    def test_several_data_items(self):
+        results = [
+            BqlResult(
+                [
+                    pl.DataFrame({"ID": [i], "a": [1]}),
+                    pl.DataFrame({"ID": [i], "b": [2]}),
+                ],
+                ["a", "b"],
+            )
+            for i in ("X", "Y")
+        ]
+        combined = BQuery._concat_bql_results(results)
+        assert combined.names == ["a", "b"]
+        assert combined.combine().to_dicts() == [
+            {"ID": "X", "a": 1, "b": 2},
+            {"ID": "Y", "a": 1, "b": 2},
+        ]
+
+    def test_chunks_with_different_secondary_columns(self):
+        results = [
+            BqlResult(
+                [pl.DataFrame({"ID": ["A"], "px": [1.0], "CURRENCY": ["USD"]})],
+                ["px"],
+            ),
+            BqlResult([pl.DataFrame({"ID": ["B"], "px": [2]})], ["px"]),
+        ]
+        combined = BQuery._concat_bql_results(results)
+        assert combined[0].to_dict(as_series=False) == {
+            "ID": ["A", "B"],
+            "px": [1.0, 2.0],
+            "CURRENCY": ["USD", None],
+        }
+
+    def test_ids_with_quotes(self):
+        expressions = BQuery._chunk_bql_expressions(
+            "for({universe})", ["A", "O'NEIL US Equity"], 10
+        )
+        assert expressions == ["""for(['A', "O'NEIL US Equity"])"""]
+
+    @pytest.mark.parametrize(
+        ("template", "ids", "chunk_size", "message"),
+        [
+            ("get(px) for(['A'])", ["A"], 10, "placeholder"),
+            ("get(px) for({universe})", ["A"], 0, "chunk_size"),
+            ("get(px) for({universe})", ["""A'"B"""], 10, "both quote types"),
+        ],
+    )
+    def test_invalid_arguments(self, template, ids, chunk_size, message):
+        with pytest.raises(ValueError, match=message):
+            BQuery().bql_chunked(template, ids, chunk_size)
+
+    def test_async(self):
+        bq = AsyncBQuery()
+
+        async def bql_many(expressions):
+            return [BqlResult([pl.DataFrame({"ID": [e]})], ["id"]) for e in expressions]
+
+        with patch.object(bq, "bql_many", side_effect=bql_many):
+            result = asyncio.run(bq.bql_chunked("{universe}", ["A", "B"], 1))
+        assert result[0]["ID"].to_list() == ["['A']", "['B']"]
@@ -1,5 +1,6 @@
 import json
 import logging
+import sys
 from datetime import date
 from unittest.mock import MagicMock, patch
 
@@ -7,7 +8,7 @@ import polars as pl
 import pytest
 import yaml
 
-from polars_bloomberg import BQuery
+from polars_bloomberg import BQuery, plbbg
 from polars_bloomberg.plbbg import BqlResult, SITable
 
 pytestmark = pytest.mark.no_bbg
@@ -250,7 +251,8 @@ def test_parse_bql_responses():
     tables: list[SITable] = bq._parse_bql_responses(mock_responses)
     assert len(tables) == 1
     tbl = tables[0]
-    assert tbl.data == exp_data
+    df = pl.DataFrame(tbl.data, schema=tbl.schema)
+    assert df.to_dict(as_series=False) == exp_data
     assert tbl.schema == exp_schema
 
 
@@ -268,7 +270,7 @@ def test_bql_calls_components():
     with (
         patch.object(bq, "_create_bql_request", return_value=mock_request)
         as create_mock,
-        patch.object(bq, "_send_request", return_value=["raw"]) as send_mock,
+        patch.object(bq, "_stream_request", return_value=["raw"]) as send_mock,
         patch.object(bq, "_parse_bql_responses", return_value=tables) as parse_mock,
     ):
         result = bq.bql("get(px_last) for('IBM US Equity')")
@@ -389,8 +391,15 @@ def test__parse_result_replay(case_json_file):
     tables = bq._parse_result(in_result)
     for i, table in enumerate(tables):
         assert table.name == out_tables[i]["name"]
-        assert table.data == out_tables[i]["data"]
         assert {k: str(v) for k, v in table.schema.items()} == out_tables[i]["schema"]
+        # Recorded data holds the raw response values; columns are typed Series
+        expected = bq._apply_schema(
+            SITable(table.name, out_tables[i]["data"], dict(table.schema))
+        )
+        assert all(isinstance(col, pl.Series) for col in table.data.values())
+        assert {k: v.to_list() for k, v in table.data.items()} == {
+            k: v.to_list() for k, v in expected.data.items()
+        }
 
 
 @pytest.mark.parametrize(
@@ -624,3 +633,28 @@ def test_real_life_cases(yaml_file, exp_df):
 
     df = bql_result.combine().to_dict(as_series=False)
     assert df == exp_df
+
+
+_JSON_PAYLOAD = {"results": {"px_last": {"idColumn": {"values": ["A"]}}}}
+
+
+class TestJsonDecoding:
+    @pytest.mark.parametrize("loads", [json.loads, plbbg._json_decoder()])
+    @pytest.mark.parametrize("encode", [json.dumps, lambda p: json.dumps(p).encode()])
+    def test_json_responses_are_decoded(self, loads, encode):
+        bq = BQuery()
+        with patch.object(plbbg, "_json_loads", loads):
+            result = bq._extract_results([encode(_JSON_PAYLOAD)])
+        assert result == [_JSON_PAYLOAD["results"]]
+
+    @pytest.mark.parametrize("loads", [json.loads, plbbg._json_decoder()])
+    def test_invalid_json_is_logged(self, loads, caplog):
+        bq = BQuery()
+        with patch.object(plbbg, "_json_loads", loads), caplog.at_level(logging.ERROR):
+            result = bq._extract_results(["{not json"])
+        assert result == []
+        assert "Failed to decode JSON" in caplog.text
+
+    def test_stdlib_fallback_without_orjson(self):
+        with patch.dict(sys.modules, {"orjson": None}):
+            assert plbbg._json_decoder() is json.loads
@@ -1,4 +1,5 @@
 import re
+from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -96,6 +97,77 @@ class TestBqlResult:
 
         assert_frame_equal(combined_df, expected_df)
 
+    def test_combine_lazy(self):
+        df1 = pl.DataFrame({"ID": ["A", "B"], "Value1": [1, 2]})
+        df2 = pl.DataFrame({"ID": ["A", "B"], "Value2": [3, 4]})
+        df3 = pl.DataFrame({"ID": ["B"], "Value3": [5]})
+        bql_result = BqlResult(dataframes=[df1, df2, df3], names=["D1", "D2", "D3"])
+
+        lazy = bql_result.combine(lazy=True)
+
+        assert isinstance(lazy, pl.LazyFrame)
+        selected = lazy.select("ID", "Value3").filter(pl.col("Value3").is_not_null())
+        assert selected.collect().to_dicts() == [{"ID": "B", "Value3": 5}]
+        assert_frame_equal(lazy.collect(), bql_result.combine())
+
+    def test_combine_aligned_frames_without_join(self):
+        df1 = pl.DataFrame({"ID": ["B", "A"], "DATE": [1, 2], "V1": [1, 2]})
+        df2 = pl.DataFrame({"ID": ["B", "A"], "V2": [3, 4], "DATE": [1, 2]})
+        bql_result = BqlResult(dataframes=[df1, df2], names=["D1", "D2"])
+
+        with patch.object(pl.LazyFrame, "join") as join_mock:
+            combined_df = bql_result.combine()
+
+        join_mock.assert_not_called()
+        expected_df = pl.DataFrame(
+            {"ID": ["B", "A"], "DATE": [1, 2], "V1": [1, 2], "V2": [3, 4]}
+        )
+        assert_frame_equal(combined_df, expected_df)
+
+    @pytest.mark.parametrize(
+        ("how", "expected"),
+        [
+            ("full", {"ID": ["C", "A", "B", "D"], "V1": [3, 1, None, None]}),
+            ("left", {"ID": ["C", "A"], "V1": [3, 1]}),
+            ("inner", {"ID": ["C"], "V1": [3]}),
+        ],
+    )
+    def test_combine_how(self, how, expected):
+        df1 = pl.DataFrame({"ID": ["C", "A"], "V1": [3, 1]})
+        df2 = pl.DataFrame({"ID": ["B", "C"], "V2": [5, 6]})
+        df3 = pl.DataFrame({"ID": ["D", "C", "B"], "V3": [7, 8, 9]})
+        bql_result = BqlResult(dataframes=[df1, df2, df3], names=["D1", "D2", "D3"])
+
+        combined_df = bql_result.combine(how=how)
+
+        assert combined_df.columns == ["ID", "V1", "V2", "V3"]
+        assert combined_df.select("ID", "V1").to_dict(as_series=False) == expected
+        # The single-pass result matches sequential joins
+        fallback = bql_result._join_sequentially(how).collect()
+        assert_frame_equal(combined_df, fallback, check_row_order=False)
+
+    @pytest.mark.parametrize(
+        ("df2", "how", "expected_ids"),
+        [
+            # Value column in both frames: joined on it as well
+            (pl.DataFrame({"ID": ["A", "B"], "V": [1, 5]}), "inner", ["A"]),
+            # Null key
+            (pl.DataFrame({"ID": ["A", None], "W": [3, 4]}), "left", ["A", "B"]),
+        ],
+    )
+    def test_combine_falls_back_to_sequential_joins(self, df2, how, expected_ids):
+        df1 = pl.DataFrame({"ID": ["A", "B"], "V": [1, 2]})
+        bql_result = BqlResult(dataframes=[df1, df2], names=["D1", "D2"])
+
+        combined_df = bql_result.combine(how=how)
+
+        assert combined_df["ID"].to_list() == expected_ids
+
+    def test_combine_invalid_how(self):
+        bql_result = BqlResult(dataframes=[pl.DataFrame({"ID": ["A"]})], names=["D"])
+        with pytest.raises(ValueError, match="Unsupported join type: 'cross'"):
+            bql_result.combine(how="cross")
+
     def test_combine_with_different_row_counts(self):
         df1 = pl.DataFrame({"ID": ["A", "B", "C"], "Value1": [1, 2, 3]})
         df2 = pl.DataFrame({"ID": ["A", "B"], "Value2": [4, 5]})
@@ -4,6 +4,7 @@ import blpapi
 import pytest
 
 from polars_bloomberg import BQuery
+from polars_bloomberg.plbbg import _SERVICES
 
 pytestmark = pytest.mark.no_bbg
 
@@ -31,7 +32,7 @@ def test_enter_start_failure():
         ("//blp/exrsvc", "Failed to open service //blp/exrsvc."),
     ],
 )
-def test_enter_open_service_failure(service_name, message):
+def test_open_service_failure_on_first_use(service_name, message):
     session_mock = MagicMock()
     session_mock.start.return_value = True
 
@@ -45,8 +46,78 @@ def test_enter_open_service_failure(service_name, message):
         patch("polars_bloomberg.plbbg.blpapi.Session", return_value=session_mock),
     ):
         bq = BQuery()
+        bq.__enter__()
+        session_mock.openService.assert_not_called()
         with pytest.raises(ConnectionError, match=message):
-            bq.__enter__()
+            bq._service(service_name)
+
+
+def test_service_is_opened_once_and_cached():
+    bq = BQuery()
+    bq.session = MagicMock()
+    bq.session.openService.return_value = True
+
+    first = bq._service("//blp/refdata")
+    second = bq._service("//blp/refdata")
+
+    assert first is second
+    bq.session.openService.assert_called_once_with("//blp/refdata")
+    bq.session.getService.assert_called_once_with("//blp/refdata")
+
+
+def _service_status(cid, msg_type):
+    event = MagicMock()
+    event.eventType.return_value = blpapi.Event.SERVICE_STATUS
+    msg = MagicMock()
+    msg.correlationIds.return_value = [cid]
+    msg.messageType.return_value = msg_type
+    event.__iter__.return_value = iter([msg])
+    return event
+
+
+def test_open_services_in_parallel():
+    bq = BQuery()
+    bq.session = MagicMock()
+    bq._services["//blp/exrsvc"] = MagicMock()
+    cids = []
+    bq.session.openServiceAsync.side_effect = lambda name, cid: cids.append(cid)
+    other = MagicMock()
+    other.eventType.return_value = blpapi.Event.SESSION_STATUS
+
+    def events():
+        yield other
+        yield _service_status(blpapi.CorrelationId(999), "ServiceOpened")
+        for cid in list(cids):
+            yield _service_status(cid, "ServiceOpened")
+
+    stream = events()
+    bq.session.nextEvent.side_effect = lambda timeout: next(stream)
+
+    bq.open_services()
+
+    assert [c.args[0] for c in bq.session.openServiceAsync.call_args_list] == [
+        "//blp/refdata",
+        "//blp/bqlsvc",
+    ]
+    assert set(bq._services) == set(_SERVICES)
+    bq._service("//blp/bqlsvc")
+    bq.session.openService.assert_not_called()
+
+
+def test_open_services_failure_and_timeout():
+    bq = BQuery(timeout=10)
+    bq.session = MagicMock()
+    bq.session.nextEvent.return_value = _service_status(
+        blpapi.CorrelationId(1), "ServiceOpenFailure"
+    )
+    with pytest.raises(ConnectionError, match="Failed to open service //blp/bqlsvc"):
+        bq.open_services("//blp/bqlsvc")
+
+    timeout = MagicMock()
+    timeout.eventType.return_value = blpapi.Event.TIMEOUT
+    bq.session.nextEvent.return_value = timeout
+    with pytest.raises(TimeoutError, match="timed out after 10 milliseconds"):
+        bq.open_services("//blp/refdata")
 
 
 def test_send_request_writes_debug_file(tmp_path, monkeypatch):
@@ -59,6 +130,7 @@ def test_send_request_writes_debug_file(tmp_path, monkeypatch):
     response_message = MagicMock()
     response_message.hasElement.return_value = False
     response_message.toPy.return_value = {"final": "data"}
+    response_message.correlationIds.return_value = [blpapi.CorrelationId(1)]
     response_event.__iter__.return_value = iter([response_message])
     session_mock.nextEvent.return_value = response_event
 
@@ -0,0 +1,166 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import blpapi
+import pytest
+
+from polars_bloomberg import BQuery, BQueryPool
+
+pytestmark = pytest.mark.no_bbg
+
+
+@pytest.fixture
+def connections():
+    """Patch BQuery in the pool so each new connection is a recorded mock."""
+    created = []
+
+    def factory(**kwargs):
+        bq = MagicMock(name=f"bq{len(created)}")
+        bq.kwargs = kwargs
+        bq._session_alive.return_value = True
+        created.append(bq)
+        return bq
+
+    with patch("polars_bloomberg.plbbg.BQuery", side_effect=factory):
+        yield created
+
+
+def _status_event(*msg_types):
+    event = MagicMock()
+    event.eventType.return_value = blpapi.Event.SESSION_STATUS
+    messages = []
+    for msg_type in msg_types:
+        msg = MagicMock()
+        msg.messageType.return_value = msg_type
+        messages.append(msg)
+    event.__iter__.return_value = iter(messages)
+    return event
+
+
+class TestBQueryPool:
+    def test_start_and_close(self, connections):
+        with BQueryPool(size=3, host="bbg", port=1234):
+            assert len(connections) == 3
+            assert all(bq.kwargs == {"host": "bbg", "port": 1234} for bq in connections)
+            assert all(bq.__enter__.called for bq in connections)
+        assert all(bq.__exit__.called for bq in connections)
+
+    def test_sessions_are_created_lazily_and_reused(self, connections):
+        pool = BQueryPool(size=2)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            assert second is first
+        assert len(connections) == 1
+
+    def test_busy_pool_times_out(self, connections):
+        pool = BQueryPool(size=1, acquire_timeout=0.01)
+        with (
+            pool.connection(),
+            pytest.raises(TimeoutError, match="No free Bloomberg session"),
+            pool.connection(),
+        ):
+            pass
+
+    def test_waiting_thread_gets_released_session(self, connections):
+        pool = BQueryPool(size=1)
+        used = []
+
+        def worker():
+            with pool.connection() as bq:
+                used.append(bq)
+
+        with pool.connection() as bq:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join(timeout=0.05)
+            assert thread.is_alive()
+        thread.join(timeout=1)
+        assert used == [bq]
+
+    def test_connection_error_replaces_session(self, connections):
+        pool = BQueryPool(size=1)
+        with pytest.raises(ConnectionError), pool.connection() as bq:
+            raise ConnectionError("down")
+        bq.__exit__.assert_called_once()
+
+        with pool.connection() as new_bq:
+            assert new_bq is not bq
+        assert len(connections) == 2
+
+    def test_other_errors_return_session(self, connections):
+        pool = BQueryPool(size=1)
+        with pytest.raises(ValueError), pool.connection() as bq:
+            raise ValueError("bad field")
+        with pool.connection() as again:
+            assert again is bq
+
+    def test_unhealthy_session_is_reconnected(self, connections, caplog):
+        pool = BQueryPool(size=1)
+        with pool.connection() as bq:
+            pass
+        bq._session_alive.return_value = False
+
+        with caplog.at_level("WARNING"), pool.connection() as new_bq:
+            assert new_bq is not bq
+        bq.__exit__.assert_called_once()
+        assert "reconnecting" in caplog.text
+
+    def test_failed_start_frees_slot(self, connections):
+        pool = BQueryPool(size=1)
+        broken = MagicMock(__enter__=MagicMock(side_effect=ConnectionError))
+        with (
+            patch("polars_bloomberg.plbbg.BQuery", return_value=broken),
+            pytest.raises(ConnectionError),
+            pool.connection(),
+        ):
+            pass
+        with pool.connection() as bq:
+            assert bq is connections[0]
+
+    def test_closed_pool(self, connections):
+        pool = BQueryPool(size=1)
+        with pool.connection() as bq:
+            pool.close()
+        bq.__exit__.assert_called_once()
+        with pytest.raises(ConnectionError, match="closed"), pool.connection():
+            pass
+
+    def test_stop_errors_are_logged(self, connections, caplog):
+        pool = BQueryPool(size=1)
+        pool.start()
+        connections[0].__exit__.side_effect = RuntimeError("stop failed")
+        pool.close()
+        assert "Failed to stop Bloomberg session" in caplog.text
+
+    @pytest.mark.parametrize(
+        "method",
+        ["bdp", "bdh", "bdib", "bdit", "bql", "bql_many", "bql_chunked", "bsrch"],
+    )
+    def test_shortcuts_delegate_to_pooled_session(self, connections, method):
+        pool = BQueryPool(size=1)
+        result = getattr(pool, method)("a", b=1)
+        bq = connections[0]
+        getattr(bq, method).assert_called_once_with("a", b=1)
+        assert result is getattr(bq, method).return_value
+
+
+class TestSessionAlive:
+    def _bq(self, *events):
+        bq = BQuery()
+        bq.session = MagicMock()
+        bq.session.tryNextEvent.side_effect = [*events, None]
+        return bq
+
+    def test_idle_session_is_alive(self):
+        response = MagicMock()
+        response.eventType.return_value = blpapi.Event.RESPONSE
+        assert self._bq(response)._session_alive()
+
+    def test_terminated_session(self):
+        assert not self._bq(_status_event("SessionTerminated"))._session_alive()
+
+    def test_connection_down_and_up(self):
+        assert not self._bq(_status_event("SessionConnectionDown"))._session_alive()
+        bq = self._bq(_status_event("SessionConnectionDown", "SessionConnectionUp"))
+        assert bq._session_alive()
@@ -66,11 +66,16 @@ class TestBsrch:
             }
         ]
 
-        rows = bq._parse_bsrch_responses(responses)
-        assert rows == [
+        df = bq._parse_bsrch_responses(responses)
+        assert df.to_dicts() == [
             {"Ticker": "IBM US Equity", "PX_LAST": 125.3, "COUNT": 5},
             {"Ticker": "MSFT US Equity", "PX_LAST": 402.1, "COUNT": 4},
         ]
+        assert df.schema == {
+            "Ticker": pl.Utf8,
+            "PX_LAST": pl.Float64,
+            "COUNT": pl.Int64,
+        }
 
     def test_parse_bsrch_responses_error(self):
         bq = BQuery()
@@ -100,9 +105,9 @@ class TestBsrch:
         ]
 
         with caplog.at_level("WARNING"):
-            rows = bq._parse_bsrch_responses(responses)
+            df = bq._parse_bsrch_responses(responses)
 
-        assert rows == [{"Ticker": "AAPL US Equity"}]
+        assert df.to_dicts() == [{"Ticker": "AAPL US Equity"}]
         assert any("reached internal limit" in rec.message for rec in caplog.records)
 
     def test_parse_bsrch_responses_coerces_numeric_whitespace(self):
@@ -132,8 +137,7 @@ class TestBsrch:
             }
         ]
 
-        rows = bq._parse_bsrch_responses(responses)
-        df = pl.DataFrame(rows, infer_schema_length=None, strict=False)
+        df = bq._parse_bsrch_responses(responses)
 
         assert df.schema["PX_LAST"] == pl.Float64
         assert df.schema["COUNT"] == pl.Int64
@@ -170,18 +174,18 @@ class TestBsrch:
             {},
         ]
 
-        rows = bq._parse_bsrch_responses(responses)
-        assert rows == [{"Ticker": "AAPL US Equity"}]
+        df = bq._parse_bsrch_responses(responses)
+        assert df.to_dicts() == [{"Ticker": "AAPL US Equity"}]
 
     def test_bsrch_calls_components(self):
         bq = BQuery()
         mock_request = MagicMock()
-        parsed_rows = [{"Ticker": "IBM US Equity"}, {"Ticker": "MSFT US Equity"}]
+        parsed = pl.DataFrame({"Ticker": ["IBM US Equity", "MSFT US Equity"]})
 
         with (
             patch.object(bq, "_create_bsrch_request", return_value=mock_request),
-            patch.object(bq, "_send_request", return_value=["raw_response"]),
-            patch.object(bq, "_parse_bsrch_responses", return_value=parsed_rows),
+            patch.object(bq, "_stream_request", return_value=iter(["raw_response"])),
+            patch.object(bq, "_parse_bsrch_responses", return_value=parsed),
         ):
             df = bq.bsrch("FI:SRCHEX.@CLOSUB", overrides={"LIMIT": 10000})
 
@@ -189,25 +193,34 @@ class TestBsrch:
         assert df.shape == (2, 1)
         assert df["Ticker"].to_list() == ["IBM US Equity", "MSFT US Equity"]
 
-    def test_coerce_bsrch_numeric_columns_direct(self):
+    def test_parse_bsrch_short_records_and_mixed_values(self):
         bq = BQuery()
-        rows = [
-            {"A": 1, "B": " "},
-            {"A": 2, "B": 2},
-            {"A": "", "B": 3},
-        ]
-        bq._coerce_bsrch_numeric_columns(rows)
-        assert rows == [
-            {"A": 1, "B": None},
-            {"A": 2, "B": 2},
-            {"A": None, "B": 3},
+        responses = [
+            {
+                "GridResponse": {
+                    "ColumnTitles": ["Ticker", "RATING"],
+                    "DataRecords": [
+                        {"DataFields": [{"Ticker": "A Corp"}]},
+                        {"DataFields": [{"Ticker": "B Corp"}, {"IntValue": 3}]},
+                        {"DataFields": [{"Ticker": "C Corp"}, {"StringValue": "NR"}]},
+                        {"DataFields": ["raw", {"IntValue": 1}, 2]},
+                        {"DataFields": [{"Ticker": "E Corp"}]},
+                    ],
+                }
+            }
         ]
 
-    def test_coerce_bsrch_numeric_columns_empty(self):
+        df = bq._parse_bsrch_responses(responses)
+
+        assert df.columns == ["Ticker", "RATING", "col_2"]
+        assert df["Ticker"].to_list() == ["A Corp", "B Corp", "C Corp", "raw", "E Corp"]
+        # A non-numeric string keeps the column as strings
+        assert df["RATING"].to_list() == [None, "3", "NR", "1", None]
+        assert df["col_2"].to_list() == [None, None, None, 2, None]
+
+    def test_parse_bsrch_empty(self):
         bq = BQuery()
-        rows: list[dict] = []
-        bq._coerce_bsrch_numeric_columns(rows)
-        assert rows == []
+        assert bq._parse_bsrch_responses([]).is_empty()
 
     def test_extract_bsrch_field_value_variants(self):
         bq = BQuery()
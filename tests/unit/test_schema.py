@@ -1,9 +1,10 @@
-from datetime import date
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock
 
 import polars as pl
 import pytest
 
-from polars_bloomberg import BQuery
+from polars_bloomberg import BQuery, plbbg
 from polars_bloomberg.plbbg import SITable
 
 pytestmark = pytest.mark.no_bbg
@@ -57,6 +58,10 @@ class TestSchemaMappingAndDataConversion:
                 {"unknown_field": "UNKNOWN"},
                 {"unknown_field": pl.Utf8},
             ),
+            (
+                {"as_of": "DATETIME"},
+                {"as_of": pl.Datetime("us", "UTC")},
+            ),
             (
                 {},
                 {},
@@ -132,6 +137,17 @@ class TestSchemaMappingAndDataConversion:
                     "user_role": ["admin", "user", "guest", "user"],
                 },
             ),
+            (
+                {"ts": ["2024-01-02T10:00:00Z", "2024-01-02T10:00:00.5Z", None]},
+                {"ts": pl.Datetime("us", "UTC")},
+                {
+                    "ts": [
+                        datetime(2024, 1, 2, 10, tzinfo=UTC),
+                        datetime(2024, 1, 2, 10, 0, 0, 500_000, tzinfo=UTC),
+                        None,
+                    ]
+                },
+            ),
             (
                 {"number_col": ["Infinity", "-Infinity", "NaN", 1.5]},
                 {"number_col": pl.Float64},
@@ -149,5 +165,69 @@ class TestSchemaMappingAndDataConversion:
     def test__apply_schema(self, data, schema, exp_data, bq: BQuery):
         in_table = SITable(name="test", data=data, schema=schema)
         out_table = bq._apply_schema(in_table)
-        assert out_table.data == exp_data
+        out_data = {
+            col: values.to_list() if isinstance(values, pl.Series) else values
+            for col, values in out_table.data.items()
+        }
+        assert out_data == exp_data
         assert out_table.schema == schema
+
+
+_RESULTS = {
+    "px": {
+        "idColumn": {"values": ["A", "B", "C"], "type": "STRING"},
+        "valuesColumn": {"values": [1.5, 2.5, None], "type": "DOUBLE"},
+        "secondaryColumns": [
+            {"name": "CURRENCY", "values": ["USD", "USD", "EUR"], "type": "STRING"},
+            {"name": "COUNT", "values": [1, 2, 3], "type": "INT"},
+            {"name": "BIG", "values": [1, 2**31, 3], "type": "INT"},
+            {"name": "EMPTY", "values": [None, None, None], "type": "INT"},
+        ],
+    }
+}
+
+
+class TestCompactBqlTables:
+    def test_defaults_keep_types(self):
+        (table,) = BQuery()._parse_result(_RESULTS)
+        assert table.schema == {
+            "ID": pl.Utf8,
+            "px": pl.Float64,
+            "CURRENCY": pl.Utf8,
+            "COUNT": pl.Int64,
+            "BIG": pl.Int64,
+            "EMPTY": pl.Int64,
+        }
+
+    def test_categorical_and_downcast(self):
+        bq = BQuery(bql_categorical=True, bql_downcast=True)
+        (table,) = bq._parse_result(_RESULTS)
+        assert table.schema == {
+            "ID": pl.Utf8,
+            "px": pl.Float32,
+            "CURRENCY": pl.Categorical,
+            "COUNT": pl.Int32,
+            "BIG": pl.Int64,
+            "EMPTY": pl.Int32,
+        }
+        df = pl.DataFrame(table.data, schema=table.schema)
+        assert df["CURRENCY"].to_list() == ["USD", "USD", "EUR"]
+        assert df["px"].to_list() == [1.5, 2.5, None]
+
+    def test_categorical_keys(self):
+        (table,) = BQuery(categorical_keys=True)._parse_result(_RESULTS)
+        assert table.schema["ID"] == pl.Categorical
+        assert table.schema["CURRENCY"] == pl.Utf8
+        assert table.data["ID"].to_list() == ["A", "B", "C"]
+
+
+def test_enable_string_cache_on_old_polars(monkeypatch):
+    enable = MagicMock()
+    monkeypatch.setattr(pl, "enable_string_cache", enable, raising=False)
+    monkeypatch.setattr(pl, "Categories", object, raising=False)
+    plbbg._enable_string_cache()
+    enable.assert_not_called()
+
+    monkeypatch.delattr(pl, "Categories")
+    BQuery(categorical_keys=True)
+    enable.assert_called_once_with()
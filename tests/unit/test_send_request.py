@@ -8,6 +8,21 @@ from polars_bloomberg import BQuery
 pytestmark = pytest.mark.no_bbg
 
 
+def _event(event_type, messages):
+    event = MagicMock()
+    event.eventType.return_value = event_type
+    event.__iter__.return_value = iter(messages)
+    return event
+
+
+def _message(payload, cid=1):
+    message = MagicMock()
+    message.hasElement.return_value = False
+    message.toPy.return_value = payload
+    message.correlationIds.return_value = [blpapi.CorrelationId(cid)]
+    return message
+
+
 class TestBQuerySendRequest:
     @pytest.fixture
     def bquery(self):
@@ -20,37 +35,24 @@ class TestBQuerySendRequest:
                 yield bquery
 
     def test_send_request_success(self, bquery: BQuery):
-        partial_event = MagicMock()
-        partial_event.eventType.return_value = blpapi.Event.PARTIAL_RESPONSE
-
-        final_event = MagicMock()
-        final_event.eventType.return_value = blpapi.Event.RESPONSE
-
-        partial_message = MagicMock()
-        partial_message.hasElement.return_value = False
-        partial_message.toPy.return_value = {"partial": "data"}
-
-        final_message = MagicMock()
-        final_message.hasElement.return_value = False
-        final_message.toPy.return_value = {"final": "data"}
-
-        partial_event.__iter__.return_value = iter([partial_message])
-        final_event.__iter__.return_value = iter([final_message])
-
+        partial_event = _event(
+            blpapi.Event.PARTIAL_RESPONSE, [_message({"partial": "data"})]
+        )
+        final_event = _event(blpapi.Event.RESPONSE, [_message({"final": "data"})])
         bquery.session.nextEvent.side_effect = [partial_event, final_event]
 
         mock_request = MagicMock()
         responses = bquery._send_request(mock_request)
 
-        bquery.session.sendRequest.assert_called_with(mock_request)
+        bquery.session.sendRequest.assert_called_once_with(
+            mock_request, correlationId=blpapi.CorrelationId(1)
+        )
         assert responses == [{"partial": "data"}, {"final": "data"}]
         assert bquery.session.nextEvent.call_count == 2
         bquery.session.nextEvent.assert_any_call(5000)
 
     def test_send_request_timeout(self, bquery: BQuery):
-        timeout_event = MagicMock()
-        timeout_event.eventType.return_value = blpapi.Event.TIMEOUT
-        timeout_event.__iter__.return_value = iter([])
+        timeout_event = _event(blpapi.Event.TIMEOUT, [])
 
         bquery.session.nextEvent.return_value = timeout_event
         mock_request = MagicMock()
@@ -60,25 +62,305 @@ class TestBQuerySendRequest:
         ):
             bquery._send_request(mock_request)
 
-        bquery.session.sendRequest.assert_called_with(mock_request)
+        bquery.session.sendRequest.assert_called_once()
         bquery.session.nextEvent.assert_called_once_with(5000)
 
     def test_send_request_with_response_error(self, bquery: BQuery):
-        response_event = MagicMock()
-        response_event.eventType.return_value = blpapi.Event.RESPONSE
-
-        error_message = MagicMock()
+        error_message = _message({})
         error_message.hasElement.return_value = True
         error_element = MagicMock()
         error_element.getElementAsString.return_value = "Invalid field"
         error_message.getElement.return_value = error_element
 
-        response_event.__iter__.return_value = iter([error_message])
+        response_event = _event(blpapi.Event.RESPONSE, [error_message])
         bquery.session.nextEvent.return_value = response_event
 
         mock_request = MagicMock()
         with pytest.raises(Exception, match="Response error: Invalid field"):
             bquery._send_request(mock_request)
 
-        bquery.session.sendRequest.assert_called_with(mock_request)
+        bquery.session.sendRequest.assert_called_once()
         bquery.session.nextEvent.assert_called_once_with(5000)
+
+    def test_stream_request_yields_before_next_event(self, bquery: BQuery):
+        partial_event = _event(
+            blpapi.Event.PARTIAL_RESPONSE, [_message({"partial": "data"})]
+        )
+        final_event = _event(blpapi.Event.RESPONSE, [_message({"final": "data"})])
+        bquery.session.nextEvent.side_effect = [partial_event, final_event]
+
+        stream = bquery._stream_request(MagicMock())
+        assert next(stream) == {"partial": "data"}
+        assert bquery.session.nextEvent.call_count == 1
+        assert list(stream) == [{"final": "data"}]
+        assert bquery.session.nextEvent.call_count == 2
+
+    def test_stream_requests_demultiplexes_by_correlation_id(self, bquery: BQuery):
+        bquery.session.nextEvent.side_effect = [
+            _event(blpapi.Event.SESSION_STATUS, [_message({"status": "ok"}, cid=99)]),
+            _event(blpapi.Event.PARTIAL_RESPONSE, [_message({"b": 1}, cid=2)]),
+            _event(blpapi.Event.PARTIAL_RESPONSE, [_message({"stale": 1}, cid=42)]),
+            _event(blpapi.Event.RESPONSE, [_message({"a": 1}, cid=1)]),
+            _event(blpapi.Event.RESPONSE, [_message({"b": 2}, cid=2)]),
+        ]
+        requests = [MagicMock(), MagicMock()]
+
+        result = list(bquery._stream_requests(requests))
+
+        assert result == [(1, {"b": 1}), (0, {"a": 1}), (1, {"b": 2})]
+        assert bquery.session.sendRequest.call_count == 2
+
+    def test_stream_requests_reports_completed_requests(self, bquery: BQuery):
+        bquery.session.nextEvent.side_effect = [
+            _event(blpapi.Event.PARTIAL_RESPONSE, [_message({"b": 1}, cid=2)]),
+            _event(blpapi.Event.RESPONSE, [_message({"a": 1}, cid=1)]),
+            _event(blpapi.Event.RESPONSE, [_message({"b": 2}, cid=2)]),
+        ]
+        completed: list[int] = []
+
+        seen = [
+            (idx, list(completed))
+            for idx, _ in bquery._stream_requests(
+                [MagicMock(), MagicMock()], completed=completed
+            )
+        ]
+
+        assert seen == [(1, []), (0, []), (1, [0])]
+        assert completed == [0, 1]
+
+    def test_stream_requests_keeps_all_messages_of_final_event(self, bquery):
+        bquery.max_in_flight = 1
+        bquery.session.nextEvent.side_effect = [
+            _event(
+                blpapi.Event.RESPONSE,
+                [_message({"a": 1}, cid=1), _message({"a": 2}, cid=1)],
+            ),
+            _event(blpapi.Event.RESPONSE, [_message({"b": 1}, cid=2)]),
+        ]
+
+        result = list(bquery._stream_requests([MagicMock(), MagicMock()]))
+
+        assert result == [(0, {"a": 1}), (0, {"a": 2}), (1, {"b": 1})]
+
+    def test_stream_requests_respects_max_in_flight(self, bquery: BQuery):
+        bquery.max_in_flight = 1
+        requests = [MagicMock(), MagicMock()]
+        sent_before_event = []
+
+        def next_event(_timeout):
+            sent_before_event.append(bquery.session.sendRequest.call_count)
+            cid = bquery.session.sendRequest.call_args.kwargs["correlationId"]
+            return _event(blpapi.Event.RESPONSE, [_message({}, cid=cid.value())])
+
+        bquery.session.nextEvent.side_effect = next_event
+
+        result = list(bquery._stream_requests(requests))
+
+        assert [idx for idx, _ in result] == [0, 1]
+        assert sent_before_event == [1, 2]
+
+    def test_stream_columns_parses_per_request(self, bquery: BQuery):
+        bquery.session.nextEvent.side_effect = [
+            _event(blpapi.Event.PARTIAL_RESPONSE, [_message({"v": [1]}, cid=2)]),
+            _event(blpapi.Event.RESPONSE, [_message({"v": [2]}, cid=1)]),
+            _event(blpapi.Event.RESPONSE, [_message({"v": [3, 4]}, cid=2)]),
+        ]
+
+        def parse(idx, responses):
+            values = [v for r in responses for v in r["v"]]
+            return {"idx": [idx] * len(values), "v": values}
+
+        columns = bquery._stream_columns([MagicMock(), MagicMock()], parse)
+
+        assert columns == [
+            {"idx": [0], "v": [2]},
+            {"idx": [1, 1, 1], "v": [1, 3, 4]},
+        ]
+
+
+_CONNECTION_LOST = {"category": "CANCELED", "description": "Connection lost"}
+
+
+def _status(*msg_types, cid=None, reason=None):
+    messages = []
+    for msg_type in msg_types:
+        payload = {"status": msg_type} if reason is None else {"reason": reason}
+        message = _message(payload, cid=cid)
+        message.messageType.return_value = msg_type
+        messages.append(message)
+    event_type = (
+        blpapi.Event.REQUEST_STATUS if cid is not None else blpapi.Event.SESSION_STATUS
+    )
+    return _event(event_type, messages)
+
+
+def _parse_values(idx, responses):
+    return {"v": [v for r in responses for v in r["v"]]}
+
+
+class TestReconnect:
+    @pytest.fixture
+    def bquery(self):
+        bquery = BQuery(timeout=5000)
+        bquery.session = MagicMock()
+        bquery._connected = True
+        return bquery
+
+    def test_request_failed_by_connection_drop_is_replayed(self, bquery, caplog):
+        bquery.session.nextEvent.side_effect = [
+            _event(blpapi.Event.PARTIAL_RESPONSE, [_message({"v": [1]}, cid=1)]),
+            _status("SessionConnectionDown"),
+            _status("RequestFailure", cid=1),
+            _status("SessionConnectionUp"),
+            _event(blpapi.Event.RESPONSE, [_message({"v": [1, 2]}, cid=2)]),
+        ]
+        request = MagicMock()
+
+        with caplog.at_level("INFO"):
+            columns = bquery._stream_columns([request], _parse_values)
+
+        assert columns == [{"v": [1, 2]}]
+        assert [c.args[0] for c in bquery.session.sendRequest.call_args_list] == [
+            request,
+            request,
+        ]
+        assert "connection down" in caplog.text
+        assert "re-established" in caplog.text
+
+    def test_request_failure_while_connected_is_resent_at_once(self, bquery):
+        bquery.session.nextEvent.side_effect = [
+            _status("RequestFailure", cid=1, reason=_CONNECTION_LOST),
+            _event(blpapi.Event.RESPONSE, [_message({"v": [3]}, cid=2)]),
+        ]
+
+        assert list(bquery._stream_requests([MagicMock()])) == [
+            (0, None),
+            (0, {"v": [3]}),
+        ]
+
+    def test_request_failure_gives_up_after_max_reconnects(self, bquery):
+        bquery.max_reconnects = 1
+        bquery.session.nextEvent.side_effect = [
+            _status("RequestFailure", cid=1),
+            _status("RequestFailure", cid=2),
+        ]
+
+        with pytest.raises(Exception, match="Request failed"):
+            list(bquery._stream_requests([MagicMock()]))
+
+    def test_stream_request_replay_before_first_response_is_transparent(self, bquery):
+        bquery.session.nextEvent.side_effect = [
+            _status("RequestFailure", cid=1, reason=_CONNECTION_LOST),
+            _event(blpapi.Event.RESPONSE, [_message({"v": [3]}, cid=2)]),
+        ]
+
+        assert list(bquery._stream_request(MagicMock())) == [{"v": [3]}]
+
+    def test_stream_request_replay_after_consumed_response_raises(self, bquery):
+        bquery.session.nextEvent.side_effect = [
+            _event(blpapi.Event.PARTIAL_RESPONSE, [_message({"v": [1]}, cid=1)]),
+            _status("RequestFailure", cid=1, reason=_CONNECTION_LOST),
+        ]
+
+        with pytest.raises(ConnectionError, match="part of the response"):
+            list(bquery._stream_request(MagicMock()))
+
+    def test_session_terminated_restarts_and_fails_request(self, bquery):
+        bquery.session.nextEvent.side_effect = [_status("SessionTerminated")]
+
+        with (
+            patch.object(bquery, "_restart") as restart_mock,
+            pytest.raises(ConnectionError, match="session was restarted"),
+        ):
+            list(bquery._stream_requests([MagicMock()]))
+        restart_mock.assert_called_once()
+
+    def test_request_failure_for_bad_request_is_not_resent(self, bquery):
+        reason = {"category": "BAD_ARGS", "description": "Invalid security"}
+        bquery.session.nextEvent.side_effect = [
+            _status("RequestFailure", cid=1, reason=reason)
+        ]
+
+        with pytest.raises(Exception, match="Invalid security"):
+            list(bquery._stream_requests([MagicMock()]))
+        bquery.session.sendRequest.assert_called_once()
+
+    def test_session_terminated_after_request_failure_fails_request(self, bquery):
+        # Bloomberg fails the in-flight request before terminating the session
+        bquery.session.nextEvent.side_effect = [
+            _status("SessionConnectionDown"),
+            _status("RequestFailure", cid=1),
+            _status("SessionTerminated"),
+        ]
+
+        with (
+            patch.object(bquery, "_restart") as restart_mock,
+            pytest.raises(ConnectionError, match="session was restarted"),
+        ):
+            list(bquery._stream_requests([MagicMock()]))
+        restart_mock.assert_called_once()
+        bquery.session.sendRequest.assert_called_once()
+
+    def test_session_terminated_while_idle_only_restarts(self, bquery):
+        with patch.object(bquery, "_restart") as restart_mock:
+            bquery._on_session_status(_status("SessionTerminated"), in_flight=False)
+        restart_mock.assert_called_once()
+
+
+class TestLifecycle:
+    @pytest.fixture
+    def session_options(self):
+        with patch("polars_bloomberg.plbbg.blpapi.SessionOptions") as options_cls:
+            yield options_cls.return_value
+
+    @pytest.fixture
+    def session(self):
+        with patch("polars_bloomberg.plbbg.blpapi.Session") as session_cls:
+            session_cls.return_value.start.return_value = True
+            yield session_cls.return_value
+
+    def test_start_and_stop(self, session_options, session):
+        bq = BQuery(max_reconnects=2)
+        bq.start()
+
+        session_options.setAutoRestartOnDisconnection.assert_called_once_with(True)
+        session_options.setNumStartAttempts.assert_called_once_with(3)
+        assert bq._connected
+
+        bq.stop()
+        session.stop.assert_called_once()
+        assert not bq._connected
+
+    def test_start_without_reconnects(self, session_options, session):
+        BQuery(max_reconnects=0).start()
+        session_options.setAutoRestartOnDisconnection.assert_not_called()
+
+    def test_restart_backs_off_and_reopens_services(self, session_options, session):
+        bq = BQuery(reconnect_delay=0.5)
+        bq.session = session
+        bq._services = {"//blp/refdata": MagicMock()}
+        session.start.side_effect = [False, True]
+
+        with (
+            patch("polars_bloomberg.plbbg.time.sleep") as sleep_mock,
+            patch.object(bq, "open_services") as open_mock,
+        ):
+            bq._restart()
+
+        assert [c.args[0] for c in sleep_mock.call_args_list] == [0.5, 1.0]
+        open_mock.assert_called_once_with("//blp/refdata")
+        assert bq._connected
+
+    def test_restart_gives_up(self, session_options, session):
+        bq = BQuery(max_reconnects=2)
+        bq.session = session
+        bq._connected = True
+        session.start.return_value = False
+
+        with (
+            patch("polars_bloomberg.plbbg.time.sleep"),
+            pytest.raises(ConnectionError, match="Failed to restart"),
+        ):
+            bq._restart()
+        assert session.start.call_count == 2
+        assert not bq._connected
@@ -0,0 +1,173 @@
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import blpapi
+import polars as pl
+import pytest
+
+from polars_bloomberg import BQuery
+
+pytestmark = pytest.mark.no_bbg
+
+
+def _tick(cid, **values):
+    msg = MagicMock()
+    msg.correlationIds.return_value = [blpapi.CorrelationId(cid)]
+    msg.hasElement.side_effect = lambda name, exclude_null=False: name in values
+    msg.getElementValue.side_effect = values.__getitem__
+    return msg
+
+
+def _status(cid, msg_type):
+    msg = MagicMock()
+    msg.correlationIds.return_value = [blpapi.CorrelationId(cid)]
+    msg.messageType.return_value = msg_type
+    msg.toPy.return_value = {"reason": "not entitled"}
+    return msg
+
+
+def _event(event_type, messages=()):
+    event = MagicMock()
+    event.eventType.return_value = event_type
+    event.__iter__.return_value = iter(messages)
+    return event
+
+
+@pytest.fixture
+def bq():
+    bq = BQuery()
+    bq.session = MagicMock()
+    with patch("polars_bloomberg.plbbg.blpapi.SubscriptionList") as subscriptions:
+        bq.subscriptions = subscriptions.return_value
+        yield bq
+
+
+class TestSubscribe:
+    def test_subscription_list(self, bq):
+        bq.session.nextEvent.side_effect = [_event(blpapi.Event.TIMEOUT), EOFError]
+        batches = bq.subscribe(["A", "B"], ["BID"], options=["interval=1.0"])
+        with pytest.raises(EOFError):
+            next(batches)
+        calls = bq.subscriptions.add.call_args_list
+        assert [c.args[:3] for c in calls] == [
+            ("A", ["BID"], ["interval=1.0"]),
+            ("B", ["BID"], ["interval=1.0"]),
+        ]
+        bq.session.subscribe.assert_called_once_with(bq.subscriptions)
+
+    def test_flush_on_max_ticks(self, bq):
+        bq.session.nextEvent.side_effect = [
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1, BID=1.0, ASK=1.5)]),
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(2, BID=2.0)]),
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1), _tick(2, ASK=2.5)]),
+        ]
+        batches = bq.subscribe(["A", "B"], ["BID", "ASK"], interval=60_000, max_ticks=2)
+
+        first = next(batches)
+        assert first.schema == pl.Schema(
+            {
+                "time": pl.Datetime("us", "UTC"),
+                "security": pl.Utf8,
+                "BID": pl.Float64,
+                "ASK": pl.Float64,
+            }
+        )
+        assert first.drop("time").to_dicts() == [
+            {"security": "A", "BID": 1.0, "ASK": 1.5},
+            {"security": "B", "BID": 2.0, "ASK": None},
+        ]
+        assert first["time"][0] <= datetime.now(UTC)
+        second = next(batches)
+        assert second.drop("time").to_dicts() == [
+            {"security": "A", "BID": None, "ASK": None},
+            {"security": "B", "BID": None, "ASK": 2.5},
+        ]
+
+        batches.close()
+        bq.session.unsubscribe.assert_called_once_with(bq.subscriptions)
+
+    def test_flush_on_interval(self, bq):
+        clock = iter([0.0, 0.0, 0.5, 1.0, 1.0, 1.2, 1.2, 2.5])
+        bq.session.nextEvent.side_effect = [
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1, LAST_PRICE=10)]),
+            _event(blpapi.Event.TIMEOUT),
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1, LAST_PRICE=11)]),
+        ]
+        with patch("polars_bloomberg.plbbg.time.monotonic", lambda: next(clock)):
+            batches = bq.subscribe(["A"], ["LAST_PRICE"], interval=1000)
+            first = next(batches)
+            second = next(batches)
+
+        assert first["LAST_PRICE"].to_list() == [10]
+        assert second["LAST_PRICE"].to_list() == [11]
+        waits = [c.args[0] for c in bq.session.nextEvent.call_args_list]
+        assert waits == [1000, 1, 1000]
+
+    def test_unknown_topics_and_status(self, bq, caplog):
+        bq.session.nextEvent.side_effect = [
+            _event(
+                blpapi.Event.SUBSCRIPTION_STATUS,
+                [_status(1, "SubscriptionStarted"), _status(2, "SubscriptionFailure")],
+            ),
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(999, BID=9.0)]),
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1, BID=1.0)]),
+        ]
+        with caplog.at_level("ERROR"):
+            batch = next(bq.subscribe(["A", "B"], ["BID"], max_ticks=1))
+        assert batch["security"].to_list() == ["A"]
+        assert "SubscriptionFailure for B" in caplog.text
+        assert "SubscriptionStarted" not in caplog.text
+
+    def test_callback_receives_batches(self, bq):
+        bq.session.nextEvent.side_effect = [
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1, BID=1.0)]),
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1, BID=2.0)]),
+        ]
+        received = []
+
+        def callback(batch):
+            received.append(batch["BID"].to_list())
+            if len(received) == 2:
+                raise RuntimeError("stop")
+
+        with pytest.raises(RuntimeError, match="stop"):
+            bq.subscribe(["A"], ["BID"], max_ticks=1, callback=callback)
+        assert received == [[1.0], [2.0]]
+        bq.session.unsubscribe.assert_called_once_with(bq.subscriptions)
+
+    def test_callback_returns_when_stream_ends(self, bq):
+        def batches():
+            yield pl.DataFrame({"BID": [1.0]})
+
+        callback = MagicMock()
+        with patch.object(bq, "_subscription_batches", return_value=batches()):
+            assert bq.subscribe(["A"], ["BID"], callback=callback) is None
+        callback.assert_called_once()
+
+    def test_resubscribe_after_session_restart(self, bq):
+        old_session = bq.session
+        new_session = MagicMock()
+        new_session.nextEvent.side_effect = [
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1, BID=1.0)])
+        ]
+        old_session.nextEvent.side_effect = [
+            _event(blpapi.Event.SESSION_STATUS, [_status(0, "SessionTerminated")])
+        ]
+
+        def restart():
+            bq.session = new_session
+
+        with patch.object(bq, "_restart", side_effect=restart):
+            batch = next(bq.subscribe(["A"], ["BID"], max_ticks=1))
+        assert batch["BID"].to_list() == [1.0]
+        old_session.subscribe.assert_called_once_with(bq.subscriptions)
+        new_session.subscribe.assert_called_once_with(bq.subscriptions)
+
+    def test_categorical_keys(self, bq):
+        bq.categorical_keys = True
+        bq.session.nextEvent.side_effect = [
+            _event(blpapi.Event.SUBSCRIPTION_DATA, [_tick(1, BID=1.0)])
+        ]
+        batch = next(bq.subscribe(["A"], ["BID"], max_ticks=1))
+        assert batch["security"].dtype == pl.Categorical
+        assert batch["security"].to_list() == ["A"]
@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import polars as pl
 import pytest
@@ -39,3 +39,38 @@ def test_save_debug_case_writes_file(tmp_path, monkeypatch):
     debug_dir = tmp_path / "debug_cases"
     saved = list(debug_dir.glob("bql_parse_results_*.json"))
     assert len(saved) == 1
+
+
+def test_split_datetime_range_windows_share_boundaries():
+    windows = BQuery._split_datetime_range(
+        datetime(2024, 1, 1), datetime(2024, 1, 3, 12), timedelta(days=1)
+    )
+    assert windows == [
+        (datetime(2024, 1, 1), datetime(2024, 1, 2)),
+        (datetime(2024, 1, 2), datetime(2024, 1, 3)),
+        (datetime(2024, 1, 3), datetime(2024, 1, 3, 12)),
+    ]
+
+
+def test_split_datetime_range_short_range_is_single_window():
+    start = datetime(2024, 1, 1, 9, tzinfo=UTC)
+    end = datetime(2024, 1, 1, 17, tzinfo=UTC)
+    assert BQuery._split_datetime_range(start, end, timedelta(days=1)) == [
+        (start, end)
+    ]
+
+
+def test_split_datetime_range_unsplittable_inputs():
+    step = timedelta(hours=1)
+    naive = datetime(2024, 1, 1)
+    aware = datetime(2024, 1, 2, tzinfo=UTC)
+    assert BQuery._split_datetime_range("2024-01-01T00:00:00", naive, step) == [
+        ("2024-01-01T00:00:00", naive)
+    ]
+    assert BQuery._split_datetime_range(naive, aware, step) == [(naive, aware)]
+
+
+@pytest.mark.parametrize("step", [timedelta(0), timedelta(hours=-1)])
+def test_split_datetime_range_rejects_non_positive_step(step):
+    with pytest.raises(ValueError, match="must be positive"):
+        BQuery._split_datetime_range(datetime(2024, 1, 1), datetime(2024, 1, 2), step)